@@ -1,2 +1,47 @@
+import importlib
+
 DOI_REGEX = r"^10\.\d{4,9}(\.\d+)*\/[A-Za-z0-9\-._;()/:]+$"
 PAGES_REGEX = r'^\d+-\d+$'
+
+# Submodules and their models are imported on first attribute access (PEP 562), so that
+# `import article_models` does not build every pydantic model up front.
+_LAZY_ATTRIBUTES = {
+    'Author': 'article_nosql_models',
+    'Image': 'article_nosql_models',
+    'Table': 'article_nosql_models',
+    'ArticleTextDBSchema': 'article_nosql_models',
+    'LazyArticleTextDBSchema': 'article_nosql_models',
+    'ArticleMetadataDBSchema': 'article_sql_models',
+    'ArticlePDFDBSchema': 'article_sql_models',
+    'ArticlePDFFile': 'schemas',
+    'ArticleMetadata': 'schemas',
+    'ResponseSchema': 'schemas',
+    'StatusEnum': 'schemas',
+    'RawJSON': 'schemas',
+    'ArticleAnalyserApiBaseException': 'errors',
+    'ModelValidationException': 'errors',
+    'setup_logger': 'logger_config',
+}
+_SUBMODULES = (
+    'article_nosql_models', 'article_sql_models', 'binary', 'bulk_validation', 'columnar', 'compact', 'converters',
+    'errors', 'field_types', 'frozen_models', 'fulltext', 'instrumentation', 'logger_config', 'markdown_sections',
+    'parallel_validation', 'pdf_async', 'pdf_payload', 'pdf_store', 'projection', 'schemas', 'store', 'streaming',
+    'validation_cache',
+)
+
+__all__ = ['DOI_REGEX', 'PAGES_REGEX', *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_SUBMODULES})
@@ -1,25 +1,41 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Set
-from . import DOI_REGEX
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, ValidationInfo, field_validator, model_validator
+from typing import Annotated, Any, Dict, Iterable, List, Set, Type
+from .field_types import DOI
+from .markdown_sections import SectionCache, SectionTree
+from .projection import project_model
 
 
 class Author(BaseModel):
     name: str = Field(..., min_length=1)
     surname: str = Field(..., min_length=1)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Image(BaseModel):
     image_number: str = Field(..., min_length=1)
     file_path: str = Field(..., min_length=1)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Table(BaseModel):
     table_number: str = Field(..., min_length=1)
     file_path: str = Field(..., min_length=1)
 
+    model_config = ConfigDict(defer_build=True)
+
+
+def _copy_with_own_sections(model: BaseModel) -> BaseModel:
+    # model_copy copies private attributes shallowly; a copy whose text changes must not share the section cache.
+    copied = BaseModel.__copy__(model)
+    copied._sections = SectionCache()
+    return copied
+
 
 class ArticleTextDBSchema(BaseModel):
-    id: str = Field(..., pattern=DOI_REGEX, description='Valid DOI format')
+    id: DOI = Field(..., description='Valid DOI format')
     title: str = Field(..., min_length=1, description='Title of the article')
     authors: List[Author] = Field(..., min_length=1, description='At least one author required')
     abstract: str = Field(..., min_length=1, description='Abstract of the article')
@@ -27,11 +43,89 @@ class ArticleTextDBSchema(BaseModel):
     markdown_full_text: str = Field(..., min_length=1, description='Full article text in Markdown format')
     images: List[Image] = []
     tables: List[Table] = []
+    _sections: SectionCache = PrivateAttr(default_factory=SectionCache)
+
+    # Core schemas are built on first use, so importing the module stays cheap for workers that never validate.
+    model_config = ConfigDict(defer_build=True)
+
+    __copy__ = _copy_with_own_sections
+
+    @property
+    def sections(self) -> SectionTree:
+        """Section tree of markdown_full_text, parsed on first access and updated incrementally after edits."""
+        return self._sections.get(self.markdown_full_text, self.images, self.tables)
 
     @field_validator('keywords', mode='before')
     @classmethod
-    def validate_keywords(cls, value):
-        """Ensure keywords are a set, not a list."""
+    def validate_keywords(cls, value, info: ValidationInfo):
+        """Ensure keywords are a set, not a list. JSON has no set type, so arrays are accepted there."""
+        if info.mode == 'json':
+            return value
         if not isinstance(value, set):
             raise ValueError('Keywords must be a set, not a list')
         return value
+
+    @classmethod
+    def project(cls, fields: Iterable[str]) -> Type[BaseModel]:
+        """Model with only the given fields, e.g. for list endpoints that skip the full text."""
+        return project_model(cls, fields)
+
+
+HEAVY_FIELDS = ('markdown_full_text', 'images', 'tables')
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _heavy_field_adapter(name: str) -> TypeAdapter:
+    field = ArticleTextDBSchema.model_fields[name]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+class LazyArticleTextDBSchema(
+        ArticleTextDBSchema.project(name for name in ArticleTextDBSchema.model_fields if name not in HEAVY_FIELDS)):
+    """ArticleTextDBSchema whose heavy fields are kept raw, or as loader callables, and validated on first access."""
+    _heavy: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _loaded: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _sections: SectionCache = PrivateAttr(default_factory=SectionCache)
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def keep_heavy_fields_raw(cls, values, handler):
+        instance = handler(values)
+        if isinstance(values, dict):
+            instance._heavy = {name: values[name] for name in HEAVY_FIELDS if name in values}
+        return instance
+
+    def _load(self, name: str):
+        if name not in self._loaded:
+            raw = self._heavy.get(name, _MISSING)
+            if raw is _MISSING:
+                field = ArticleTextDBSchema.model_fields[name]
+                if field.is_required():
+                    raise ValueError(f'{name} of {self.id} was not provided')
+                raw = field.get_default(call_default_factory=True)
+            elif callable(raw):
+                raw = raw()
+            self._loaded[name] = _heavy_field_adapter(name).validate_python(raw)
+            # Dropped only once validated, so a failed load raises again instead of falling back to the default.
+            self._heavy.pop(name, None)
+        return self._loaded[name]
+
+    @property
+    def markdown_full_text(self) -> str:
+        return self._load('markdown_full_text')
+
+    @property
+    def images(self) -> List[Image]:
+        return self._load('images')
+
+    @property
+    def tables(self) -> List[Table]:
+        return self._load('tables')
+
+    __copy__ = _copy_with_own_sections
+    sections = ArticleTextDBSchema.sections
+
+    def to_full(self) -> ArticleTextDBSchema:
+        """Load every heavy field and return a regular ArticleTextDBSchema without re-validating."""
+        return ArticleTextDBSchema.model_construct(**dict(self), **{name: self._load(name) for name in HEAVY_FIELDS})
@@ -0,0 +1,462 @@
+"""Compact, schema-checked binary encoding of the article models (a msgpack body behind a small header).
+
+The codec is pure Python and trades CPU for size: payloads are 2-3x smaller than JSON before compression, but
+encoding and decoding are several times slower than pydantic-core's model_dump_json/model_validate_json, and
+trusted=True does not change that (benchmarks/bench_binary.py). Use it where bytes stored or sent matter more
+than CPU time; when speed matters, use pydantic-core JSON, compressed if size matters too.
+"""
+import hashlib
+import io
+import lzma
+import mmap
+import os
+import struct
+import zlib
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Annotated, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, TypeVar, Union, \
+    get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+from .converters import construct_trusted
+from .pdf_payload import pdf_source_view
+from .schemas import RawJSON
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+MAGIC = b'AMB'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('>3sBB8s')
+COMPRESSION_IDS = {None: 0, 'zlib': 1, 'lzma': 2, 'zstd': 3}
+_MANY_FLAG = 0x80
+SET_EXT_TYPE = 1
+
+_U8, _U16, _U32, _U64 = struct.Struct('>B'), struct.Struct('>H'), struct.Struct('>I'), struct.Struct('>Q')
+_I8, _I16, _I32, _I64 = struct.Struct('>b'), struct.Struct('>h'), struct.Struct('>i'), struct.Struct('>q')
+_F32, _F64 = struct.Struct('>f'), struct.Struct('>d')
+
+
+def _write_length(out: bytearray, length: int, fix_tag: int, fix_limit: int, tags: Tuple[int, int, int]) -> None:
+    if length < fix_limit:
+        out.append(fix_tag | length)
+    elif length < 0x100 and tags[0]:
+        out.append(tags[0])
+        out.append(length)
+    elif length < 0x10000:
+        out.append(tags[1])
+        out += _U16.pack(length)
+    else:
+        out.append(tags[2])
+        out += _U32.pack(length)
+
+
+def _write_str(value: str, out: bytearray) -> None:
+    data = value.encode()
+    if len(data) < 32:
+        out.append(0xa0 | len(data))
+    else:
+        _write_length(out, len(data), 0xa0, 32, (0xd9, 0xda, 0xdb))
+    out += data
+
+
+def _write_bin(value, out: bytearray) -> None:
+    _write_length(out, len(value), 0, 0, (0xc4, 0xc5, 0xc6))
+    out += value
+
+
+def _write_array_header(length: int, out: bytearray) -> None:
+    _write_length(out, length, 0x90, 16, (0, 0xdc, 0xdd))
+
+
+def _write_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif value >= 0:
+        for tag, packer in ((0xcc, _U8), (0xcd, _U16), (0xce, _U32), (0xcf, _U64)):
+            if value < 1 << packer.size * 8:
+                out.append(tag)
+                out += packer.pack(value)
+                return
+        raise ValueError(f'Integer {value} does not fit in 64 bits')
+    else:
+        for tag, packer in ((0xd0, _I8), (0xd1, _I16), (0xd2, _I32), (0xd3, _I64)):
+            if value >= -(1 << packer.size * 8 - 1):
+                out.append(tag)
+                out += packer.pack(value)
+                return
+        raise ValueError(f'Integer {value} does not fit in 64 bits')
+
+
+def _write_any(value: Any, out: bytearray) -> None:
+    """Encode a value whose type the model does not pin down, as a self-describing msgpack value."""
+    if value is None:
+        out.append(0xc0)
+    elif value is True or value is False:
+        out.append(0xc3 if value else 0xc2)
+    elif isinstance(value, Enum):
+        _write_any(value.value, out)
+    elif isinstance(value, str):
+        _write_str(value, out)
+    elif isinstance(value, int):
+        _write_int(value, out)
+    elif isinstance(value, float):
+        out.append(0xcb)
+        out += _F64.pack(value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        _write_bin(value, out)
+    elif isinstance(value, (list, tuple)):
+        _write_array_header(len(value), out)
+        for item in value:
+            _write_any(item, out)
+    elif isinstance(value, (set, frozenset)):
+        items = bytearray()
+        _write_array_header(len(value), items)
+        for item in value:
+            _write_any(item, items)
+        _write_length(out, len(items), 0, 0, (0xc7, 0xc8, 0xc9))
+        out.append(SET_EXT_TYPE)
+        out += items
+    elif isinstance(value, dict):
+        _write_length(out, len(value), 0x80, 16, (0, 0xde, 0xdf))
+        for key, item in value.items():
+            _write_any(key, out)
+            _write_any(item, out)
+    elif isinstance(value, BaseModel):
+        _write_any(value.model_dump(), out)
+    elif isinstance(value, RawJSON):
+        _write_any(from_json(value.value), out)
+    elif isinstance(value, (io.BytesIO, mmap.mmap, os.PathLike, io.IOBase)):
+        with pdf_source_view(value) as view:
+            _write_bin(view, out)
+    else:
+        raise TypeError(f'Cannot encode {type(value).__name__} values')
+
+
+def _read(data: bytes, pos: int) -> Tuple[Any, int]:
+    """Decode the msgpack value at pos, returning it with the position after it."""
+    tag = data[pos]
+    pos += 1
+    if tag < 0x80:
+        return tag, pos
+    if 0xa0 <= tag <= 0xbf:
+        end = pos + (tag & 0x1f)
+        return data[pos:end].decode(), end
+    if 0x90 <= tag <= 0x9f:
+        return _read_array(data, pos, tag & 0x0f)
+    if tag >= 0xe0:
+        return tag - 0x100, pos
+    if 0x80 <= tag <= 0x8f:
+        return _read_map(data, pos, tag & 0x0f)
+    if tag == 0xc0:
+        return None, pos
+    if tag == 0xc2 or tag == 0xc3:
+        return tag == 0xc3, pos
+    reader = _READERS.get(tag)
+    if reader is None:
+        raise ValueError(f'Unsupported type byte 0x{tag:02x} at position {pos - 1}')
+    return reader(data, pos)
+
+
+def _read_array(data: bytes, pos: int, length: int) -> Tuple[list, int]:
+    items = []
+    append = items.append
+    for _ in range(length):
+        # Short strings and small integers inline, they are most of the values.
+        tag = data[pos]
+        if 0xa0 <= tag <= 0xbf:
+            end = pos + 1 + (tag & 0x1f)
+            append(data[pos + 1:end].decode())
+            pos = end
+        elif tag < 0x80:
+            append(tag)
+            pos += 1
+        else:
+            item, pos = _read(data, pos)
+            append(item)
+    return items, pos
+
+
+def _read_map(data: bytes, pos: int, length: int) -> Tuple[dict, int]:
+    result = {}
+    for _ in range(length):
+        key, pos = _read(data, pos)
+        result[key], pos = _read(data, pos)
+    return result, pos
+
+
+def _sized(packer: struct.Struct, read: Callable[[bytes, int, int], Tuple[Any, int]]):
+    def reader(data: bytes, pos: int) -> Tuple[Any, int]:
+        return read(data, pos + packer.size, packer.unpack_from(data, pos)[0])
+    return reader
+
+
+def _number(packer: struct.Struct):
+    def reader(data: bytes, pos: int) -> Tuple[Any, int]:
+        return packer.unpack_from(data, pos)[0], pos + packer.size
+    return reader
+
+
+def _read_str(data: bytes, pos: int, length: int) -> Tuple[str, int]:
+    return data[pos:pos + length].decode(), pos + length
+
+
+def _read_bin(data: bytes, pos: int, length: int) -> Tuple[memoryview, int]:
+    # A view of the payload: large PDFs are not copied again.
+    return memoryview(data)[pos:pos + length], pos + length
+
+
+def _read_ext(data: bytes, pos: int, length: int) -> Tuple[Any, int]:
+    end = pos + 1 + length
+    if data[pos] != SET_EXT_TYPE:
+        raise ValueError(f'Unsupported extension type {data[pos]}')
+    items, _ = _read(data, pos + 1)
+    return set(items), end
+
+
+_READERS: Dict[int, Callable[[bytes, int], Tuple[Any, int]]] = {
+    0xc4: _sized(_U8, _read_bin), 0xc5: _sized(_U16, _read_bin), 0xc6: _sized(_U32, _read_bin),
+    0xc7: _sized(_U8, _read_ext), 0xc8: _sized(_U16, _read_ext), 0xc9: _sized(_U32, _read_ext),
+    0xca: _number(_F32), 0xcb: _number(_F64),
+    0xcc: _number(_U8), 0xcd: _number(_U16), 0xce: _number(_U32), 0xcf: _number(_U64),
+    0xd0: _number(_I8), 0xd1: _number(_I16), 0xd2: _number(_I32), 0xd3: _number(_I64),
+    0xd4: lambda data, pos: _read_ext(data, pos, 1), 0xd5: lambda data, pos: _read_ext(data, pos, 2),
+    0xd6: lambda data, pos: _read_ext(data, pos, 4), 0xd7: lambda data, pos: _read_ext(data, pos, 8),
+    0xd8: lambda data, pos: _read_ext(data, pos, 16),
+    0xd9: _sized(_U8, _read_str), 0xda: _sized(_U16, _read_str), 0xdb: _sized(_U32, _read_str),
+    0xdc: _sized(_U16, _read_array), 0xdd: _sized(_U32, _read_array),
+    0xde: _sized(_U16, _read_map), 0xdf: _sized(_U32, _read_map),
+}
+
+
+Encoder = Callable[[Any, bytearray], None]
+Converter = Optional[Callable[[Any], Any]]
+
+
+class _Plan(NamedTuple):
+    layout: str  # stable description of the encoded layout, hashed into the schema fingerprint
+    encode: Encoder
+    validated: Converter  # decoded msgpack value -> input for model_validate; None means unchanged
+    trusted: Converter  # decoded msgpack value -> field value as validation would produce it
+
+
+_ANY_PLAN = _Plan('any', _write_any, None, None)
+_SCALAR_LAYOUTS = {str: 'str', int: 'int', float: 'float', bool: 'bool'}
+_SCALAR_ENCODERS: Dict[type, Encoder] = {str: _write_str, int: _write_int}
+_CONTAINERS = {list: list, set: set, frozenset: frozenset, tuple: tuple}
+
+
+def _plan(annotation: Any) -> _Plan:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _plan(get_args(annotation)[0])
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_plan(annotation)
+    if annotation is bytes:
+        return _Plan('bytes', _write_any, bytes, bytes)
+    if annotation in _SCALAR_LAYOUTS:
+        return _Plan(_SCALAR_LAYOUTS[annotation], _SCALAR_ENCODERS.get(annotation, _write_any), None, None)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _Plan(f'enum[{annotation.__name__}]', _write_any, None, annotation)
+    if origin is Union:
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if len(arguments) == 1 and len(get_args(annotation)) == 2:
+            return _nullable_plan(_plan(arguments[0]))
+        return _untyped_plan(annotation)
+    container = _CONTAINERS.get(origin)
+    arguments = get_args(annotation)
+    if container is not None and arguments and (container is not tuple or arguments[1:] == (Ellipsis,)):
+        return _array_plan(container, _plan(arguments[0]))
+    return _untyped_plan(annotation)
+
+
+def _untyped_plan(annotation: Any) -> _Plan:
+    """Self-describing values; in trusted mode pydantic-core converts them to the field type (models in unions)."""
+    if annotation is Any:
+        return _ANY_PLAN
+    adapter = None
+
+    def trusted(value):
+        nonlocal adapter
+        if adapter is None:
+            adapter = TypeAdapter(annotation)
+        return adapter.validate_python(value)
+
+    return _Plan('any', _write_any, None, trusted)
+
+
+def _nullable_plan(inner: _Plan) -> _Plan:
+    def encode(value, out):
+        if value is None:
+            out.append(0xc0)
+        else:
+            inner.encode(value, out)
+
+    def nullable(convert: Converter) -> Converter:
+        return convert and (lambda value: None if value is None else convert(value))
+
+    return _Plan(f'optional[{inner.layout}]', encode, nullable(inner.validated), nullable(inner.trusted))
+
+
+def _array_plan(container: type, item: _Plan) -> _Plan:
+    item_encode = item.encode
+
+    def encode(values, out):
+        _write_array_header(len(values), out)
+        for value in values:
+            item_encode(value, out)
+
+    def converter(convert: Converter) -> Converter:
+        if convert is None:
+            return None if container is list else container
+        return lambda values: container(map(convert, values))
+
+    return _Plan(f'array[{item.layout}]', encode, converter(item.validated), converter(item.trusted))
+
+
+@lru_cache(maxsize=None)
+def _model_plan(model: Type[BaseModel]) -> _Plan:
+    names = tuple(model.model_fields)
+    plans = [_plan(field.annotation) for field in model.model_fields.values()]
+    getter = attrgetter(*names) if len(names) > 1 else (lambda instance: (getattr(instance, names[0]),))
+    encoders = [plan.encode for plan in plans]
+    count = len(names)
+
+    def encode(instance, out):
+        _write_array_header(count, out)
+        for field_encode, value in zip(encoders, getter(instance)):
+            field_encode(value, out)
+
+    def converter(converters: List[Converter], build: Callable[[Dict[str, Any]], Any]) -> Converter:
+        conversions = [(name, convert) for name, convert in zip(names, converters) if convert is not None]
+
+        def convert(values):
+            if len(values) != count:
+                raise ValueError(f'Expected {count} fields for {model.__name__}, got {len(values)}')
+            fields = dict(zip(names, values))
+            for name, field_convert in conversions:
+                fields[name] = field_convert(fields[name])
+            return build(fields)
+        return convert
+
+    layout = '{' + ','.join(f'{name}:{plan.layout}' for name, plan in zip(names, plans)) + '}'
+    return _Plan(layout, encode, converter([plan.validated for plan in plans], dict),
+                 converter([plan.trusted for plan in plans], lambda values: construct_trusted(model, values)))
+
+
+def schema_fingerprint(model: Type[BaseModel]) -> bytes:
+    """8-byte digest of the encoded field layout; equal for models with the same fields, like frozen variants."""
+    return hashlib.blake2b(_model_plan(model).layout.encode(), digest_size=8).digest()
+
+
+def _compress(body: bytes, compression: Optional[str], level: Optional[int]) -> bytes:
+    if compression is None:
+        return body
+    if compression == 'zlib':
+        return zlib.compress(body, 1 if level is None else level)
+    if compression == 'lzma':
+        return lzma.compress(body, preset=0 if level is None else level)
+    if compression == 'zstd' and zstd is not None:
+        return zstd.compress(body, level=level)
+    raise ValueError(f'Unsupported compression {compression}, expected one of {available_compressions()}')
+
+
+def _decompress(body: memoryview, compression_id: int) -> bytes:
+    if compression_id == 1:
+        return zlib.decompress(body)
+    if compression_id == 2:
+        return lzma.decompress(body)
+    if compression_id == 3 and zstd is not None:
+        return zstd.decompress(body)
+    raise ValueError(f'Unsupported compression id {compression_id}')
+
+
+def available_compressions() -> Tuple[Optional[str], ...]:
+    return tuple(name for name in COMPRESSION_IDS if name != 'zstd' or zstd is not None)
+
+
+def _encode(model: Type[BaseModel], body: bytearray, many: bool, compression: Optional[str],
+            level: Optional[int]) -> bytes:
+    flags = COMPRESSION_IDS.get(compression, 0) | (_MANY_FLAG if many else 0)
+    return HEADER.pack(MAGIC, FORMAT_VERSION, flags, schema_fingerprint(model)) + _compress(body, compression, level)
+
+
+def dumps(instance: BaseModel, compression: Optional[str] = None, level: Optional[int] = None) -> bytes:
+    """Encode a model as a header followed by a msgpack array of its field values, in field order.
+
+    The header holds a magic, the format version, flags (compression, single or many) and the schema
+    fingerprint of the model, which loads() checks. Sets are encoded as arrays, nested models as arrays too;
+    values of fields typed Any or with unions are self-describing msgpack values.
+    """
+    body = bytearray()
+    _model_plan(type(instance)).encode(instance, body)
+    return _encode(type(instance), body, False, compression, level)
+
+
+def dumps_many(instances: Iterable[BaseModel], model: Optional[Type[BaseModel]] = None,
+               compression: Optional[str] = None, level: Optional[int] = None) -> bytes:
+    """Encode models of one type as a single msgpack array, sharing one header."""
+    instances = list(instances)
+    model = model or (type(instances[0]) if instances else None)
+    if model is None:
+        raise ValueError('model is required to encode an empty batch')
+    encode = _model_plan(model).encode
+    body = bytearray()
+    _write_array_header(len(instances), body)
+    for instance in instances:
+        encode(instance, body)
+    return _encode(model, body, True, compression, level)
+
+
+def _decode(model: Type[BaseModel], data: bytes, many: bool) -> Any:
+    if len(data) < HEADER.size:
+        raise ValueError('Payload is too short for an article models binary header')
+    magic, version, flags, fingerprint = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Payload is not in the article models binary format')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported binary format version {version}, expected {FORMAT_VERSION}')
+    if fingerprint != schema_fingerprint(model):
+        raise ValueError(f'Payload was encoded with a different schema than {model.__name__}')
+    if bool(flags & _MANY_FLAG) != many:
+        raise ValueError('Use loads_many for batches and loads for single models')
+    if flags & 0x03:
+        body, start = _decompress(memoryview(data)[HEADER.size:], flags & 0x03), 0
+    else:
+        body, start = (data if isinstance(data, bytes) else bytes(data)), HEADER.size
+    try:
+        value, end = _read(body, start)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f'Truncated or corrupted payload: {e}') from e
+    if end > len(body):
+        raise ValueError('Truncated or corrupted payload')
+    if end != len(body):
+        raise ValueError(f'{len(body) - end} unexpected bytes after the payload')
+    return value
+
+
+def loads(model: Type[ModelT], data: bytes, trusted: bool = False) -> ModelT:
+    """Decode dumps() output into a validated model, or, with trusted=True, construct it without validation."""
+    plan = _model_plan(model)
+    values = _decode(model, data, many=False)
+    if trusted:
+        return plan.trusted(values)
+    return model.model_validate(plan.validated(values))
+
+
+def loads_many(model: Type[ModelT], data: bytes, trusted: bool = False) -> List[ModelT]:
+    plan = _model_plan(model)
+    rows = _decode(model, data, many=True)
+    if trusted:
+        return list(map(plan.trusted, rows))
+    validate = model.model_validate
+    return [validate(plan.validated(values)) for values in rows]
@@ -0,0 +1,91 @@
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, NamedTuple, Optional, Sequence, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, WrapValidator
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class BulkValidationResult(NamedTuple):
+    valid: List[BaseModel]
+    errors: Dict[int, List[Dict[str, Any]]]
+
+
+class _RowFailure:
+    __slots__ = ('exc',)
+
+    def __init__(self, exc: ValidationError):
+        self.exc = exc
+
+
+def _capture_row_failure(value, handler):
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _RowFailure(e)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def _tolerant_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[Annotated[model, WrapValidator(_capture_row_failure)]])
+
+
+def _compact(error: Dict[str, Any], loc: tuple) -> Dict[str, Any]:
+    return {'loc': loc, 'type': error['type'], 'msg': error['msg']}
+
+
+def compact_errors(exc: ValidationError, offset: int = 0) -> Dict[int, List[Dict[str, Any]]]:
+    """Group errors of a list validation by row index (shifted by offset), dropping the index from loc."""
+    report: Dict[int, List[Dict[str, Any]]] = {}
+    for error in exc.errors(include_url=False, include_context=False, include_input=False):
+        loc = error['loc']
+        report.setdefault(offset + loc[0], []).append(_compact(error, loc[1:]))
+    return report
+
+
+def compact_row_errors(exc: ValidationError) -> List[Dict[str, Any]]:
+    """Compact errors of a single row validation."""
+    return [_compact(error, error['loc'])
+            for error in exc.errors(include_url=False, include_context=False, include_input=False)]
+
+
+def validate_many(model: Type[BaseModel], rows: Sequence[Any],
+                  chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE) -> BulkValidationResult:
+    """Validate rows chunk by chunk with one pydantic-core call per chunk, collecting errors by row index.
+
+    Clean chunks go through a plain list adapter. Once a chunk fails, following chunks use an adapter that
+    captures row failures in place (one pass, slightly slower per row) until a chunk comes back clean again.
+    """
+    adapter = _list_adapter(model)
+    tolerant_adapter = _tolerant_list_adapter(model)
+    chunk_size = chunk_size or len(rows) or 1
+    valid: List[BaseModel] = []
+    errors: Dict[int, List[Dict[str, Any]]] = {}
+    dirty = False
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        if not dirty:
+            try:
+                valid.extend(adapter.validate_python(chunk))
+                continue
+            except ValidationError as e:
+                dirty = True
+                chunk_errors = compact_errors(e, offset=start)
+                errors.update(chunk_errors)
+                # Every remaining row is known to be valid, so this pass cannot fail.
+                valid.extend(adapter.validate_python(
+                    [row for index, row in enumerate(chunk, start) if index not in chunk_errors]))
+                continue
+        dirty = False
+        for index, item in enumerate(tolerant_adapter.validate_python(chunk), start):
+            if isinstance(item, _RowFailure):
+                dirty = True
+                errors[index] = compact_row_errors(item.exc)
+            else:
+                valid.append(item)
+    return BulkValidationResult(valid=valid, errors=errors)
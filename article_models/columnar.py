@@ -0,0 +1,191 @@
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from . import PAGES_REGEX
+from .article_sql_models import ArticleMetadataDBSchema
+from .converters import construct_trusted
+from .field_types import normalize_doi
+
+PAGES_PATTERN = re.compile(PAGES_REGEX)
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+SORT_COLUMNS = ('id', 'title', 'journal', 'year', 'volume')
+
+
+def _bad_indices(values: Iterable, is_valid) -> List[int]:
+    return [index for index, value in enumerate(values) if not is_valid(value)]
+
+
+def _valid_doi(value) -> bool:
+    try:
+        normalize_doi(value)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def _non_empty_str(value) -> bool:
+    return isinstance(value, str) and len(value) > 0
+
+
+def _is_int(value) -> bool:
+    # Columns are array('q'): larger integers would raise OverflowError when the batch is built.
+    return isinstance(value, int) and not isinstance(value, bool) and INT64_MIN <= value <= INT64_MAX
+
+
+def _non_negative_int(value) -> bool:
+    return _is_int(value) and value >= 0
+
+
+def _optional_int(value) -> bool:
+    return value is None or _is_int(value)
+
+
+def _valid_pages(value) -> bool:
+    # fullmatch: with match, '$' also accepts a trailing newline, which the model rejects.
+    return (isinstance(value, str) and PAGES_PATTERN.fullmatch(value) is not None
+            and all(_is_int(int(page)) for page in value.split('-')))
+
+
+class ArticleMetadataBatch:
+    """Column-wise store of ArticleMetadataDBSchema records.
+
+    Integers live in array('q') columns; pages are split into start/end columns and issue has a presence mask,
+    so filters and sorts on year or journal work on columns without building per-row objects.
+    """
+
+    def __init__(self, ids: List[str], titles: List[str], authors: List[str], journals: List[str],
+                 years: array, volumes: array, issues: array, issue_mask: bytearray,
+                 pages_start: array, pages_end: array, keywords: List[str]):
+        self.ids = ids
+        self.titles = titles
+        self.authors = authors
+        self.journals = journals
+        self.years = years
+        self.volumes = volumes
+        self.issues = issues
+        self.issue_mask = issue_mask
+        self.pages_start = pages_start
+        self.pages_end = pages_end
+        self.keywords = keywords
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[ArticleMetadataDBSchema]) -> 'ArticleMetadataBatch':
+        """Build from already validated records; integers and pages must fit in 64-bit columns."""
+        rows = list(rows)
+        bad = [index for index, row in enumerate(rows)
+               if not (_is_int(row.year) and _is_int(row.volume) and _optional_int(row.issue)
+                       and _valid_pages(row.pages))]
+        if bad:
+            raise ValueError(f'Values out of the 64-bit column range at row indices: {bad}')
+        pages = [row.pages.split('-') for row in rows]
+        return cls(
+            ids=[row.id for row in rows],
+            titles=[row.title for row in rows],
+            authors=[row.authors for row in rows],
+            journals=[row.journal for row in rows],
+            years=array('q', [row.year for row in rows]),
+            volumes=array('q', [row.volume for row in rows]),
+            issues=array('q', [row.issue or 0 for row in rows]),
+            issue_mask=bytearray(row.issue is not None for row in rows),
+            pages_start=array('q', [int(start) for start, _ in pages]),
+            pages_end=array('q', [int(end) for _, end in pages]),
+            keywords=[row.keywords for row in rows],
+        )
+
+    @classmethod
+    def from_columns(cls, ids: Sequence[str], titles: Sequence[str], authors: Sequence[str],
+                     journals: Sequence[str], years: Sequence[int], volumes: Sequence[int],
+                     issues: Sequence[Optional[int]], pages: Sequence[str],
+                     keywords: Sequence[str]) -> 'ArticleMetadataBatch':
+        """Validate raw columns one column at a time and build a batch; ids are normalized like DOI fields."""
+        columns = {'ids': ids, 'titles': titles, 'authors': authors, 'journals': journals, 'years': years,
+                   'volumes': volumes, 'issues': issues, 'pages': pages, 'keywords': keywords}
+        lengths = {name: len(column) for name, column in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f'Columns have different lengths: {lengths}')
+        errors: Dict[str, List[int]] = {
+            'ids': _bad_indices(ids, _valid_doi),
+            'titles': _bad_indices(titles, _non_empty_str),
+            'authors': _bad_indices(authors, _non_empty_str),
+            'journals': _bad_indices(journals, _non_empty_str),
+            'years': _bad_indices(years, _non_negative_int),
+            'volumes': _bad_indices(volumes, _non_negative_int),
+            'issues': _bad_indices(issues, _optional_int),
+            'pages': _bad_indices(pages, _valid_pages),
+            'keywords': _bad_indices(keywords, _non_empty_str),
+        }
+        errors = {name: indices for name, indices in errors.items() if indices}
+        if errors:
+            raise ValueError(f'Invalid values at row indices: {errors}')
+        split_pages = [value.split('-') for value in pages]
+        return cls(
+            ids=list(map(normalize_doi, ids)),
+            titles=list(titles),
+            authors=list(authors),
+            journals=list(journals),
+            years=array('q', years),
+            volumes=array('q', volumes),
+            issues=array('q', [issue or 0 for issue in issues]),
+            issue_mask=bytearray(issue is not None for issue in issues),
+            pages_start=array('q', [int(start) for start, _ in split_pages]),
+            pages_end=array('q', [int(end) for _, end in split_pages]),
+            keywords=list(keywords),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, index: int) -> ArticleMetadataDBSchema:
+        return construct_trusted(ArticleMetadataDBSchema, {
+            'id': self.ids[index],
+            'title': self.titles[index],
+            'authors': self.authors[index],
+            'journal': self.journals[index],
+            'year': self.years[index],
+            'volume': self.volumes[index],
+            'issue': self.issues[index] if self.issue_mask[index] else None,
+            'pages': f'{self.pages_start[index]}-{self.pages_end[index]}',
+            'keywords': self.keywords[index],
+        })
+
+    def to_rows(self) -> List[ArticleMetadataDBSchema]:
+        """Export row models; page ranges come back without leading zeros."""
+        return [self.row(index) for index in range(len(self))]
+
+    def take(self, indices: Sequence[int]) -> 'ArticleMetadataBatch':
+        """New batch with the rows at the given indices, in that order."""
+        return ArticleMetadataBatch(
+            ids=[self.ids[i] for i in indices],
+            titles=[self.titles[i] for i in indices],
+            authors=[self.authors[i] for i in indices],
+            journals=[self.journals[i] for i in indices],
+            years=array('q', [self.years[i] for i in indices]),
+            volumes=array('q', [self.volumes[i] for i in indices]),
+            issues=array('q', [self.issues[i] for i in indices]),
+            issue_mask=bytearray(self.issue_mask[i] for i in indices),
+            pages_start=array('q', [self.pages_start[i] for i in indices]),
+            pages_end=array('q', [self.pages_end[i] for i in indices]),
+            keywords=[self.keywords[i] for i in indices],
+        )
+
+    def filter(self, year_min: Optional[int] = None, year_max: Optional[int] = None,
+               journal: Optional[str] = None) -> 'ArticleMetadataBatch':
+        indices = range(len(self))
+        if year_min is not None:
+            years = self.years
+            indices = [i for i in indices if years[i] >= year_min]
+        if year_max is not None:
+            years = self.years
+            indices = [i for i in indices if years[i] <= year_max]
+        if journal is not None:
+            journals = self.journals
+            indices = [i for i in indices if journals[i] == journal]
+        return self.take(indices)
+
+    def sort_by(self, column: str, reverse: bool = False) -> 'ArticleMetadataBatch':
+        """Stable sort by one of SORT_COLUMNS."""
+        if column not in SORT_COLUMNS:
+            raise ValueError(f'Cannot sort by {column}, expected one of {SORT_COLUMNS}')
+        values = getattr(self, f'{column}s')
+        return self.take(sorted(range(len(self)), key=values.__getitem__, reverse=reverse))
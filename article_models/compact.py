@@ -0,0 +1,101 @@
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from .article_nosql_models import Author
+from .converters import construct_trusted
+from .schemas import ArticleMetadata
+
+
+class CompactAuthor(NamedTuple):
+    name: str
+    surname: str
+
+
+class InternPool:
+    """Shares equal strings, authors, author tuples and keyword sets between compact records."""
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._authors: Dict[Tuple[str, str], CompactAuthor] = {}
+        self._author_tuples: Dict[Tuple[CompactAuthor, ...], Tuple[CompactAuthor, ...]] = {}
+        self._keyword_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+    def string(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def author(self, name: str, surname: str) -> CompactAuthor:
+        key = (name, surname)
+        author = self._authors.get(key)
+        if author is None:
+            author = self._authors[key] = CompactAuthor(self.string(name), self.string(surname))
+        return author
+
+    def authors(self, authors: Iterable[Author]) -> Tuple[CompactAuthor, ...]:
+        compact = tuple(self.author(author.name, author.surname) for author in authors)
+        return self._author_tuples.setdefault(compact, compact)
+
+    def keywords(self, keywords: Iterable[str]) -> FrozenSet[str]:
+        compact = frozenset(map(self.string, keywords))
+        return self._keyword_sets.setdefault(compact, compact)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class CompactArticleMetadata:
+    """Slotted, immutable-by-convention record holding the same data as ArticleMetadata."""
+    __slots__ = ('id', 'title', 'authors', 'keywords', 'journal', 'year', 'volume', 'issue', 'pages')
+
+    def __init__(self, id: str, title: str, authors: Tuple[CompactAuthor, ...], keywords: FrozenSet[str],
+                 journal: str, year: int, volume: int, issue: Optional[int], pages: str):
+        self.id = id
+        self.title = title
+        self.authors = authors
+        self.keywords = keywords
+        self.journal = journal
+        self.year = year
+        self.volume = volume
+        self.issue = issue
+        self.pages = pages
+
+    @classmethod
+    def from_model(cls, article: ArticleMetadata, pool: InternPool) -> 'CompactArticleMetadata':
+        return cls(article.id, article.title, pool.authors(article.authors), pool.keywords(article.keywords),
+                   pool.string(article.journal), article.year, article.volume, article.issue,
+                   pool.string(article.pages))
+
+    def to_model(self) -> ArticleMetadata:
+        """Expand back to an ArticleMetadata with its own Author instances, without re-validating."""
+        return construct_trusted(ArticleMetadata, {
+            'id': self.id,
+            'title': self.title,
+            'authors': [construct_trusted(Author, author._asdict()) for author in self.authors],
+            'keywords': set(self.keywords),
+            'journal': self.journal,
+            'year': self.year,
+            'volume': self.volume,
+            'issue': self.issue,
+            'pages': self.pages,
+        })
+
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactArticleMetadata):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
+def compact_many(articles: Iterable[ArticleMetadata],
+                 pool: Optional[InternPool] = None) -> List[CompactArticleMetadata]:
+    pool = pool if pool is not None else InternPool()
+    from_model = CompactArticleMetadata.from_model
+    return [from_model(article, pool) for article in articles]
+
+
+def expand_many(records: Iterable[CompactArticleMetadata]) -> List[ArticleMetadata]:
+    return [record.to_model() for record in records]
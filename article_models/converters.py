@@ -0,0 +1,210 @@
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .article_nosql_models import ArticleTextDBSchema, Author
+from .article_sql_models import ArticleMetadataDBSchema
+from .projection import project_model
+from .schemas import ArticleMetadata
+
+SEPARATOR = ', '
+BIBLIOGRAPHIC_FIELDS = ('journal', 'year', 'volume', 'issue', 'pages')
+CONTENT_FIELDS = ('abstract', 'markdown_full_text', 'images', 'tables')
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+def construct_trusted(model: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """Trusted construction: like model_construct for a complete set of fields, without its per-field bookkeeping.
+
+    values must hold every field of model, already validated; the dict becomes the instance __dict__ as is.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(values))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    private = model.__private_attributes__
+    object.__setattr__(instance, '__pydantic_private__',
+                       {name: attribute.get_default() for name, attribute in private.items()} if private else None)
+    return instance
+
+
+def _trusted_constructor(model: Type[ModelT]) -> Callable[[Dict[str, Any]], ModelT]:
+    """construct_trusted for one model, with the model lookups done once for a whole batch."""
+    new, set_attribute, private = model.__new__, object.__setattr__, model.__private_attributes__
+    if private:
+        return lambda values: construct_trusted(model, values)
+
+    def construct(values: Dict[str, Any]) -> ModelT:
+        instance = new(model)
+        set_attribute(instance, '__dict__', values)
+        set_attribute(instance, '__pydantic_fields_set__', set(values))
+        set_attribute(instance, '__pydantic_extra__', None)
+        set_attribute(instance, '__pydantic_private__', None)
+        return instance
+
+    return construct
+
+
+@lru_cache(maxsize=65536)
+def _split_author(value: str) -> Tuple[str, str]:
+    name, _, surname = value.strip().rpartition(' ')
+    name = name.strip()
+    if not name or not surname:
+        raise ValueError(f'Author "{value}" must be given as "name surname"')
+    return name, surname
+
+
+def split_authors(value: str) -> List[Author]:
+    """Parse a comma-separated authors string into Author models; the last word of each entry is the surname."""
+    return [construct_trusted(Author, {'name': name, 'surname': surname})
+            for name, surname in map(_split_author, value.split(','))]
+
+
+def join_authors(authors: Iterable[Author]) -> str:
+    parts = []
+    for author in authors:
+        if ',' in author.name or ',' in author.surname or len(author.surname.split()) != 1:
+            raise ValueError(f'Author "{author.name} {author.surname}" cannot be stored in a comma-separated string')
+        parts.append(f'{author.name} {author.surname}')
+    return SEPARATOR.join(parts)
+
+
+def split_keywords(value: str) -> Set[str]:
+    return {keyword for keyword in map(str.strip, value.split(',')) if keyword}
+
+
+def join_keywords(keywords: Iterable[str]) -> str:
+    """Join keywords in sorted order, so the SQL form of a keyword set is deterministic."""
+    keywords = sorted(keywords)
+    if not keywords:
+        raise ValueError('At least one keyword is required in the comma-separated form')
+    if any(',' in keyword or keyword != keyword.strip() or not keyword for keyword in keywords):
+        raise ValueError(f'Keywords {keywords} cannot be stored in a comma-separated string')
+    return SEPARATOR.join(keywords)
+
+
+def metadata_db_to_api(record: ArticleMetadataDBSchema) -> ArticleMetadata:
+    """Convert an already validated SQL record to ArticleMetadata without re-validating its fields.
+
+    ArticleMetadata -> ArticleMetadataDBSchema -> ArticleMetadata returns an equal model; the other way round
+    returns the canonical SQL form (', ' separators, sorted unique keywords).
+    """
+    return construct_trusted(ArticleMetadata, {
+        'id': record.id,
+        'title': record.title,
+        'authors': split_authors(record.authors),
+        'keywords': split_keywords(record.keywords),
+        'journal': record.journal,
+        'year': record.year,
+        'volume': record.volume,
+        'issue': record.issue,
+        'pages': record.pages,
+    })
+
+
+def metadata_api_to_db(article: ArticleMetadata) -> ArticleMetadataDBSchema:
+    """Convert an already validated ArticleMetadata to its SQL record without re-validating its fields."""
+    return construct_trusted(ArticleMetadataDBSchema, {
+        'id': article.id,
+        'title': article.title,
+        'authors': join_authors(article.authors),
+        'journal': article.journal,
+        'year': article.year,
+        'volume': article.volume,
+        'issue': article.issue,
+        'pages': article.pages,
+        'keywords': join_keywords(article.keywords),
+    })
+
+
+def text_to_metadata(text: ArticleTextDBSchema, **bibliographic: Any) -> ArticleMetadata:
+    """Build ArticleMetadata from an ArticleTextDBSchema; only the bibliographic fields passed in are validated."""
+    extra = project_model(ArticleMetadata, BIBLIOGRAPHIC_FIELDS).model_validate(bibliographic)
+    return construct_trusted(ArticleMetadata, {
+        'id': text.id,
+        'title': text.title,
+        'authors': [author.model_copy() for author in text.authors],
+        'keywords': set(text.keywords),
+        **dict(extra),
+    })
+
+
+def metadata_to_text(article: ArticleMetadata, **content: Any) -> ArticleTextDBSchema:
+    """Build ArticleTextDBSchema from ArticleMetadata; only the content fields passed in are validated."""
+    extra = project_model(ArticleTextDBSchema, CONTENT_FIELDS).model_validate(content)
+    return construct_trusted(ArticleTextDBSchema, {
+        'id': article.id,
+        'title': article.title,
+        'authors': [author.model_copy() for author in article.authors],
+        'abstract': extra.abstract,
+        'keywords': set(article.keywords),
+        'markdown_full_text': extra.markdown_full_text,
+        'images': extra.images,
+        'tables': extra.tables,
+    })
+
+
+def metadata_db_to_api_many(records: Iterable[ArticleMetadataDBSchema]) -> List[ArticleMetadata]:
+    """metadata_db_to_api over a batch, splitting each distinct authors and keywords string once.
+
+    Batches from one query repeat author lists and keyword strings; the parsed forms are shared by the records
+    that repeat them, each article still getting its own Author models and keyword set.
+    """
+    construct_article, construct_author = _trusted_constructor(ArticleMetadata), _trusted_constructor(Author)
+    authors_cache: Dict[str, List[Tuple[str, str]]] = {}
+    keywords_cache: Dict[str, FrozenSet[str]] = {}
+    articles = []
+    for record in records:
+        authors = authors_cache.get(record.authors)
+        if authors is None:
+            authors = authors_cache[record.authors] = list(map(_split_author, record.authors.split(',')))
+        keywords = keywords_cache.get(record.keywords)
+        if keywords is None:
+            keywords = keywords_cache[record.keywords] = frozenset(split_keywords(record.keywords))
+        articles.append(construct_article({
+            'id': record.id,
+            'title': record.title,
+            'authors': [construct_author({'name': name, 'surname': surname}) for name, surname in authors],
+            'keywords': set(keywords),
+            'journal': record.journal,
+            'year': record.year,
+            'volume': record.volume,
+            'issue': record.issue,
+            'pages': record.pages,
+        }))
+    return articles
+
+
+def metadata_api_to_db_many(articles: Iterable[ArticleMetadata]) -> List[ArticleMetadataDBSchema]:
+    """metadata_api_to_db over a batch, joining each distinct author list and keyword set once.
+
+    Records repeating an author list or keyword set share one interned string for it.
+    """
+    construct_record = _trusted_constructor(ArticleMetadataDBSchema)
+    authors_cache: Dict[Tuple[Tuple[str, str], ...], str] = {}
+    keywords_cache: Dict[FrozenSet[str], str] = {}
+    records = []
+    for article in articles:
+        key = tuple((author.name, author.surname) for author in article.authors)
+        authors = authors_cache.get(key)
+        if authors is None:
+            authors = authors_cache[key] = sys.intern(join_authors(article.authors))
+        keywords_key = frozenset(article.keywords)
+        keywords = keywords_cache.get(keywords_key)
+        if keywords is None:
+            keywords = keywords_cache[keywords_key] = sys.intern(join_keywords(keywords_key))
+        records.append(construct_record({
+            'id': article.id,
+            'title': article.title,
+            'authors': authors,
+            'journal': article.journal,
+            'year': article.year,
+            'volume': article.volume,
+            'issue': article.issue,
+            'pages': article.pages,
+            'keywords': keywords,
+        }))
+    return records
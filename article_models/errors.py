@@ -1,4 +1,7 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+from pydantic import ValidationError
 
 SERVICE_CODES = {
     'article_analyser_api': 'AAA',
@@ -11,10 +14,25 @@ SERVICE_CODES = {
 }
 
 ERROR_CODES = {
-    f'{SERVICE_CODES['article_analyser_api']}-0': 'UNDEFINED_ERROR',
-    f'{SERVICE_CODES['article_models_library']}-0': 'UNDEFINED_ERROR',
-    f'{SERVICE_CODES['article_models_library']}-1': 'PYDANTIC_VALIDATION_ERROR'
+    f'{SERVICE_CODES["article_analyser_api"]}-0': 'UNDEFINED_ERROR',
+    f'{SERVICE_CODES["article_models_library"]}-0': 'UNDEFINED_ERROR',
+    f'{SERVICE_CODES["article_models_library"]}-1': 'PYDANTIC_VALIDATION_ERROR'
+}
+
+
+class ErrorDescriptor(NamedTuple):
+    error_code: str
+    error_message: str
+    service_code: str
+
+
+# Built once, shared by every exception carrying the same error code.
+ERROR_DESCRIPTORS: Dict[str, ErrorDescriptor] = {
+    error_code: ErrorDescriptor(error_code=error_code, error_message=error_message,
+                                service_code=error_code.rsplit('-', 1)[0])
+    for error_code, error_message in ERROR_CODES.items()
 }
+UNDEFINED_API_ERROR = ERROR_DESCRIPTORS[f'{SERVICE_CODES["article_analyser_api"]}-0']
 
 
 class ArticleAnalyserApiBaseException(Exception):
@@ -24,18 +42,84 @@ class ArticleAnalyserApiBaseException(Exception):
         self.error_message = error_message
         self.http_status_code = http_status_code
         self.additional_info = additional_info
-        super().__init__(
-            f'{self.error_code}: {self.error_message}\n{self.additional_info}. \nHttp status code {self.http_status_code}')
+        # The message is only formatted in __str__, most exceptions raised in batch jobs are never printed.
+        super().__init__(error_code, error_message)
+
+    def __str__(self):
+        return f'{self.error_code}: {self.error_message}\n{self._details()}. \nHttp status code {self.http_status_code}'
+
+    def _details(self) -> Optional[str]:
+        return self.additional_info
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'error_code': self.error_code,
+            'error_message': self.error_message,
+            'http_status_code': self.http_status_code,
+            'additional_info': self.additional_info,
+        }
 
 
 class ModelValidationException(ArticleAnalyserApiBaseException):
-    def __init__(self, error_code: str, http_status_code: int = 400, additional_info: Optional[str] = ''):
-        if error_code not in ERROR_CODES:
-            raise ArticleAnalyserApiBaseException(error_code=f'{SERVICE_CODES['article_analyser_api']}-0',
-                                                  error_message=ERROR_CODES[
-                                                      f'{SERVICE_CODES['article_analyser_api']}-0'],
+    def __init__(self, error_code: str, http_status_code: int = 400, additional_info: Optional[str] = '',
+                 errors: Optional[List[Dict[str, Any]]] = None):
+        descriptor = ERROR_DESCRIPTORS.get(error_code)
+        if descriptor is None:
+            raise ArticleAnalyserApiBaseException(error_code=UNDEFINED_API_ERROR.error_code,
+                                                  error_message=UNDEFINED_API_ERROR.error_message,
                                                   http_status_code=500,
                                                   additional_info=f'Unknown error_code {error_code}. Error code not in ERROR_CODES in article_models_library')
-        error_message = ERROR_CODES[error_code]
-        super().__init__(error_code=error_code, error_message=error_message, http_status_code=http_status_code,
-                         additional_info=additional_info)
+        super().__init__(descriptor.error_code, descriptor.error_message, http_status_code, additional_info)
+        self.errors = errors
+
+    def _details(self) -> Optional[str]:
+        if self.errors and not self.additional_info:
+            return _describe_errors(self.errors)
+        return self.additional_info
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        if self.errors is not None:
+            result['errors'] = self.errors
+        return result
+
+    @classmethod
+    def from_validation_error(cls, source: 'ValidationErrorSource', http_status_code: int = 400,
+                              additional_info: Optional[str] = '') -> 'ModelValidationException':
+        """AML-1 exception carrying the structured errors of translate_validation_errors(source)."""
+        return cls(PYDANTIC_VALIDATION_ERROR_CODE, http_status_code=http_status_code, additional_info=additional_info,
+                   errors=translate_validation_errors(source))
+
+
+PYDANTIC_VALIDATION_ERROR_CODE = f'{SERVICE_CODES["article_models_library"]}-1'
+
+ValidationErrorSource = Union[ValidationError, Iterable[Mapping[str, Any]], Mapping[int, Iterable[Mapping[str, Any]]]]
+
+
+@lru_cache(maxsize=4096)
+def _field_name(loc: tuple) -> str:
+    return '.'.join(map(str, loc))
+
+
+def _translate_error_list(errors: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    return [{'field': _field_name(tuple(error['loc'])), 'type': error['type'], 'message': error['msg']}
+            for error in errors]
+
+
+def translate_validation_errors(source: ValidationErrorSource) -> List[Dict[str, Any]]:
+    """Turn pydantic validation errors into JSON-ready {'field', 'type', 'message'} dicts.
+
+    The source can be a ValidationError, a list of pydantic error dicts, or a per-row report such as
+    BulkValidationResult.errors, which gives one {'row', 'errors'} entry per row. Field names are cached per
+    location; every call returns new dicts.
+    """
+    if isinstance(source, ValidationError):
+        return _translate_error_list(source.errors(include_url=False, include_context=False, include_input=False))
+    if isinstance(source, Mapping):
+        return [{'row': row, 'errors': _translate_error_list(errors)} for row, errors in source.items()]
+    return _translate_error_list(source)
+
+
+def _describe_errors(errors: List[Dict[str, Any]]) -> str:
+    return '; '.join(f'{error["field"]}: {error["message"]}' if 'field' in error
+                     else f'row {error["row"]}: {_describe_errors(error["errors"])}' for error in errors)
@@ -0,0 +1,57 @@
+import re
+from functools import lru_cache
+from typing import Annotated, NamedTuple, Optional
+
+from pydantic import AfterValidator, Field, WithJsonSchema
+from pydantic_core import PydanticCustomError
+
+from . import DOI_REGEX, PAGES_REGEX
+
+DOI_PATTERN = re.compile(DOI_REGEX)
+DOI_PREFIXES = ('https://doi.org/', 'http://doi.org/', 'https://dx.doi.org/', 'http://dx.doi.org/', 'doi:')
+DEFAULT_DOI_CACHE_SIZE = 8192
+
+
+class DOIParts(NamedTuple):
+    prefix: str
+    suffix: str
+
+
+def _normalize_doi(value: str) -> str:
+    doi = value.strip()
+    # DOI_REGEX is ASCII-only. Checking before lower-casing keeps Unicode case folding ('ß' -> 'ss', Kelvin sign
+    # -> 'k') from rewriting a rejected identifier into a different, valid one; lower() of ASCII only maps A-Z.
+    if doi.isascii():
+        doi = doi.lower()
+        for prefix in DOI_PREFIXES:
+            if doi.startswith(prefix):
+                doi = doi[len(prefix):]
+                break
+        if DOI_PATTERN.match(doi) is not None:
+            return doi
+    raise PydanticCustomError('string_pattern_mismatch', "String should match pattern '{pattern}'",
+                              {'pattern': DOI_REGEX})
+
+
+_cached_normalize_doi = lru_cache(maxsize=DEFAULT_DOI_CACHE_SIZE)(_normalize_doi)
+
+
+def configure_doi_cache(maxsize: Optional[int] = DEFAULT_DOI_CACHE_SIZE) -> None:
+    """Resize the cache of normalized DOIs; 0 disables it, None makes it unbounded."""
+    global _cached_normalize_doi
+    _cached_normalize_doi = lru_cache(maxsize=maxsize)(_normalize_doi) if maxsize != 0 else _normalize_doi
+
+
+def normalize_doi(value: str) -> str:
+    """Lower-case an ASCII DOI, strip doi.org/doi: prefixes and validate it against DOI_REGEX."""
+    return _cached_normalize_doi(value)
+
+
+def parse_doi(value: str) -> DOIParts:
+    """Split a DOI into its registrant prefix and item suffix."""
+    prefix, _, suffix = normalize_doi(value).partition('/')
+    return DOIParts(prefix=prefix, suffix=suffix)
+
+
+DOI = Annotated[str, AfterValidator(normalize_doi), WithJsonSchema({'type': 'string', 'pattern': DOI_REGEX})]
+Pages = Annotated[str, Field(pattern=PAGES_REGEX)]
@@ -0,0 +1,114 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .article_nosql_models import ArticleTextDBSchema, Author, Image, Table
+from .article_sql_models import ArticleMetadataDBSchema
+from .converters import construct_trusted
+from .schemas import ArticleMetadata
+
+FrozenT = TypeVar('FrozenT', bound='FrozenModel')
+
+_FROZEN_VARIANTS: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_MUTABLE_VARIANTS: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    frozen_model = _FROZEN_VARIANTS.get(type(value))
+    if frozen_model is not None:
+        return frozen_model.from_model(value)
+    if isinstance(value, list):
+        return tuple(map(_freeze, value))
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, FrozenModel):
+        return value.to_model()
+    if isinstance(value, tuple):
+        return list(map(_thaw, value))
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+class FrozenModel(BaseModel):
+    """Base of the frozen variants: each one subclasses its mutable model and converts to and from it."""
+    model_config = ConfigDict(frozen=True)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mutable_model = next(base for base in cls.__mro__[1:]
+                             if issubclass(base, BaseModel) and not issubclass(base, FrozenModel))
+        _FROZEN_VARIANTS[mutable_model] = cls
+        _MUTABLE_VARIANTS[cls] = mutable_model
+
+    @classmethod
+    def from_model(cls: Type[FrozenT], model: BaseModel) -> FrozenT:
+        """Freeze an already validated model without re-validating it."""
+        return construct_trusted(cls, {name: _freeze(getattr(model, name)) for name in cls.model_fields})
+
+    def to_model(self) -> BaseModel:
+        """Mutable copy as the original model class."""
+        mutable_model = _MUTABLE_VARIANTS[type(self)]
+        return construct_trusted(mutable_model,
+                                 {name: _thaw(getattr(self, name)) for name in mutable_model.model_fields})
+
+
+class IdentifiedByDOI:
+    """Equality and hash by the DOI id only, so records of the same article deduplicate in sets and dicts."""
+
+    def __eq__(self, other):
+        if not isinstance(other, IdentifiedByDOI):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class FrozenAuthor(FrozenModel, Author):
+    pass
+
+
+class FrozenImage(FrozenModel, Image):
+    pass
+
+
+class FrozenTable(FrozenModel, Table):
+    pass
+
+
+class FrozenArticleTextDBSchema(IdentifiedByDOI, FrozenModel, ArticleTextDBSchema):
+    authors: Tuple[FrozenAuthor, ...] = Field(..., min_length=1, description='At least one author required')
+    keywords: FrozenSet[str]
+    images: Tuple[FrozenImage, ...] = ()
+    tables: Tuple[FrozenTable, ...] = ()
+
+    @field_validator('keywords', mode='before')
+    @classmethod
+    def validate_keywords(cls, value, info):
+        """Ensure keywords are a set or frozenset, not a list. JSON arrays are accepted."""
+        if info.mode != 'json' and not isinstance(value, (set, frozenset)):
+            raise ValueError('Keywords must be a set, not a list')
+        return value
+
+
+class FrozenArticleMetadataDBSchema(IdentifiedByDOI, FrozenModel, ArticleMetadataDBSchema):
+    pass
+
+
+class FrozenArticleMetadata(IdentifiedByDOI, FrozenModel, ArticleMetadata):
+    authors: Tuple[FrozenAuthor, ...] = Field(..., min_length=1, description='At least one author required')
+    keywords: FrozenSet[str]
+
+
+def freeze_many(models: Iterable[BaseModel]) -> List[FrozenModel]:
+    return [_FROZEN_VARIANTS[type(model)].from_model(model) for model in models]
+
+
+def dedupe(records: Iterable[FrozenT]) -> List[FrozenT]:
+    """Drop records whose DOI was already seen, keeping the first one and the input order."""
+    return list(dict.fromkeys(records))
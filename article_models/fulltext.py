@@ -0,0 +1,213 @@
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .article_nosql_models import ArticleTextDBSchema
+
+TOKEN_PATTERN = re.compile(r'\w+')
+TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+MAGIC = b'AMFTIDX1'
+_HEADER_SIZE = struct.Struct('<Q')
+
+# Docs, per-doc start offsets into positions (one more than docs) and positions of one term.
+Postings = Tuple[Sequence[int], Sequence[int], Sequence[int]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens; Markdown markup is dropped with the punctuation."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    """Positional inverted index over article abstracts and full texts with BM25 ranking and phrase queries.
+
+    Postings are kept in array('I') columns per term: the sorted document numbers, the start of each
+    document's positions and the positions themselves. An index written with save() is opened by load()
+    through a read-only memory map, its postings being memoryview slices of the file; documents added after
+    loading copy only the postings of the terms they touch. close() (or a with block) releases the map.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_ids: List[str] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self.doc_lengths: Sequence[int] = array(TYPECODE)
+        self._total_length = 0
+        self._postings: Dict[str, Postings] = {}
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_numbers
+
+    def __enter__(self) -> 'InvertedIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map opened by load(); the index is empty afterwards. No-op for an in-memory index."""
+        if self._mmap is None:
+            return
+        views = [self.doc_lengths, *(column for postings in self._postings.values() for column in postings)]
+        self.doc_ids = []
+        self._doc_numbers = {}
+        self.doc_lengths = array(TYPECODE)
+        self._total_length = 0
+        self._postings = {}
+        # mmap.close raises BufferError while slices of it are exported.
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def add(self, doc_id: str, *texts: str) -> None:
+        """Index the texts of one document; positions of consecutive texts are not adjacent."""
+        if doc_id in self._doc_numbers:
+            raise ValueError(f'Document {doc_id} is already indexed')
+        doc_number = len(self.doc_ids)
+        term_positions: Dict[str, List[int]] = {}
+        position = 0
+        for text in texts:
+            for token in tokenize(text):
+                term_positions.setdefault(token, []).append(position)
+                position += 1
+            position += 1
+        length = position - len(texts)
+
+        self.doc_ids.append(doc_id)
+        self._doc_numbers[doc_id] = doc_number
+        if not isinstance(self.doc_lengths, array):
+            self.doc_lengths = array(TYPECODE, self.doc_lengths)
+        self.doc_lengths.append(length)
+        self._total_length += length
+        for term, positions in term_positions.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = (array(TYPECODE), array(TYPECODE, [0]), array(TYPECODE))
+            elif not isinstance(postings[0], array):
+                postings = tuple(array(TYPECODE, column) for column in postings)
+            docs, offsets, term_positions_column = postings
+            docs.append(doc_number)
+            term_positions_column.extend(positions)
+            offsets.append(len(term_positions_column))
+            self._postings[term] = postings
+
+    def add_article(self, article: ArticleTextDBSchema) -> None:
+        self.add(article.id, article.abstract, article.markdown_full_text)
+
+    def add_articles(self, articles: Iterable[ArticleTextDBSchema]) -> None:
+        for article in articles:
+            self.add_article(article)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Documents matching any query term, as (doc_id, BM25 score) pairs, best first."""
+        doc_count = len(self.doc_ids)
+        if not doc_count:
+            return []
+        average_length = self._total_length / doc_count
+        k1, b, doc_lengths = self.k1, self.b, self.doc_lengths
+        scores: Dict[int, float] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            docs, offsets, _ = postings
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for index, doc_number in enumerate(docs):
+                frequency = offsets[index + 1] - offsets[index]
+                norm = k1 * (1 - b + b * doc_lengths[doc_number] / average_length)
+                scores[doc_number] = scores.get(doc_number, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+        best = nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(self.doc_ids[doc_number], score) for doc_number, score in best]
+
+    def phrase(self, phrase: str) -> List[str]:
+        """Ids of documents containing the words of phrase next to each other, in indexing order."""
+        terms = tokenize(phrase)
+        postings = [self._postings.get(term) for term in terms]
+        if not terms or any(term_postings is None for term_postings in postings):
+            return []
+        shortest = min(postings, key=lambda term_postings: len(term_postings[0]))
+        matches = []
+        for doc_number in shortest[0]:
+            positions = [self._positions(term_postings, doc_number) for term_postings in postings]
+            if any(term_positions is None for term_positions in positions):
+                continue
+            following = [set(term_positions) for term_positions in positions[1:]]
+            if any(all(start + shift in following[shift - 1] for shift in range(1, len(terms)))
+                   for start in positions[0]):
+                matches.append(self.doc_ids[doc_number])
+        return matches
+
+    @staticmethod
+    def _positions(postings: Postings, doc_number: int) -> Optional[Sequence[int]]:
+        docs, offsets, positions = postings
+        index = bisect_left(docs, doc_number)
+        if index == len(docs) or docs[index] != doc_number:
+            return None
+        return positions[offsets[index]:offsets[index + 1]]
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the index to one file: magic, header length, JSON header, then 4-byte aligned uint32 columns."""
+        columns: List[Sequence[int]] = [self.doc_lengths]
+        terms = {}
+        position = len(self.doc_lengths)
+        for term, (docs, offsets, positions) in self._postings.items():
+            terms[term] = [position, len(docs)]
+            columns.extend((docs, offsets, positions))
+            position += len(docs) + len(offsets) + len(positions)
+            terms[term].append(len(positions))
+        header = json.dumps({'byteorder': sys.byteorder, 'k1': self.k1, 'b': self.b, 'doc_ids': self.doc_ids,
+                             'total_length': self._total_length, 'terms': terms},
+                            ensure_ascii=False).encode()
+        padding = -(len(MAGIC) + _HEADER_SIZE.size + len(header)) % 4
+        temporary_path = f'{os.fspath(path)}.tmp'
+        with open(temporary_path, 'wb') as file:
+            file.write(MAGIC)
+            file.write(_HEADER_SIZE.pack(len(header) + padding))
+            file.write(header + b' ' * padding)
+            for column in columns:
+                file.write(column)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> 'InvertedIndex':
+        """Open a saved index through a read-only memory map, without copying its postings."""
+        with open(path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(MAGIC)] != MAGIC:
+            mapped.close()
+            raise ValueError(f'{path} is not an article full-text index')
+        start = len(MAGIC) + _HEADER_SIZE.size
+        (header_size,) = _HEADER_SIZE.unpack_from(mapped, len(MAGIC))
+        header = json.loads(mapped[start:start + header_size])
+        if header['byteorder'] != sys.byteorder:
+            mapped.close()
+            raise ValueError(f'{path} was written on a {header["byteorder"]}-endian machine')
+        values = memoryview(mapped)[start + header_size:].cast(TYPECODE)
+
+        index = cls(k1=header['k1'], b=header['b'])
+        index._mmap = mapped
+        index.doc_ids = header['doc_ids']
+        index._doc_numbers = {doc_id: number for number, doc_id in enumerate(index.doc_ids)}
+        index.doc_lengths = values[:len(index.doc_ids)]
+        index._total_length = header['total_length']
+        for term, (position, doc_count, positions_count) in header['terms'].items():
+            offsets_start = position + doc_count
+            positions_start = offsets_start + doc_count + 1
+            index._postings[term] = (values[position:offsets_start], values[offsets_start:positions_start],
+                                     values[positions_start:positions_start + positions_count])
+        return index
@@ -0,0 +1,203 @@
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+# Upper bounds in seconds of the latency histogram buckets, the last one catches everything slower.
+DEFAULT_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, float('inf'))
+METHODS = {'validate_python': 'python', 'validate_json': 'json', 'validate_strings': 'strings',
+           'validate_assignment': 'assignment'}
+
+
+def error_field(loc: Iterable[Any]) -> str:
+    """Dotted error location with list indices replaced by '*', e.g. 'authors.*.surname', to bound label values."""
+    return '.'.join('*' if isinstance(part, int) else str(part) for part in loc)
+
+
+class MetricsSink(ABC):
+    """Receives one observation per validation of an instrumented model; subclass it to forward metrics elsewhere.
+
+    errors is None for successful validations, otherwise the pydantic error dicts of the ValidationError.
+    """
+
+    @abstractmethod
+    def observe(self, model: str, method: str, seconds: float, errors: Optional[List[Dict[str, Any]]]) -> None:
+        """Record one validation; called on the validating thread, so it must be cheap and thread-safe."""
+
+
+class Histogram:
+    __slots__ = ('bounds', 'counts', 'sum')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total, result = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class InMemorySink(MetricsSink):
+    """Aggregates observations in memory: validation counts by outcome, latency histograms per model and method,
+    and failure counts per model, field and error type."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.validations: Dict[Tuple[str, str, str], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.failures: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, method: str, seconds: float, errors: Optional[List[Dict[str, Any]]]) -> None:
+        key = (model, method, 'success' if errors is None else 'failure')
+        with self._lock:
+            self.validations[key] = self.validations.get(key, 0) + 1
+            histogram = self.latency.get(key[:2])
+            if histogram is None:
+                histogram = self.latency[key[:2]] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            for error in errors or ():
+                failure = (model, error_field(error['loc']), error['type'])
+                self.failures[failure] = self.failures.get(failure, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.validations.clear()
+            self.latency.clear()
+            self.failures.clear()
+
+
+def _label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: str) -> str:
+    return '{' + ','.join(f'{name}="{_label_value(value)}"' for name, value in labels.items()) + '}'
+
+
+def _bound(value: float) -> str:
+    return '+Inf' if value == float('inf') else repr(value)
+
+
+class PrometheusExporter(InMemorySink):
+    """InMemorySink that renders its metrics in the Prometheus text exposition format."""
+
+    def __init__(self, prefix: str = 'article_models', buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(buckets)
+        self.prefix = prefix
+
+    def render(self) -> str:
+        prefix = self.prefix
+        with self._lock:
+            validations = sorted(self.validations.items())
+            latency = sorted((key, histogram.cumulative(), histogram.sum) for key, histogram in self.latency.items())
+            failures = sorted(self.failures.items())
+        lines = [f'# HELP {prefix}_validations_total Validations of article models by outcome.',
+                 f'# TYPE {prefix}_validations_total counter']
+        lines += [f'{prefix}_validations_total{_labels(model=model, method=method, outcome=outcome)} {count}'
+                  for (model, method, outcome), count in validations]
+        lines += [f'# HELP {prefix}_validation_seconds Validation latency of article models.',
+                  f'# TYPE {prefix}_validation_seconds histogram']
+        for (model, method), buckets, total in latency:
+            for bound, count in buckets:
+                lines.append(f'{prefix}_validation_seconds_bucket{_labels(model=model, method=method, le=_bound(bound))}'
+                             f' {count}')
+            lines.append(f'{prefix}_validation_seconds_sum{_labels(model=model, method=method)} {total!r}')
+            lines.append(f'{prefix}_validation_seconds_count{_labels(model=model, method=method)} {buckets[-1][1]}')
+        lines += [f'# HELP {prefix}_validation_errors_total Validation errors of article models by field and type.',
+                  f'# TYPE {prefix}_validation_errors_total counter']
+        lines += [f'{prefix}_validation_errors_total{_labels(model=model, field=field, type=error_type)} {count}'
+                  for (model, field, error_type), count in failures]
+        return '\n'.join(lines) + '\n'
+
+
+class InstrumentedValidator:
+    """Stands in for a model's __pydantic_validator__, timing its validate_* calls and reporting them to a sink."""
+
+    def __init__(self, validator: Any, model_name: str, sink: MetricsSink):
+        self.validator = validator
+        self.model_name = model_name
+        self.sink = sink
+        for name, method in METHODS.items():
+            setattr(self, name, self._timed(getattr(validator, name), method))
+
+    def _timed(self, validate: Callable[..., Any], method: str) -> Callable[..., Any]:
+        model_name, observe = self.model_name, self.sink.observe
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                result = validate(*args, **kwargs)
+            except ValidationError as e:
+                observe(model_name, method, perf_counter() - start,
+                        e.errors(include_url=False, include_context=False, include_input=False))
+                raise
+            observe(model_name, method, perf_counter() - start, None)
+            return result
+        return timed
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.validator, name)
+
+
+def library_models() -> List[Type[BaseModel]]:
+    """Every model of the library, frozen variants included (ResponseSchema only unparametrized)."""
+    from .article_nosql_models import ArticleTextDBSchema, Author, Image, LazyArticleTextDBSchema, Table
+    from .article_sql_models import ArticleMetadataDBSchema, ArticlePDFDBSchema
+    from .frozen_models import (FrozenArticleMetadata, FrozenArticleMetadataDBSchema, FrozenArticleTextDBSchema,
+                                FrozenAuthor, FrozenImage, FrozenTable)
+    from .schemas import ArticleMetadata, ArticlePDFFile, ResponseSchema
+    return [Author, Image, Table, ArticleTextDBSchema, LazyArticleTextDBSchema, ArticleMetadataDBSchema,
+            ArticlePDFDBSchema, ArticlePDFFile, ArticleMetadata, ResponseSchema, FrozenAuthor, FrozenImage, FrozenTable,
+            FrozenArticleTextDBSchema, FrozenArticleMetadataDBSchema, FrozenArticleMetadata]
+
+
+def instrument(sink: MetricsSink, models: Optional[Iterable[Type[BaseModel]]] = None) -> None:
+    """Report every validation of the models (all library models by default) to sink.
+
+    Validation of a model nested in another one is part of the outer model's validation and is not reported on
+    its own; list adapters such as validate_many bypass the models' validators. Instrumenting a model again
+    switches it to the new sink.
+    """
+    for model in library_models() if models is None else models:
+        if not model.__pydantic_complete__:
+            # Models with defer_build=True only get their validator on first use.
+            model.model_rebuild()
+        validator = model.__dict__['__pydantic_validator__']
+        if isinstance(validator, InstrumentedValidator):
+            validator = validator.validator
+        model.__pydantic_validator__ = InstrumentedValidator(validator, model.__name__, sink)
+
+
+def uninstrument(models: Optional[Iterable[Type[BaseModel]]] = None) -> None:
+    """Put the original validators back; disabled instrumentation costs nothing."""
+    for model in library_models() if models is None else models:
+        validator = model.__dict__.get('__pydantic_validator__')
+        if isinstance(validator, InstrumentedValidator):
+            model.__pydantic_validator__ = validator.validator
+
+
+@contextmanager
+def instrumented(sink: MetricsSink, models: Optional[Iterable[Type[BaseModel]]] = None) -> Iterator[MetricsSink]:
+    models = library_models() if models is None else list(models)
+    instrument(sink, models)
+    try:
+        yield sink
+    finally:
+        uninstrument(models)
@@ -1,26 +1,49 @@
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
-import json
+import threading
+import time
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
+from pydantic import ValidationError
+
+from .errors import SERVICE_CODES
+
+OVERFLOW_POLICIES = ('drop', 'drop_oldest', 'block')
+DEFAULT_QUEUE_SIZE = 10000
 
-import logging
-import json
-import sys
-from datetime import datetime, timezone
-from errors import SERVICE_CODES
 
 class JSONFormatter(logging.Formatter):
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, encoder: Optional[Callable[[dict], str]] = None):
         super().__init__()
         self.service_code = SERVICE_CODES.get(service_name, 'UNKNOWN')
+        # json.dumps builds a new encoder for every call with non-default arguments; reuse one instead.
+        self.encode = encoder or json.JSONEncoder(ensure_ascii=False).encode
+        self._modules: Dict[str, str] = {}
+        self._second = (None, '')
+
+    def format_timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+            self._second = (second, prefix)
+        return f'{prefix}.{int((created - second) * 1e6):06d}+00:00'
 
     def format(self, record):
+        module = self._modules.get(record.module)
+        if module is None:
+            module = self._modules[record.module] = f'{self.service_code}/{record.module}'
         log_record = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': self.format_timestamp(record.created),
             'level': record.levelname,
             'message': record.getMessage(),
-            'module': f'{self.service_code}/{record.module}',
+            'module': module,
             'function': record.funcName,
             'line': record.lineno,
         }
@@ -30,15 +53,207 @@ class JSONFormatter(logging.Formatter):
                 'number_of_errors': len(getattr(record, 'extra_errors', [])),
                 'detail': getattr(record, 'extra_errors', exception_info)
             }
-        return json.dumps(log_record, ensure_ascii=False)
+        occurrences = getattr(record, 'occurrences', None)
+        if occurrences is not None:
+            log_record['occurrences'] = occurrences
+        suppressed_errors = getattr(record, 'suppressed_errors', None)
+        if suppressed_errors is not None:
+            log_record['suppressed_errors'] = suppressed_errors
+        return self.encode(log_record)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler with a bounded queue: when full, drop the new record, drop the oldest one or block."""
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = 'drop'):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy {overflow}, expected one of {OVERFLOW_POLICIES}')
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self.listener: Optional[QueueListener] = None
+
+    def prepare(self, record):
+        # Only merge the message arguments, on a copy like QueueHandler.prepare so other handlers of the logger
+        # still see the original record; JSON formatting happens on the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        self.dropped += 1
+        if self.overflow == 'drop_oldest':
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+
+
+ErrorSignature = Tuple[Optional[str], Tuple[Tuple[Any, str], ...]]
+
+
+def _error_fields(errors: List[Any]) -> Iterator[Tuple[Any, str]]:
+    for error in errors:
+        if not isinstance(error, dict):
+            continue
+        if 'row' in error and isinstance(error.get('errors'), list):
+            yield from _error_fields(error['errors'])
+        elif 'loc' in error:
+            yield error.get('type'), '.'.join(map(str, error['loc']))
+        else:
+            yield error.get('type'), str(error.get('field', ''))
+
+
+class ValidationErrorAggregationFilter(logging.Filter):
+    """Deduplicates validation error records by signature (error code plus error type and field path).
 
-def setup_logger(service_name: str) -> logging.Logger:
-    service_code = SERVICE_CODES.get(f'{service_name}', 'UNKNOWN')  
+    The first keep_first records of a signature pass in full. After that a sample_rate share of them passes
+    without the exception detail, with an occurrences count. The rest are counted and reported in an aggregated
+    summary record logged to summary_logger at most once per summary_interval seconds.
+    """
+
+    def __init__(self, keep_first: int = 10, sample_rate: float = 0.01, summary_interval: float = 60.0,
+                 summary_logger: Optional[logging.Logger] = None, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.keep_first = keep_first
+        self.sample_rate = sample_rate
+        self.summary_interval = summary_interval
+        self.summary_logger = summary_logger
+        self.clock = clock
+        self._counts: Dict[ErrorSignature, int] = {}
+        self._suppressed: Dict[ErrorSignature, int] = {}
+        self._last_summary = clock()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(record: logging.LogRecord) -> Optional[ErrorSignature]:
+        """Error code plus the (type, field path) pairs of the record's errors, or None without errors.
+
+        The errors come from extra_errors, else from the exception: a pydantic ValidationError, or the structured
+        errors of a ModelValidationException. Both pydantic ('loc') and structured ('field') errors are read, and
+        per-row entries count by their errors, whatever the row.
+        """
+        exception = record.exc_info[1] if record.exc_info else None
+        errors = getattr(record, 'extra_errors', None)
+        if errors is None:
+            if isinstance(exception, ValidationError):
+                errors = exception.errors(include_url=False, include_context=False, include_input=False)
+            else:
+                errors = getattr(exception, 'errors', None)
+        if not isinstance(errors, list) or not errors:
+            return None
+        fields = set(_error_fields(errors))
+        return getattr(exception, 'error_code', None), tuple(sorted(fields, key=repr))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        signature = self.signature(record)
+        keep = True
+        if signature is not None:
+            with self._lock:
+                count = self._counts[signature] = self._counts.get(signature, 0) + 1
+                repeats = count - self.keep_first
+                if repeats > 0:
+                    keep = int(repeats * self.sample_rate) > int((repeats - 1) * self.sample_rate)
+                    if keep:
+                        record.exc_info = None
+                        record.exc_text = None
+                        record.extra_errors = None
+                        record.occurrences = count
+                    else:
+                        self._suppressed[signature] = self._suppressed.get(signature, 0) + 1
+        if self._suppressed and self.clock() - self._last_summary >= self.summary_interval:
+            self.flush()
+        return keep
+
+    def flush(self) -> None:
+        """Log the aggregated counts of suppressed records now."""
+        with self._lock:
+            suppressed, self._suppressed = self._suppressed, {}
+            self._last_summary = self.clock()
+            summary = [{'error_code': error_code, 'errors': [f'{error_type} at {loc}' for error_type, loc in fields],
+                        'suppressed': count, 'total': self._counts[(error_code, fields)]}
+                       for (error_code, fields), count in suppressed.items()]
+        if summary and self.summary_logger is not None:
+            self.summary_logger.warning('Suppressed repeated validation errors',
+                                        extra={'suppressed_errors': summary})
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for room, a full bounded queue must not prevent a clean stop.
+        self.queue.put(self._sentinel)
+
+
+_listeners: List[QueueListener] = []
+_error_filters: List[ValidationErrorAggregationFilter] = []
+
+
+def stop_logging() -> None:
+    """Log the pending summaries of error filters, then flush and stop every async listener started by setup_logger."""
+    while _error_filters:
+        _error_filters.pop().flush()
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(stop_logging)
+
+
+def _remove_installed_handlers(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        if getattr(handler, 'installed_by_setup_logger', False):
+            for error_filter in handler.filters:
+                if error_filter in _error_filters:
+                    _error_filters.remove(error_filter)
+                    error_filter.flush()
+            logger.removeHandler(handler)
+            listener = getattr(handler, 'listener', None)
+            if listener in _listeners:
+                _listeners.remove(listener)
+                listener.stop()
+
+
+def setup_logger(service_name: str, async_mode: bool = False, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 overflow: str = 'drop', encoder: Optional[Callable[[dict], str]] = None,
+                 stream: Optional[TextIO] = None,
+                 error_filter: Optional[ValidationErrorAggregationFilter] = None) -> logging.Logger:
+    """Configure the service logger; calling it again replaces the handlers it installed before.
+
+    In async mode records go through a bounded queue to a listener thread that formats and writes them, and
+    overflow decides what happens when the queue is full ('drop', 'drop_oldest' or 'block'). An error_filter
+    runs on the calling thread, so suppressed records are never queued; its summaries go to this logger, and
+    stop_logging() (also run at exit) logs the counts still pending.
+    """
+    service_code = SERVICE_CODES.get(f'{service_name}', 'UNKNOWN')
     logger = logging.getLogger(service_code)
     logger.setLevel(logging.INFO)
+    _remove_installed_handlers(logger)
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JSONFormatter(f'{service_name}', encoder=encoder))
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter(f'{service_name}'))
+    if async_mode:
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow=overflow)
+        queue_handler.listener = _Listener(queue_handler.queue, handler, respect_handler_level=True)
+        queue_handler.listener.start()
+        _listeners.append(queue_handler.listener)
+        handler = queue_handler
 
+    if error_filter is not None:
+        error_filter.summary_logger = error_filter.summary_logger or logger
+        handler.addFilter(error_filter)
+        if error_filter not in _error_filters:
+            _error_filters.append(error_filter)
+    handler.installed_by_setup_logger = True
     logger.addHandler(handler)
     return logger
@@ -0,0 +1,254 @@
+import copy
+import re
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .article_nosql_models import Image, Table
+
+# ATX headings and the code fences that hide them; setext (underlined) headings are not recognised.
+BLOCK_PATTERN = re.compile(
+    r'^[ ]{0,3}(?:(?P<fence>`{3,}|~{3,})|(?P<hashes>#{1,6})(?:[ \t]+(?P<title>[^\n]*?))?[ \t#]*$)', re.MULTILINE)
+
+
+class Section(NamedTuple):
+    level: int  # 0 for the text before the first heading
+    title: str
+    start: int  # offset of the heading line
+    content_end: int  # offset of the next heading, the section's own text ends there
+    end: int  # offset where the section ends, subsections included
+    parent: Optional[int]
+    images: Tuple['Image', ...]
+    tables: Tuple['Table', ...]
+
+
+def _common_prefix_length(a: str, b: str, limit: int) -> int:
+    low, step = 0, 1024
+    while low < limit:
+        high = min(low + step, limit)
+        if a[low:high] != b[low:high]:
+            break
+        low, step = high, step * 2
+    else:
+        return limit
+    while high - low > 1:
+        middle = (low + high) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    low, step = 0, 1024
+    while low < limit:
+        high = min(low + step, limit)
+        if a[len(a) - high:len(a) - low] != b[len(b) - high:len(b) - low]:
+            break
+        low, step = high, step * 2
+    else:
+        return limit
+    while high - low > 1:
+        middle = (low + high) // 2
+        if a[len(a) - middle:len(a) - low] == b[len(b) - middle:len(b) - low]:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def _headings(text: str, pos: int) -> Iterator[Tuple[int, int, str]]:
+    """(start, level, title) of the headings from pos on, which must be the start of a line outside any fence."""
+    fence = None
+    for match in BLOCK_PATTERN.finditer(text, pos):
+        marker = match['fence']
+        if marker:
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence):
+                fence = None
+        elif fence is None:
+            yield match.start(), len(match['hashes']), (match['title'] or '').strip()
+
+
+class SectionTree:
+    """Sections of a Markdown text, with the figures and tables each section's own text refers to.
+
+    Sections are listed in document order; parent is the index of the enclosing section. Offsets index into
+    text. Python strings cannot be sliced without copying, so span() and search() work on offsets (re, str.find
+    and str.startswith all take them) and text_of() is the only method that copies.
+    A tree is never changed once built. updated() returns the tree of an edited text, re-parsing only the
+    sections touched by the edit: sections before the first changed character are kept, and parsing stops at
+    the first heading found again in the unchanged end of the text.
+    """
+
+    def __init__(self, text: str, images: Sequence['Image'] = (), tables: Sequence['Table'] = ()):
+        self.text = text
+        self.images = tuple(images)
+        self.tables = tuple(tables)
+        self._targets: Dict[str, List[object]] = {}
+        for target in (*self.images, *self.tables):
+            number = getattr(target, 'image_number', None) or target.table_number
+            self._targets.setdefault(number.casefold(), []).append(target)
+        self._references: Optional[Pattern] = None
+        if self._targets:
+            alternatives = '|'.join(map(re.escape, sorted(self._targets, key=len, reverse=True)))
+            self._references = re.compile(rf'(?<![\w.])(?:{alternatives})(?!\w|\.\w)', re.IGNORECASE)
+        self.sections: List[Section] = self._link(self._parse(0, {})[0])
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __iter__(self) -> Iterator[Section]:
+        return iter(self.sections)
+
+    def __getitem__(self, index: int) -> Section:
+        return self.sections[index]
+
+    def links(self, images: Sequence['Image'], tables: Sequence['Table']) -> bool:
+        """Whether the cross-references were resolved against these very image and table objects."""
+        return (len(images) == len(self.images) and len(tables) == len(self.tables)
+                and all(a is b for a, b in zip(images, self.images)) and all(a is b for a, b in zip(tables, self.tables)))
+
+    def children(self, index: int) -> List[Section]:
+        return [section for section in self.sections[index + 1:self._last_descendant(index) + 1]
+                if section.parent == index]
+
+    def _last_descendant(self, index: int) -> int:
+        return bisect_left([section.start for section in self.sections], self.sections[index].end) - 1
+
+    def find(self, title: str) -> Optional[Section]:
+        """First section with this title, ignoring case."""
+        title = title.casefold()
+        return next((section for section in self.sections if section.title.casefold() == title), None)
+
+    def section_at(self, offset: int) -> Optional[Section]:
+        """Section whose own text contains offset."""
+        index = bisect_right([section.start for section in self.sections], offset) - 1
+        return self.sections[index] if index >= 0 else None
+
+    @staticmethod
+    def span(section: Section, subsections: bool = True) -> Tuple[int, int]:
+        return section.start, section.end if subsections else section.content_end
+
+    def text_of(self, section: Section, subsections: bool = True) -> str:
+        start, end = self.span(section, subsections)
+        return self.text[start:end]
+
+    def search(self, pattern: Pattern, section: Section, subsections: bool = True) -> Optional[re.Match]:
+        """pattern.search limited to the section, without slicing the text."""
+        return pattern.search(self.text, *self.span(section, subsections))
+
+    def updated(self, text: str) -> 'SectionTree':
+        """Tree of text, an edit of self.text, re-parsing only the sections around the changed characters."""
+        old = self.text
+        if text is old:
+            return self
+        tree = copy.copy(self)
+        tree.text = text
+        limit = min(len(old), len(text))
+        prefix = _common_prefix_length(old, text, limit)
+        if prefix == len(old) == len(text):
+            return tree
+        suffix = _common_suffix_length(old, text, limit - prefix)
+        delta = len(text) - len(old)
+        sections = self.sections
+
+        # Sections before the one holding the first change are untouched, except the one just before it: an
+        # edit of the heading line can merge the two.
+        keep = max(bisect_right([section.start for section in sections], prefix) - 2, 0)
+        restart = sections[keep].start if sections else 0
+        # Headings in the unchanged end, where parsing can stop and the old sections be shifted.
+        unchanged_from = len(old) - suffix
+        resume = {section.start + delta: index for index, section in enumerate(sections[keep:], keep)
+                  if section.start >= unchanged_from}
+
+        parsed, resumed = tree._parse(restart, resume)
+        tail = [] if resumed is None else [
+            section._replace(start=section.start + delta, content_end=section.content_end + delta)
+            for section in sections[resumed:]]
+        tree.sections = self._link(sections[:keep] + parsed + tail)
+        return tree
+
+    def _parse(self, pos: int, resume: Dict[int, int]) -> Tuple[List[Section], Optional[int]]:
+        """Sections from pos on, up to the first heading found in resume, whose value is returned too."""
+        text = self.text
+        boundaries = []
+        resumed, stop = None, len(text)
+        for start, level, title in _headings(text, pos):
+            resumed = resume.get(start)
+            if resumed is not None:
+                stop = start
+                break
+            boundaries.append((start, level, title))
+        if pos == 0 and (not boundaries or boundaries[0][0] > 0) and stop > 0:
+            boundaries.insert(0, (0, 0, ''))
+        sections = []
+        for number, (start, level, title) in enumerate(boundaries):
+            content_end = boundaries[number + 1][0] if number + 1 < len(boundaries) else stop
+            images, tables = self._referenced(start, content_end)
+            sections.append(Section(level, title, start, content_end, content_end, None, images, tables))
+        return sections, resumed
+
+    def _referenced(self, start: int, end: int) -> Tuple[tuple, tuple]:
+        if self._references is None:
+            return (), ()
+        found = {}
+        for match in self._references.finditer(self.text, start, end):
+            for target in self._targets[match[0].casefold()]:
+                found[id(target)] = target
+        targets = list(found.values())
+        return (tuple(target for target in targets if hasattr(target, 'image_number')),
+                tuple(target for target in targets if not hasattr(target, 'image_number')))
+
+    @staticmethod
+    def _link(sections: List[Section]) -> List[Section]:
+        """Fill in parent and end from the heading levels."""
+        ends = [section.content_end for section in sections]
+        parents: List[Optional[int]] = [None] * len(sections)
+        open_sections: List[int] = []
+        for index, section in enumerate(sections):
+            while open_sections and sections[open_sections[-1]].level >= section.level:
+                open_sections.pop()
+            if open_sections and section.level:
+                parents[index] = open_sections[-1]
+            for enclosing in open_sections:
+                ends[enclosing] = section.content_end
+            if section.level:
+                open_sections.append(index)
+        return [section if section.end == end and section.parent == parent
+                else section._replace(end=end, parent=parent)
+                for section, end, parent in zip(sections, ends, parents)]
+
+
+class SectionCache:
+    """Holds a model's SectionTree. All instances compare equal, so the cache never makes two models unequal.
+
+    Copies start empty: model_copy copies private attributes, and a copy with another text must not share the
+    tree. Trees are immutable, so concurrent readers at worst parse the same text twice.
+    """
+    __slots__ = ('tree',)
+
+    def __init__(self):
+        self.tree: Optional[SectionTree] = None
+
+    def __eq__(self, other):
+        return isinstance(other, SectionCache)
+
+    def __reduce__(self):
+        return SectionCache, ()
+
+    def __copy__(self):
+        return SectionCache()
+
+    def __deepcopy__(self, memo):
+        return SectionCache()
+
+    def get(self, text: str, images: Sequence['Image'], tables: Sequence['Table']) -> SectionTree:
+        tree = self.tree
+        if tree is None or not tree.links(images, tables):
+            tree = self.tree = SectionTree(text, images, tables)
+        elif tree.text is not text:
+            tree = self.tree = tree.updated(text)
+        return tree
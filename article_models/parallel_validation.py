@@ -0,0 +1,77 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from .bulk_validation import BulkValidationResult, compact_row_errors
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _validate_json_chunk(model: Type[BaseModel], start: int, lines: List[Union[bytes, str]]) -> BulkValidationResult:
+    validate_json = model.model_validate_json
+    valid: List[BaseModel] = []
+    errors: Dict[int, List[Dict[str, Any]]] = {}
+    for index, line in enumerate(lines, start):
+        if not line or line.isspace():
+            continue
+        try:
+            valid.append(validate_json(line))
+        except ValidationError as e:
+            errors[index] = compact_row_errors(e)
+    return BulkValidationResult(valid=valid, errors=errors)
+
+
+def validate_parallel(model: Type[BaseModel], lines: Iterable[Union[bytes, str]], workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True,
+                      max_pending: Optional[int] = None,
+                      executor: Optional[Executor] = None) -> Iterator[BulkValidationResult]:
+    """Validate raw JSON documents across a process pool and yield one result per chunk.
+
+    Errors are keyed by the 0-based position of the line in the input. With ordered=False chunks are
+    yielded as soon as they complete. At most max_pending chunks (2 per worker by default) are in flight,
+    so the input iterable is consumed only as fast as results are taken. An executor passed in is not shut
+    down.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    pending: Union[deque, set] = deque() if ordered else set()
+
+    def take_completed() -> List[Future]:
+        nonlocal pending
+        if ordered:
+            return [pending.popleft()]
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        return list(done)
+
+    iterator = iter(lines)
+    start = 0
+    try:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            future = executor.submit(_validate_json_chunk, model, start, chunk)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+            start += len(chunk)
+            while len(pending) >= max_pending:
+                for future in take_completed():
+                    yield future.result()
+        while pending:
+            for future in take_completed():
+                yield future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for future in pending:
+                future.cancel()
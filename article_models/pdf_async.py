@@ -0,0 +1,162 @@
+"""Non-blocking PDF I/O for asyncio services.
+
+File reads, writes and hashing run in worker threads (asyncio.to_thread) one chunk at a time, so the event loop
+never waits on the disk and a PDF is never held twice in memory. The SHA-256 and size of every PDF are computed
+while it streams, not in a second pass.
+"""
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import nullcontext, suppress
+from io import BytesIO
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .article_sql_models import ArticlePDFDBSchema
+from .pdf_payload import DEFAULT_CHUNK_SIZE, PDFSourceType
+from .schemas import ArticlePDFFile
+
+DEFAULT_CONCURRENCY = 8
+
+Chunk = Union[bytes, memoryview]
+
+
+class PDFDigest(NamedTuple):
+    size: int
+    sha256: str
+
+
+class _ChunkReader:
+    """Sequential chunks of a PDF source; open, read and close may run in worker threads, one call at a time."""
+
+    def __init__(self, source: PDFSourceType, chunk_size: int):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.view: Optional[memoryview] = None
+        self.file = None
+        self.position = 0
+
+    @property
+    def blocking(self) -> bool:
+        return not isinstance(self.source, (memoryview, BytesIO, mmap.mmap))
+
+    def open(self) -> None:
+        source = self.source
+        if isinstance(source, memoryview):
+            self.view = source
+        elif isinstance(source, BytesIO):
+            # A snapshot, not getbuffer(): chunks kept by the caller must not pin the BytesIO's size.
+            self.view = memoryview(source.getvalue())
+        elif isinstance(source, mmap.mmap):
+            self.view = memoryview(source)
+        elif isinstance(source, Path):
+            self.file = open(source, 'rb')
+        else:
+            if source.seekable():
+                source.seek(0)
+            self.file = source
+
+    def read(self) -> Chunk:
+        if self.view is None:
+            return self.file.read(self.chunk_size)
+        chunk = self.view[self.position:self.position + self.chunk_size]
+        self.position += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        if self.view is not None and self.view is not self.source:
+            self.view.release()
+        if self.file is not None and self.file is not self.source:
+            self.file.close()
+
+
+def _pump(read: Callable[[], Chunk], write: Callable[[Chunk], object], digest: Any) -> int:
+    chunk = read()
+    if chunk:
+        digest.update(chunk)
+        write(chunk)
+    return len(chunk)
+
+
+async def _stream(reader: _ChunkReader, write: Callable[[Chunk], object]) -> PDFDigest:
+    digest = hashlib.sha256()
+    size = 0
+    await asyncio.to_thread(reader.open)
+    try:
+        while written := await asyncio.to_thread(_pump, reader.read, write, digest):
+            size += written
+    finally:
+        reader.close()
+    return PDFDigest(size, digest.hexdigest())
+
+
+async def aiter_chunks(pdf: ArticlePDFFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[Chunk]:
+    """Async counterpart of ArticlePDFFile.iter_chunks: file reads run in worker threads."""
+    reader = _ChunkReader(pdf._require_pdf_file(), chunk_size)
+    if not reader.blocking:
+        reader.open()
+    else:
+        await asyncio.to_thread(reader.open)
+    try:
+        while chunk := (await asyncio.to_thread(reader.read) if reader.blocking else reader.read()):
+            yield chunk
+    finally:
+        reader.close()
+
+
+async def digest_pdf(pdf: ArticlePDFFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PDFDigest:
+    """Size and SHA-256 of the PDF, streamed without loading it."""
+    return await _stream(_ChunkReader(pdf._require_pdf_file(), chunk_size), lambda chunk: None)
+
+
+async def load_pdf(record: ArticlePDFDBSchema, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   semaphore: Optional[asyncio.Semaphore] = None) -> Tuple[ArticlePDFFile, PDFDigest]:
+    """Read the file behind record.file_path into an in-memory ArticlePDFFile."""
+    if record.file_path is None:
+        raise ValueError(f'PDF file for {record.id} is not available')
+    buffer = BytesIO()
+    async with semaphore or nullcontext():
+        digest = await _stream(_ChunkReader(Path(record.file_path), chunk_size), buffer.write)
+    return ArticlePDFFile(id=record.id, pdf_file=buffer), digest
+
+
+async def save_pdf(pdf: ArticlePDFFile, path: Union[str, os.PathLike], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   semaphore: Optional[asyncio.Semaphore] = None) -> Tuple[ArticlePDFDBSchema, PDFDigest]:
+    """Stream the PDF to path and return the record pointing to it.
+
+    The PDF is written to a temporary file next to path and moved into place once complete, so readers never see
+    a partial file and a failed or cancelled save leaves no trace.
+    """
+    path = Path(path)
+    record = ArticlePDFDBSchema(id=pdf.id, file_path=str(path))
+    reader = _ChunkReader(pdf._require_pdf_file(), chunk_size)
+    async with semaphore or nullcontext():
+        descriptor, temporary_path = await asyncio.to_thread(tempfile.mkstemp, prefix=f'.{path.name}.',
+                                                             suffix='.tmp', dir=path.parent)
+        try:
+            with open(descriptor, 'wb') as file:
+                digest = await _stream(reader, file.write)
+            await asyncio.to_thread(os.replace, temporary_path, path)
+        except BaseException:
+            # A cancelled task may still have its os.replace finish in the worker thread.
+            with suppress(FileNotFoundError):
+                os.unlink(temporary_path)
+            raise
+    return record, digest
+
+
+async def load_pdfs(records: Iterable[ArticlePDFDBSchema], concurrency: int = DEFAULT_CONCURRENCY,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[ArticlePDFFile, PDFDigest]]:
+    """load_pdf for every record, at most concurrency files open at once; results keep the order of records."""
+    semaphore = asyncio.Semaphore(concurrency)
+    return list(await asyncio.gather(*(load_pdf(record, chunk_size, semaphore) for record in records)))
+
+
+async def save_pdfs(items: Iterable[Tuple[ArticlePDFFile, Union[str, os.PathLike]]],
+                    concurrency: int = DEFAULT_CONCURRENCY,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[ArticlePDFDBSchema, PDFDigest]]:
+    """save_pdf for every (pdf, path) pair, at most concurrency files open at once."""
+    semaphore = asyncio.Semaphore(concurrency)
+    return list(await asyncio.gather(*(save_pdf(pdf, path, chunk_size, semaphore) for pdf, path in items)))
@@ -0,0 +1,93 @@
+import mmap
+import os
+from contextlib import contextmanager
+from io import BytesIO, TextIOBase
+from pathlib import Path
+from typing import Annotated, Any, BinaryIO, Iterator, Union
+
+from pydantic import PlainValidator
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+PDFSourceType = Union[BytesIO, memoryview, mmap.mmap, Path, BinaryIO]
+
+
+def coerce_pdf_source(value: Any) -> PDFSourceType:
+    """Accept a PDF payload without reading it: buffers are wrapped, paths and file handles are kept lazy."""
+    if isinstance(value, (BytesIO, memoryview, mmap.mmap, Path)):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return memoryview(value)
+    if isinstance(value, os.PathLike):
+        return Path(value)
+    if hasattr(value, 'read'):
+        if isinstance(value, TextIOBase) or 'b' not in getattr(value, 'mode', 'b'):
+            raise ValueError('pdf_file must be opened in binary mode')
+        return value
+    raise ValueError('pdf_file must be bytes, memoryview, mmap, BytesIO, a binary file or a pathlib.Path')
+
+
+PDFSource = Annotated[Any, PlainValidator(coerce_pdf_source)]
+
+
+@contextmanager
+def pdf_source_view(source: PDFSourceType) -> Iterator[memoryview]:
+    """Expose the payload as a memoryview without copying; files are memory-mapped read-only."""
+    if isinstance(source, memoryview):
+        yield source
+    elif isinstance(source, BytesIO):
+        with source.getbuffer() as view:
+            yield view
+    elif isinstance(source, mmap.mmap):
+        with memoryview(source) as view:
+            yield view
+    else:
+        with _open_binary(source) as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield memoryview(b'')
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                yield view
+
+
+@contextmanager
+def _open_binary(source: Union[Path, BinaryIO]) -> Iterator[BinaryIO]:
+    if isinstance(source, Path):
+        with open(source, 'rb') as file:
+            yield file
+    else:
+        if source.seekable():
+            source.seek(0)
+        yield source
+
+
+def iter_pdf_chunks(source: PDFSourceType, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Union[memoryview, bytes]]:
+    """Yield the payload in chunks: slices of in-memory buffers, or reads from files.
+
+    BytesIO chunks are views of an immutable snapshot (BytesIO.getvalue() does not copy), so a caller may keep
+    them while the BytesIO is written to again.
+    """
+    if isinstance(source, BytesIO):
+        source = memoryview(source.getvalue())
+    if isinstance(source, (memoryview, mmap.mmap)):
+        with pdf_source_view(source) as view:
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+        return
+    with _open_binary(source) as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def pdf_source_size(source: PDFSourceType) -> int:
+    """Size of the payload in bytes, without reading files."""
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, mmap.mmap):
+        return len(source)
+    if isinstance(source, BytesIO):
+        with source.getbuffer() as view:
+            return view.nbytes
+    if isinstance(source, Path):
+        return source.stat().st_size
+    return os.fstat(source.fileno()).st_size
@@ -0,0 +1,210 @@
+"""Content-addressed PDF store: every distinct PDF is kept once, under its SHA-256, however many DOIs point to it.
+
+    root/
+        blobs/ab/abcdef...   one read-only file per distinct PDF, named by its hex SHA-256
+        tmp/                 partial writes, moved into blobs/ once complete
+        refs.json            {doi: sha256}; a blob's reference count is the number of DOIs pointing to it
+
+Records returned by the store are ordinary ArticlePDFDBSchema whose file_path points into blobs/, so existing
+readers (ArticlePDFFile(pdf_file=Path(record.file_path)), pdf_async.load_pdf) work unchanged. A store instance is
+thread-safe; several processes sharing one root must serialize their writes.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .article_sql_models import ArticlePDFDBSchema
+from .pdf_payload import DEFAULT_CHUNK_SIZE
+from .schemas import ArticlePDFFile
+
+DIGEST_PATTERN = re.compile('[0-9a-f]{64}')
+
+
+class StoreStats(NamedTuple):
+    dois: int
+    blobs: int
+    bytes: int
+
+
+class PDFBlobStore:
+    """PDFs stored once per content under root, with the DOIs referencing each one."""
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        self.root = Path(root)
+        self.blobs = self.root / 'blobs'
+        self.tmp = self.root / 'tmp'
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.tmp.mkdir(exist_ok=True)
+        self._refs_path = self.root / 'refs.json'
+        self._refs: Dict[str, str] = json.loads(self._refs_path.read_text()) if self._refs_path.exists() else {}
+        self._counts: Dict[str, int] = {}
+        for digest in self._refs.values():
+            self._counts[digest] = self._counts.get(digest, 0) + 1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, doi: str) -> bool:
+        return doi in self._refs
+
+    def path_of(self, digest: str) -> Path:
+        if not DIGEST_PATTERN.fullmatch(digest):
+            raise ValueError(f'{digest!r} is not a lowercase hex SHA-256 digest')
+        return self.blobs / digest[:2] / digest
+
+    def digest_of(self, doi: str) -> Optional[str]:
+        return self._refs.get(doi)
+
+    def refcount(self, digest: str) -> int:
+        return self._counts.get(digest, 0)
+
+    def _write_blob(self, pdf: ArticlePDFFile, chunk_size: int, expected: Optional[str] = None) -> str:
+        """Stream the PDF into tmp/ while hashing it and move it into blobs/ unless that content is stored already.
+
+        With expected, a PDF of another digest raises ValueError before anything reaches blobs/.
+        """
+        digest = hashlib.sha256()
+        descriptor, temporary_path = tempfile.mkstemp(suffix='.pdf', dir=self.tmp)
+        try:
+            with open(descriptor, 'wb') as file:
+                for chunk in pdf.iter_chunks(chunk_size):
+                    digest.update(chunk)
+                    file.write(chunk)
+            sha256 = digest.hexdigest()
+            if expected is not None and sha256 != expected:
+                raise ValueError(f'PDF for {pdf.id} has SHA-256 {sha256}, not {expected}')
+            path = self.path_of(sha256)
+            if path.exists():
+                os.unlink(temporary_path)
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.chmod(temporary_path, 0o444)
+                os.replace(temporary_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary_path)
+            raise
+        return sha256
+
+    def _link(self, doi: str, sha256: str, unreferenced: List[str]) -> None:
+        previous = self._refs.get(doi)
+        if previous == sha256:
+            return
+        self._refs[doi] = sha256
+        self._counts[sha256] = self._counts.get(sha256, 0) + 1
+        if previous is not None:
+            self._unref(previous, unreferenced)
+
+    def _unref(self, digest: str, unreferenced: List[str]) -> None:
+        self._counts[digest] -= 1
+        if not self._counts[digest]:
+            del self._counts[digest]
+            unreferenced.append(digest)
+
+    def _delete_blobs(self, digests: Iterable[str]) -> None:
+        """Unlink blobs that lost their last reference; called once refs.json no longer points to them."""
+        for digest in digests:
+            if digest not in self._counts:
+                path = self.path_of(digest)
+                if path.exists():
+                    os.unlink(path)
+
+    def _save_refs(self) -> None:
+        temporary_path = self._refs_path.with_suffix('.json.tmp')
+        temporary_path.write_text(json.dumps(self._refs, sort_keys=True))
+        os.replace(temporary_path, self._refs_path)
+
+    def _commit(self, refs: Dict[str, str], counts: Dict[str, int], unreferenced: List[str]) -> None:
+        """Save refs.json, restoring the given previous refs and counts if that fails, then unlink unreferenced blobs.
+
+        refs.json is saved before any blob is unlinked, so a crash in between leaves an orphaned blob for
+        collect_garbage rather than a reference to a missing file.
+        """
+        try:
+            self._save_refs()
+        except BaseException:
+            self._refs, self._counts = refs, counts
+            raise
+        self._delete_blobs(unreferenced)
+
+    def _put(self, pdf: ArticlePDFFile, sha256: Optional[str], chunk_size: int,
+             unreferenced: List[str]) -> ArticlePDFDBSchema:
+        if sha256 is None or not self.path_of(sha256).exists():
+            sha256 = self._write_blob(pdf, chunk_size, expected=sha256)
+        record = ArticlePDFDBSchema(id=pdf.id, file_path=str(self.path_of(sha256)))
+        self._link(pdf.id, sha256, unreferenced)
+        return record
+
+    def put(self, pdf: ArticlePDFFile, sha256: Optional[str] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE) -> ArticlePDFDBSchema:
+        """Store the PDF for pdf.id, replacing (and releasing) whatever the DOI pointed to before.
+
+        sha256 is the digest of the PDF when the caller already knows it (e.g. from pdf_async.digest_pdf). If that
+        content is stored already the PDF is not read at all, so the caller vouches that sha256 matches the PDF;
+        otherwise the PDF is hashed while it is written and a mismatch raises ValueError.
+        Every call rewrites the whole refs.json, so its cost grows with the store; use put_many for bulk ingest.
+        """
+        if sha256 is not None and not DIGEST_PATTERN.fullmatch(sha256):
+            raise ValueError(f'{sha256!r} is not a lowercase hex SHA-256 digest')
+        unreferenced: List[str] = []
+        with self._lock:
+            refs, counts = dict(self._refs), dict(self._counts)
+            record = self._put(pdf, sha256, chunk_size, unreferenced)
+            self._commit(refs, counts, unreferenced)
+        return record
+
+    def put_many(self, pdfs: Iterable[ArticlePDFFile],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[ArticlePDFDBSchema]:
+        """put for many PDFs, writing refs.json once; PDFs stored before a failing one stay stored."""
+        unreferenced: List[str] = []
+        with self._lock:
+            refs, counts = dict(self._refs), dict(self._counts)
+            try:
+                return [self._put(pdf, None, chunk_size, unreferenced) for pdf in pdfs]
+            finally:
+                self._commit(refs, counts, unreferenced)
+
+    def record(self, doi: str) -> ArticlePDFDBSchema:
+        """Record for doi; file_path is None (and is_pdf_available False) when the store has no PDF for it."""
+        digest = self._refs.get(doi)
+        return ArticlePDFDBSchema(id=doi, file_path=None if digest is None else str(self.path_of(digest)))
+
+    def get(self, doi: str) -> Optional[ArticlePDFFile]:
+        """The PDF of doi backed by its blob file, read lazily, or None."""
+        digest = self._refs.get(doi)
+        return None if digest is None else ArticlePDFFile(id=doi, pdf_file=self.path_of(digest))
+
+    def release(self, doi: str) -> bool:
+        """Drop the DOI's reference; the blob is deleted with its last reference. False if doi was not stored."""
+        unreferenced: List[str] = []
+        with self._lock:
+            digest = self._refs.get(doi)
+            if digest is None:
+                return False
+            refs, counts = dict(self._refs), dict(self._counts)
+            del self._refs[doi]
+            self._unref(digest, unreferenced)
+            self._commit(refs, counts, unreferenced)
+        return True
+
+    def collect_garbage(self) -> int:
+        """Delete unreferenced blobs and leftover partial writes (e.g. after a crash); returns the files removed."""
+        removed = 0
+        with self._lock:
+            for path in [*self.blobs.glob('*/*'), *self.tmp.iterdir()]:
+                if path.parent == self.tmp or path.name not in self._counts:
+                    os.unlink(path)
+                    removed += 1
+        return removed
+
+    def stats(self) -> StoreStats:
+        with self._lock:
+            digests = list(self._counts)
+        return StoreStats(len(self._refs), len(digests), sum(self.path_of(digest).stat().st_size for digest in digests))
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from typing import Iterable, Tuple, Type
+
+from pydantic import BaseModel, create_model, field_validator, model_validator
+
+
+def _unbound(func):
+    # The plain function: pydantic makes it a classmethod again when its first parameter is cls, as on the source
+    # model, and keeps mode='after' model validators as instance methods.
+    return getattr(func, '__func__', func)
+
+
+@lru_cache(maxsize=None)
+def _build_projection(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    decorators = model.__pydantic_decorators__
+    validators = {}
+    for name, decorator in decorators.field_validators.items():
+        validated_fields = [field for field in decorator.info.fields if field in fields]
+        if validated_fields:
+            validators[name] = field_validator(*validated_fields, mode=decorator.info.mode)(_unbound(decorator.func))
+    for name, decorator in decorators.model_validators.items():
+        validators[name] = model_validator(mode=decorator.info.mode)(_unbound(decorator.func))
+    return create_model(
+        f'{model.__name__}Projection',
+        __config__=model.model_config,
+        __module__=model.__module__,
+        __validators__=validators,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+def project_model(model: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """Build (once) a model with only the given fields of model, keeping their constraints and validators."""
+    requested = set(fields)
+    unknown = requested.difference(model.model_fields)
+    if unknown:
+        raise ValueError(f'Unknown fields for {model.__name__}: {", ".join(sorted(unknown))}')
+    return _build_projection(model, tuple(name for name in model.model_fields if name in requested))
@@ -1,14 +1,16 @@
 from pydantic import BaseModel, Field, ConfigDict, model_validator
-from typing import Optional, Any, List, Set
-from io import BytesIO
+from pydantic_core import core_schema, from_json, to_json
+from typing import Optional, Generic, List, Set, Iterator, TypeVar, Union
 from enum import Enum
-from . import DOI_REGEX, PAGES_REGEX
+from .errors import ArticleAnalyserApiBaseException
+from .field_types import DOI, Pages
+from .pdf_payload import DEFAULT_CHUNK_SIZE, PDFSource, iter_pdf_chunks, pdf_source_size, pdf_source_view
 from .article_nosql_models import Author
 
 
 class ArticlePDFFile(BaseModel):
-    id: str = Field(..., pattern=DOI_REGEX, description="Valid DOI format")
-    pdf_file: Optional[BytesIO] = None
+    id: DOI = Field(..., description="Valid DOI format")
+    pdf_file: Optional[PDFSource] = Field(None, description='Bytes, memoryview, mmap, BytesIO, binary file or pathlib.Path')
     is_available: bool
 
     @model_validator(mode='before')
@@ -17,10 +19,31 @@ class ArticlePDFFile(BaseModel):
         values['is_available'] = values.get('pdf_file') is not None
         return values
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def _require_pdf_file(self):
+        if self.pdf_file is None:
+            raise ValueError(f'PDF file for {self.id} is not available')
+        return self.pdf_file
+
+    def getbuffer(self):
+        """Context manager giving a zero-copy memoryview of the PDF; files are memory-mapped."""
+        return pdf_source_view(self._require_pdf_file())
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Union[memoryview, bytes]]:
+        """Stream the PDF in chunks without materializing it."""
+        return iter_pdf_chunks(self._require_pdf_file(), chunk_size)
+
+    def read_bytes(self) -> bytes:
+        with self.getbuffer() as view:
+            return view.tobytes()
+
+    @property
+    def size(self) -> int:
+        return pdf_source_size(self._require_pdf_file())
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
 class ArticleMetadata(BaseModel):
-    id: str = Field(..., pattern=DOI_REGEX, description='Valid DOI format')
+    id: DOI = Field(..., description='Valid DOI format')
     title: str = Field(..., min_length=1, description='Title of the article')
     authors: List[Author] = Field(..., min_length=1, description='At least one author required')
     keywords: Set[str]
@@ -28,7 +51,9 @@ class ArticleMetadata(BaseModel):
     year: int = Field(..., ge=0)
     volume: int = Field(..., ge=0)
     issue: Optional[int] = None
-    pages: str = Field(..., pattern=PAGES_REGEX, description='Page range format: 23-34')
+    pages: Pages = Field(..., description='Page range format: 23-34')
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class StatusEnum(str, Enum):
@@ -36,9 +61,55 @@ class StatusEnum(str, Enum):
     ERROR = "ERROR"
 
 
-class ResponseSchema(BaseModel):
+DataT = TypeVar('DataT')
+
+
+class RawJSON:
+    """Already encoded JSON payload that ResponseSchema.dump_json splices in without re-encoding."""
+    __slots__ = ('value',)
+
+    def __init__(self, value: Union[bytes, str]):
+        self.value = value.encode() if isinstance(value, str) else bytes(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(lambda raw: from_json(raw.value)))
+
+    def __eq__(self, other):
+        return isinstance(other, RawJSON) and self.value == other.value
+
+    def __repr__(self):
+        return f'RawJSON({self.value!r})'
+
+
+class ResponseSchema(BaseModel, Generic[DataT]):
+    """Response envelope; parametrize it, e.g. ResponseSchema[List[ArticleMetadata]], to serialize data with the
+    concrete model serializer instead of the generic Any one."""
     status: StatusEnum
     message: str
     error_code: Optional[str] = None
-    data: Optional[Any] = None
+    data: Optional[Union[RawJSON, DataT]] = None
     http_status: int
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_exception(cls, exception: ArticleAnalyserApiBaseException) -> 'ResponseSchema':
+        """ERROR response for a library exception; structured validation errors are passed through as data.
+
+        On a parametrized response, e.g. ResponseSchema[List[ArticleMetadata]], the errors are not DataT, so they
+        are carried as RawJSON instead of being validated as DataT.
+        """
+        data = getattr(exception, 'errors', None)
+        if data is not None and cls.__pydantic_generic_metadata__['args']:
+            data = RawJSON(to_json(data))
+        return cls(status=StatusEnum.ERROR, message=exception.additional_info or exception.error_message,
+                   error_code=exception.error_code, data=data, http_status=exception.http_status_code)
+
+    def dump_json(self) -> bytes:
+        """JSON bytes of the response; RawJSON data is spliced in as-is instead of being decoded and re-encoded."""
+        if not isinstance(self.data, RawJSON):
+            return self.__pydantic_serializer__.to_json(self)
+        envelope = self.__pydantic_serializer__.to_json(self, exclude={'data'})
+        return b''.join((envelope[:-1], b',"data":', self.data.value, b'}'))
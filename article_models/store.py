@@ -0,0 +1,120 @@
+from bisect import bisect_left, insort
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .article_nosql_models import ArticleTextDBSchema
+from .schemas import ArticleMetadata
+
+Article = Union[ArticleMetadata, ArticleTextDBSchema]
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class ArticleStore:
+    """In-memory articles indexed by id, keyword, author surname and year.
+
+    Keywords and surnames have inverted indexes (value -> set of ids) and years a sorted (year, id) list, so
+    queries intersect index entries instead of scanning every article. Articles without a year
+    (ArticleTextDBSchema) are never returned by year range queries.
+    """
+
+    def __init__(self, articles: Iterable[Article] = ()):
+        self._by_id: Dict[str, Article] = {}
+        self._by_keyword: Dict[str, Set[str]] = {}
+        self._by_surname: Dict[str, Set[str]] = {}
+        self._years: List[Tuple[int, str]] = []
+        self.add_many(articles)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._by_id
+
+    def __iter__(self) -> Iterator[Article]:
+        return iter(self._by_id.values())
+
+    def get(self, article_id: str) -> Optional[Article]:
+        return self._by_id.get(article_id)
+
+    def _index(self, article: Article) -> None:
+        article_id = article.id
+        self._by_id[article_id] = article
+        for keyword in article.keywords:
+            self._by_keyword.setdefault(keyword, set()).add(article_id)
+        for author in article.authors:
+            self._by_surname.setdefault(author.surname, set()).add(article_id)
+
+    def add(self, article: Article) -> None:
+        """Insert an article, replacing (and re-indexing) any article with the same id."""
+        if article.id in self._by_id:
+            self.remove(article.id)
+        self._index(article)
+        year = getattr(article, 'year', None)
+        if year is not None:
+            insort(self._years, (year, article.id))
+
+    def add_many(self, articles: Iterable[Article]) -> None:
+        """Insert many articles, sorting the year index once instead of once per article."""
+        added_ids = {}
+        for article in articles:
+            if article.id in self._by_id:
+                self.remove(article.id)
+            self._index(article)
+            added_ids[article.id] = None
+        # Years are read back from _by_id, so an id repeated in the batch only keeps its last version's entry.
+        added_years = [(year, article_id) for article_id in added_ids
+                       if (year := getattr(self._by_id[article_id], 'year', None)) is not None]
+        if added_years:
+            self._years.extend(added_years)
+            self._years.sort()
+
+    def remove(self, article_id: str) -> Article:
+        article = self._by_id.pop(article_id)
+        for index, values in ((self._by_keyword, article.keywords),
+                              (self._by_surname, [author.surname for author in article.authors])):
+            for value in values:
+                ids = index.get(value)
+                if ids is not None:
+                    ids.discard(article_id)
+                    if not ids:
+                        del index[value]
+        year = getattr(article, 'year', None)
+        if year is not None:
+            position = bisect_left(self._years, (year, article_id))
+            if position < len(self._years) and self._years[position] == (year, article_id):
+                del self._years[position]
+        return article
+
+    def _year_range(self, year_min: Optional[int], year_max: Optional[int]) -> List[Tuple[int, str]]:
+        start = 0 if year_min is None else bisect_left(self._years, (year_min,))
+        end = len(self._years) if year_max is None else bisect_left(self._years, (year_max + 1,))
+        return self._years[start:end]
+
+    def query(self, keywords: Iterable[str] = (), surname: Optional[str] = None, year_min: Optional[int] = None,
+              year_max: Optional[int] = None) -> List[Article]:
+        """Articles having all the keywords, an author with the surname and a year in [year_min, year_max].
+
+        Results are ordered by year, then id.
+        """
+        candidates = [self._by_keyword.get(keyword, _EMPTY) for keyword in keywords]
+        if surname is not None:
+            candidates.append(self._by_surname.get(surname, _EMPTY))
+        by_year = year_min is not None or year_max is not None
+        if not candidates:
+            if by_year:
+                return [self._by_id[article_id] for _, article_id in self._year_range(year_min, year_max)]
+            ids = self._by_id.keys()
+        else:
+            candidates.sort(key=len)
+            ids = set(candidates[0]).intersection(*candidates[1:])
+        articles = [self._by_id[article_id] for article_id in ids]
+        if by_year:
+            low = year_min if year_min is not None else float('-inf')
+            high = year_max if year_max is not None else float('inf')
+            articles = [article for article in articles
+                        if getattr(article, 'year', None) is not None and low <= article.year <= high]
+        return sorted(articles, key=_order_key)
+
+
+def _order_key(article: Article) -> Tuple[bool, int, str]:
+    year = getattr(article, 'year', None)
+    return year is None, year or 0, article.id
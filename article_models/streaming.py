@@ -0,0 +1,43 @@
+import os
+from typing import Callable, IO, Iterable, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+DEFAULT_CHUNK_SIZE = 1000
+
+ErrorHandler = Callable[[int, bytes, ValidationError], None]
+
+
+def _iter_lines(source: Union[str, os.PathLike, IO, Iterable]) -> Iterator[Union[bytes, str]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from file
+    else:
+        yield from source
+
+
+def iter_ndjson(source: Union[str, os.PathLike, IO, Iterable], model: Type[BaseModel],
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                on_error: Optional[ErrorHandler] = None) -> Iterator[List[BaseModel]]:
+    """Validate a JSON lines source line by line with model_validate_json and yield models in chunks.
+
+    The source can be a path, a binary or text file, or any iterable of lines. Only one chunk is held in
+    memory at a time. Blank lines are skipped; invalid lines are passed to on_error together with their
+    1-based line number and dropped.
+    """
+    validate_json = model.model_validate_json
+    chunk: List[BaseModel] = []
+    for line_number, line in enumerate(_iter_lines(source), 1):
+        if not line or line.isspace():
+            continue
+        try:
+            chunk.append(validate_json(line))
+        except ValidationError as e:
+            if on_error is not None:
+                on_error(line_number, line, e)
+            continue
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, NamedTuple, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+DEFAULT_MAXSIZE = 10000
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model: Type[BaseModel]) -> str:
+    """Digest of the model core schema, so cached entries do not survive a change of the model definition."""
+    if not model.__pydantic_complete__:
+        # Models with defer_build=True only have a placeholder core schema until their first use.
+        model.model_rebuild()
+    return hashlib.blake2b(repr(model.__pydantic_core_schema__).encode(), digest_size=8).hexdigest()
+
+
+class ValidationCache:
+    """LRU cache of validated models keyed by a hash of the raw JSON, the model and its schema version.
+
+    Entries are bounded by count (maxsize) and optionally by the total size of the raw payloads (max_bytes).
+    With copy=True every call returns a deep model_copy() of the cached model, so callers may mutate what they
+    get (keywords, authors, ...) without affecting later hits. Frozen models are never copied; with copy=False
+    callers share the cached instance and must not mutate it.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, max_bytes: Optional[int] = None, copy: bool = True):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self._entries: 'OrderedDict[Hashable, Tuple[BaseModel, int]]' = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def validate_json(self, model: Type[ModelT], raw: Union[bytes, str],
+                      schema_version: Optional[str] = None) -> ModelT:
+        """model.model_validate_json(raw), served from the cache when the same payload was validated before."""
+        data = raw.encode() if isinstance(raw, str) else raw
+        key = (model, schema_version or schema_fingerprint(model), hashlib.blake2b(data, digest_size=16).digest())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if entry is not None:
+            return self._result(entry[0])
+
+        validated = model.model_validate_json(data)
+        with self._lock:
+            self._misses += 1
+            if key not in self._entries:
+                self._entries[key] = (validated, len(data))
+                self._bytes += len(data)
+                self._evict()
+        return self._result(validated)
+
+    def _result(self, model: ModelT) -> ModelT:
+        return model.model_copy(deep=True) if self.copy and not model.model_config.get('frozen') else model
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.maxsize
+                                 or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                              size=len(self._entries), bytes=self._bytes)
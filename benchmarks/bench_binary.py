@@ -0,0 +1,54 @@
+"""Size and speed of the binary format against pydantic-core JSON for 1k article batches.
+
+The binary format is smaller; pydantic-core JSON is faster to dump and validate.
+"""
+import timeit
+from typing import List
+
+from pydantic import TypeAdapter
+
+from article_models import binary
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.schemas import ArticleMetadata
+
+
+def make_metadata(count: int) -> List[ArticleMetadata]:
+    return [ArticleMetadata(id=f'10.1000/{i}', title=f'Article {i}',
+                            authors=[{'name': 'John', 'surname': 'Doe'}, {'name': 'Jane', 'surname': 'Smith'}],
+                            keywords={'science', 'research', 'machine learning'}, journal='Test Journal', year=2020,
+                            volume=1, issue=2, pages='10-20') for i in range(count)]
+
+
+def make_texts(count: int) -> List[ArticleTextDBSchema]:
+    return [ArticleTextDBSchema(id=f'10.1000/{i}', title=f'Article {i}',
+                                authors=[{'name': 'John', 'surname': 'Doe'}], abstract='Abstract text. ' * 20,
+                                keywords={'science', 'research'},
+                                markdown_full_text=f'# Article {i}\n' + 'Some full text of the article. ' * 300,
+                                images=[{'image_number': 'fig.1', 'file_path': '/images/fig1.png'}],
+                                tables=[{'table_number': 'tab.1', 'file_path': '/tables/tab1.csv'}])
+            for i in range(count)]
+
+
+def bench(label, func, size, number=5):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'  {label:<34} {seconds * 1e3:9.2f} ms  {size / 1024:9.1f} KiB')
+
+
+def main():
+    for model, articles in ((ArticleMetadata, make_metadata(1_000)), (ArticleTextDBSchema, make_texts(1_000))):
+        print(f'{model.__name__} x {len(articles)}')
+        adapter = TypeAdapter(List[model])
+        as_json = adapter.dump_json(articles)
+        bench('JSON dump', lambda: adapter.dump_json(articles), len(as_json))
+        bench('JSON validate', lambda: adapter.validate_json(as_json), len(as_json))
+        for compression in binary.available_compressions():
+            encoded = binary.dumps_many(articles, compression=compression)
+            label = compression or 'uncompressed'
+            bench(f'binary {label} dump', lambda: binary.dumps_many(articles, compression=compression), len(encoded))
+            bench(f'binary {label} load', lambda: binary.loads_many(model, encoded), len(encoded))
+            bench(f'binary {label} trusted load', lambda: binary.loads_many(model, encoded, trusted=True),
+                  len(encoded))
+
+
+if __name__ == '__main__':
+    main()
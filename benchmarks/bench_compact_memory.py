@@ -0,0 +1,62 @@
+"""Bytes per article for ArticleMetadata models against compact records sharing an InternPool."""
+import gc
+import random
+import tracemalloc
+
+from article_models.compact import InternPool, compact_many
+from article_models.converters import construct_trusted
+from article_models.article_nosql_models import Author
+from article_models.schemas import ArticleMetadata
+
+SURNAMES = [f'Surname{i}' for i in range(2_000)]
+NAMES = [f'Name{i}' for i in range(200)]
+KEYWORDS = [f'keyword {i}' for i in range(300)]
+JOURNALS = [f'Journal of Things {i}' for i in range(50)]
+
+
+def make_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            'id': f'10.1000/{i}',
+            'title': f'Article {i}',
+            'authors': [{'name': rng.choice(NAMES), 'surname': rng.choice(SURNAMES)} for _ in range(rng.randint(1, 5))],
+            'keywords': set(rng.sample(KEYWORDS, rng.randint(2, 6))),
+            'journal': rng.choice(JOURNALS),
+            'year': rng.randint(1990, 2025),
+            'volume': rng.randint(1, 80),
+            'issue': rng.randint(1, 12),
+            'pages': f'{i % 500}-{i % 500 + 12}',
+        }
+
+
+def models_from_rows(rows):
+    # Copy every string the way a JSON decoder would, so nothing is shared by accident.
+    return [construct_trusted(ArticleMetadata, {
+        **row,
+        'authors': [construct_trusted(Author, {'name': ''.join(a['name']), 'surname': ''.join(a['surname'])})
+                    for a in row['authors']],
+        'keywords': {''.join(k) for k in row['keywords']},
+        'journal': ''.join(row['journal']),
+    }) for row in rows]
+
+
+def main():
+    for count in (10_000, 100_000):
+        rows = list(make_rows(count))
+        gc.collect()
+        tracemalloc.start()
+        models = models_from_rows(rows)
+        model_bytes = tracemalloc.get_traced_memory()[0]
+        records = compact_many(models, InternPool())
+        del models
+        gc.collect()
+        compact_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'{count:>7} articles: pydantic {model_bytes / count:8.0f} B/article  '
+              f'compact {compact_bytes / count:8.0f} B/article  ratio {model_bytes / compact_bytes:.1f}x')
+        del records
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Per-record and batch conversion between ArticleMetadataDBSchema and ArticleMetadata, against re-validation."""
+import timeit
+
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.converters import (metadata_api_to_db, metadata_api_to_db_many, metadata_db_to_api,
+                                       metadata_db_to_api_many)
+from article_models.schemas import ArticleMetadata
+
+
+def make_records(count: int):
+    # Batches from one query repeat author lists and keyword strings, here one in ten records.
+    return [ArticleMetadataDBSchema(
+        id=f'10.1000/{i}',
+        title=f'Article {i}',
+        authors=f'John Doe{i % (count // 10 or 1)}, Jane Smith, Mary Ann Nowak',
+        journal='Test Journal',
+        year=2000 + i % 25,
+        volume=i % 50,
+        pages=f'{i}-{i + 10}',
+        keywords='machine learning, research, science',
+    ) for i in range(count)]
+
+
+def revalidate_db_to_api(record: ArticleMetadataDBSchema) -> ArticleMetadata:
+    authors = [dict(zip(('name', 'surname'), author.strip().rsplit(' ', 1))) for author in record.authors.split(',')]
+    return ArticleMetadata(**{**record.model_dump(), 'authors': authors,
+                              'keywords': {keyword.strip() for keyword in record.keywords.split(',')}})
+
+
+def revalidate_api_to_db(article: ArticleMetadata) -> ArticleMetadataDBSchema:
+    return ArticleMetadataDBSchema(**{**article.model_dump(),
+                                      'authors': ', '.join(f'{a.name} {a.surname}' for a in article.authors),
+                                      'keywords': ', '.join(sorted(article.keywords))})
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'{label:<40} {seconds * 1e6:10.1f} us')
+
+
+def main():
+    records = make_records(10_000)
+    articles = metadata_db_to_api_many(records)
+    record, article = records[0], articles[0]
+    bench('db -> api, re-validating', lambda: revalidate_db_to_api(record), 10_000)
+    bench('db -> api, trusted', lambda: metadata_db_to_api(record), 10_000)
+    bench('api -> db, re-validating', lambda: revalidate_api_to_db(article), 10_000)
+    bench('api -> db, trusted', lambda: metadata_api_to_db(article), 10_000)
+    bench('10k db -> api, re-validating', lambda: [revalidate_db_to_api(r) for r in records], 3)
+    bench('10k db -> api, trusted per record', lambda: [metadata_db_to_api(r) for r in records], 3)
+    bench('10k db -> api, trusted batch', lambda: metadata_db_to_api_many(records), 3)
+    bench('10k api -> db, re-validating', lambda: [revalidate_api_to_db(a) for a in articles], 3)
+    bench('10k api -> db, trusted per record', lambda: [metadata_api_to_db(a) for a in articles], 3)
+    bench('10k api -> db, trusted batch', lambda: metadata_api_to_db_many(articles), 3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Raise/catch cost per exception for ModelValidationException, with and without formatting the message."""
+import timeit
+
+from article_models.errors import ModelValidationException
+
+
+def raise_and_catch():
+    try:
+        raise ModelValidationException('AML-1', additional_info='Invalid DOI')
+    except ModelValidationException as e:
+        return e
+
+
+def raise_catch_and_format():
+    return str(raise_and_catch())
+
+
+def raise_catch_and_to_dict():
+    return raise_and_catch().to_dict()
+
+
+def raise_value_error():
+    try:
+        raise ValueError('Invalid DOI')
+    except ValueError as e:
+        return e
+
+
+def main():
+    number = 200_000
+    for label, func in (('ValueError baseline', raise_value_error),
+                        ('raise/catch', raise_and_catch),
+                        ('raise/catch + str()', raise_catch_and_format),
+                        ('raise/catch + to_dict()', raise_catch_and_to_dict)):
+        seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+        print(f'{label:<26} {seconds * 1e9:8.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""InvertedIndex queries against substring scans; pass sizes as arguments, e.g. 1000 10000 50000."""
+import os
+import re
+import random
+import sys
+import tempfile
+import time
+
+from article_models.article_nosql_models import ArticleTextDBSchema, Author
+from article_models.converters import construct_trusted
+from article_models.fulltext import InvertedIndex
+
+WORDS = [f'word{i}' for i in range(20_000)]
+
+
+def make_articles(count: int, words_per_article: int = 500, seed: int = 0):
+    rng = random.Random(seed)
+    return [construct_trusted(ArticleTextDBSchema, {
+        'id': f'10.1000/{i}', 'title': f'Article {i}',
+        'authors': [construct_trusted(Author, {'name': 'Name', 'surname': 'Surname'})],
+        'abstract': ' '.join(rng.choices(WORDS, k=50)), 'keywords': {'science'},
+        'markdown_full_text': '## Introduction\n' + ' '.join(rng.choices(WORDS, k=words_per_article)),
+        'images': None, 'tables': None,
+    }) for i in range(count)]
+
+
+def scan(articles, phrase):
+    pattern = re.compile(rf'\b{re.escape(phrase)}\b', re.IGNORECASE)
+    return [article.id for article in articles
+            if pattern.search(article.abstract) or pattern.search(article.markdown_full_text)]
+
+
+def timed(func, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(sizes):
+    for size in sizes:
+        articles = make_articles(size)
+        index = InvertedIndex()
+        build, _ = timed(lambda: index.add_articles(articles), repeat=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.bin')
+            save, _ = timed(lambda: index.save(path), repeat=1)
+            load, loaded = timed(lambda: InvertedIndex.load(path), repeat=1)
+            print(f'{size} articles, build {build:.2f} s, save {save:.2f} s, load {load * 1e3:.2f} ms, '
+                  f'{os.path.getsize(path) / 2 ** 20:.1f} MiB on disk')
+            with loaded:
+                for label, current in (('in memory', index), ('memory-mapped', loaded)):
+                    phrase = f'{WORDS[1]} {WORDS[2]}'
+                    scanned, expected = timed(lambda: scan(articles, phrase), repeat=3)
+                    phrase_time, result = timed(lambda: current.phrase(phrase))
+                    assert result == expected
+                    search_time, _ = timed(lambda: current.search(f'{WORDS[3]} {WORDS[4]}'))
+                    print(f'  {label:<14} scan {scanned * 1e3:10.3f} ms  phrase {phrase_time * 1e3:8.3f} ms  '
+                          f'bm25 {search_time * 1e3:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [1_000, 10_000])
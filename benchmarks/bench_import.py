@@ -0,0 +1,63 @@
+"""Cold import time of the package modules, measured with `python -X importtime` in fresh interpreters.
+
+Pass --limit-ms to fail when a module's import (dependencies included) takes longer, e.g. in CI:
+    python -m benchmarks.bench_import --limit-ms 400
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+MODULES = ('article_models', 'article_models.article_nosql_models', 'article_models.article_sql_models',
+           'article_models.schemas', 'article_models.logger_config', 'article_models.binary')
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """(self, cumulative) import time in microseconds of every module imported by `import module`."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match[4]] = (int(match[1]), int(match[2]))
+    return times
+
+
+def best_of(module: str, repeat: int) -> Dict[str, Tuple[int, int]]:
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda times: times[module][1])
+
+
+def first_validation_ms(repeat: int) -> float:
+    code = ('import time\nstart = time.perf_counter()\n'
+            'ArticleMetadata(id="10.1000/1", title="T", authors=[{"name": "J", "surname": "D"}], keywords={"k"},'
+            ' journal="J", year=2020, volume=1, pages="1-2")\nprint((time.perf_counter() - start) * 1e3)')
+    return min(float(subprocess.run([sys.executable, '-c', f'from article_models.schemas import ArticleMetadata\n{code}'],
+                                    capture_output=True, text=True, check=True).stdout) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--limit-ms', type=float, default=None)
+    arguments = parser.parse_args()
+
+    failures = []
+    for module in MODULES:
+        times = best_of(module, arguments.repeat)
+        total = times[module][1] / 1e3
+        own = sum(own_time for name, (own_time, _) in times.items() if name.split('.')[0] == 'article_models') / 1e3
+        print(f'{module:<38} {total:8.1f} ms total, {own:6.1f} ms in article_models modules')
+        if arguments.limit_ms is not None and total > arguments.limit_ms:
+            failures.append(module)
+    print(f'{"first ArticleMetadata validation":<38} {first_validation_ms(arguments.repeat):8.1f} ms '
+          '(deferred schema build)')
+    if failures:
+        sys.exit(f'Import time over {arguments.limit_ms} ms: {", ".join(failures)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Validation cost of ArticleMetadata with instrumentation off, with an in-memory sink and after uninstrument()."""
+import timeit
+
+from pydantic import ValidationError
+
+from article_models.instrumentation import InMemorySink, instrument, uninstrument
+from article_models.schemas import ArticleMetadata
+from benchmarks import corpus
+
+
+def validate_all(rows):
+    for row in rows:
+        try:
+            ArticleMetadata(**row)
+        except ValidationError:
+            pass
+
+
+def bench(label, rows, number=5):
+    seconds = min(timeit.repeat(lambda: validate_all(rows), number=number, repeat=5)) / number / len(rows)
+    print(f'{label:<32} {seconds * 1e6:8.2f} us/item')
+    return seconds
+
+
+def main():
+    rows = corpus.payloads('metadata', 2_000, invalid_ratio=0.1)
+    ArticleMetadata(**rows[0])
+    baseline = bench('not instrumented', rows)
+    sink = InMemorySink()
+    instrument(sink, [ArticleMetadata])
+    enabled = bench('instrumented (InMemorySink)', rows)
+    uninstrument([ArticleMetadata])
+    disabled = bench('uninstrumented', rows)
+    print(f'overhead enabled {enabled / baseline - 1:+.1%}, after uninstrument {disabled / baseline - 1:+.1%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Log records per second on the calling thread, with and without the async mode of setup_logger."""
+import os
+import time
+
+from article_models.logger_config import setup_logger, stop_logging
+
+
+class SlowStream:
+    """Stand-in for a stdout that backs up: every write costs a little wall time."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, text):
+        if self.delay:
+            time.sleep(self.delay)
+
+    def flush(self):
+        pass
+
+
+def run(label, count, **kwargs):
+    logger = setup_logger('article_models_library', **kwargs)
+    start = time.perf_counter()
+    for number in range(count):
+        logger.info('Validated article %s', number)
+    elapsed = time.perf_counter() - start
+    stop_logging()
+    print(f'{label:<34} {count / elapsed:12,.0f} records/s on the caller')
+
+
+def main():
+    count = 50_000
+    with open(os.devnull, 'w') as devnull:
+        run('sync, /dev/null', count, stream=devnull)
+        run('async, /dev/null', count, stream=devnull, async_mode=True, queue_size=count)
+    run('sync, slow stream', 2_000, stream=SlowStream(0.0001))
+    run('async, slow stream (drop)', 2_000, stream=SlowStream(0.0001), async_mode=True, queue_size=1_000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""SectionTree.update after a one-word edit against a full parse; pass section counts, e.g. 100 1000 5000."""
+import random
+import sys
+import time
+
+from article_models.article_nosql_models import Image, Table
+from article_models.markdown_sections import SectionTree
+
+
+def make_text(sections: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = []
+    for number in range(sections):
+        parts.append(f'{"#" * rng.randint(1, 3)} Section {number}\n')
+        parts.append(' '.join(rng.choice(['word', 'data', f'fig.{number % 50}', f'tab.{number % 20}'])
+                              for _ in range(300)) + '\n')
+    return ''.join(parts)
+
+
+def timed(func, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(sizes):
+    images = [Image(image_number=f'fig.{number}', file_path=f'/images/{number}.png') for number in range(50)]
+    tables = [Table(table_number=f'tab.{number}', file_path=f'/tables/{number}.csv') for number in range(20)]
+    for size in sizes:
+        text = make_text(size)
+        middle = text.index('word', len(text) // 2)
+        edited = text[:middle] + 'WORD' + text[middle + 4:]
+        full, _ = timed(lambda: SectionTree(edited, images, tables), repeat=3)
+        tree = SectionTree(text, images, tables)
+
+        def update():
+            tree.updated(edited).updated(text)
+
+        incremental, _ = timed(update)
+        print(f'{size} sections, {len(text) / 2 ** 20:.1f} MiB: full parse {full * 1e3:8.2f} ms  '
+              f'update {incremental / 2 * 1e3:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [100, 1_000, 5_000])
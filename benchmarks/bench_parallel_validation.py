@@ -0,0 +1,37 @@
+"""Scaling of validate_parallel from 1 to N worker processes on markdown-heavy ArticleTextDBSchema lines."""
+import json
+import os
+import time
+
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.parallel_validation import validate_parallel
+
+
+def make_lines(count: int, text_size: int = 200_000):
+    paragraph = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. '
+    markdown = '## Introduction\n' + paragraph * (text_size // len(paragraph))
+    return [json.dumps({
+        'id': f'10.1000/{i}',
+        'title': f'Article {i}',
+        'authors': [{'name': 'John', 'surname': 'Doe'}, {'name': 'Jane', 'surname': 'Smith'}],
+        'abstract': paragraph,
+        'keywords': ['science', 'research'],
+        'markdown_full_text': markdown,
+    }).encode() for i in range(count)]
+
+
+def main():
+    lines = make_lines(2_000)
+    start = time.perf_counter()
+    for line in lines:
+        ArticleTextDBSchema.model_validate_json(line)
+    print(f'in-process: {time.perf_counter() - start:.3f} s')
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        count = sum(len(result.valid) for result in validate_parallel(ArticleTextDBSchema, lines, workers=workers,
+                                                                     chunk_size=50))
+        print(f'{workers:>2} workers: {time.perf_counter() - start:.3f} s ({count} documents)')
+
+
+if __name__ == '__main__':
+    main()
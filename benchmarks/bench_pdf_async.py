@@ -0,0 +1,56 @@
+"""Loading 32 PDFs of 4 MiB: blocking read + second-pass hash against load_pdfs, with the event loop's latency."""
+import asyncio
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+from article_models.article_sql_models import ArticlePDFDBSchema
+from article_models.pdf_async import load_pdfs
+from benchmarks import corpus
+
+
+def blocking(records):
+    return [hashlib.sha256(Path(record.file_path).read_bytes()).hexdigest() for record in records]
+
+
+async def loop_latency(work):
+    """Run work and return its result with the worst delay seen by a 1 ms ticker on the same loop."""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.002)  # let the ticker start before blocking work runs
+    result = await work()
+    done = True
+    await task
+    return result, worst
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        records = []
+        for i in range(32):
+            path = Path(directory, f'{i}.pdf')
+            path.write_bytes(corpus.pdf_bytes(4 * 2 ** 20, seed=i))
+            records.append(ArticlePDFDBSchema(id=f'10.1000/{i}', file_path=str(path)))
+
+        async def run_blocking():
+            return blocking(records)
+
+        cases = (('blocking read + hash', run_blocking), ('load_pdfs(concurrency=8)', lambda: load_pdfs(records)))
+        for label, work in cases:
+            start = time.perf_counter()
+            _, worst = asyncio.run(loop_latency(work))
+            print(f'{label:<28} {time.perf_counter() - start:8.3f} s   worst loop stall {worst * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Disk usage and put time of PDFBlobStore against one file per DOI, for 64 DOIs sharing 16 distinct 2 MiB PDFs."""
+import tempfile
+import time
+from pathlib import Path
+
+from article_models.pdf_store import PDFBlobStore
+from article_models.schemas import ArticlePDFFile
+from benchmarks import corpus
+
+
+def main():
+    payloads = [corpus.pdf_bytes(2 * 2 ** 20, seed=i) for i in range(16)]
+    pdfs = [ArticlePDFFile(id=f'10.1000/{i}', pdf_file=payloads[i % len(payloads)]) for i in range(64)]
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        for pdf in pdfs:
+            Path(directory, f'{pdf.id.replace("/", "_")}.pdf').write_bytes(pdf.read_bytes())
+        plain = time.perf_counter() - start
+        plain_bytes = sum(path.stat().st_size for path in Path(directory).iterdir())
+    with tempfile.TemporaryDirectory() as directory:
+        store = PDFBlobStore(directory)
+        start = time.perf_counter()
+        store.put_many(pdfs)
+        stored = time.perf_counter() - start
+        stats = store.stats()
+    print(f'{"one file per DOI":<20} {plain:8.3f} s {plain_bytes / 2 ** 20:8.1f} MiB')
+    print(f'{"PDFBlobStore":<20} {stored:8.3f} s {stats.bytes / 2 ** 20:8.1f} MiB  ({stats.blobs} blobs, {stats.dois} DOIs)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""model_dump_json throughput of ResponseSchema with 1k/10k ArticleMetadata items: Any, typed and RawJSON data."""
+import timeit
+from typing import List
+
+from pydantic import TypeAdapter
+
+from article_models.schemas import ArticleMetadata, RawJSON, ResponseSchema, StatusEnum
+
+
+def make_articles(count: int) -> List[ArticleMetadata]:
+    return [ArticleMetadata(id=f'10.1000/{i}', title=f'Article {i}',
+                            authors=[{'name': 'John', 'surname': 'Doe'}, {'name': 'Jane', 'surname': 'Smith'}],
+                            keywords={'science', 'research'}, journal='Test Journal', year=2020, volume=1,
+                            issue=2, pages='10-20') for i in range(count)]
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'{label:<36} {seconds * 1e3:9.2f} ms')
+
+
+def main():
+    envelope = {'status': StatusEnum.SUCCESS, 'message': 'OK', 'http_status': 200}
+    for count in (1_000, 10_000):
+        articles = make_articles(count)
+        number = max(1, 20_000 // count)
+        untyped = ResponseSchema(**envelope, data=articles)
+        typed = ResponseSchema[List[ArticleMetadata]].model_construct(**envelope, data=articles)
+        cached = TypeAdapter(List[ArticleMetadata]).dump_json(articles)
+        raw = ResponseSchema(**envelope, data=RawJSON(cached))
+        print(f'{count} items')
+        bench('  Any data, model_dump_json', untyped.model_dump_json, number)
+        bench('  typed data, model_dump_json', typed.model_dump_json, number)
+        bench('  typed data, dump_json', typed.dump_json, number)
+        bench('  RawJSON data, dump_json', raw.dump_json, number)
+
+
+if __name__ == '__main__':
+    main()
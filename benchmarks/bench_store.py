@@ -0,0 +1,60 @@
+"""ArticleStore queries against linear scans; pass sizes as arguments, e.g. 10000 100000 1000000."""
+import random
+import sys
+import time
+
+from article_models.article_nosql_models import Author
+from article_models.converters import construct_trusted
+from article_models.schemas import ArticleMetadata
+from article_models.store import ArticleStore
+
+SURNAMES = [f'Surname{i}' for i in range(5_000)]
+KEYWORDS = [f'keyword{i}' for i in range(1_000)]
+
+
+def make_articles(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [construct_trusted(ArticleMetadata, {
+        'id': f'10.1000/{i}', 'title': f'Article {i}',
+        'authors': [construct_trusted(Author, {'name': 'Name', 'surname': rng.choice(SURNAMES)}) for _ in range(3)],
+        'keywords': set(rng.sample(KEYWORDS, 4)), 'journal': 'Journal', 'year': rng.randint(1950, 2025),
+        'volume': 1, 'issue': None, 'pages': '1-2',
+    }) for i in range(count)]
+
+
+def linear(articles, keywords=(), surname=None, year_min=None, year_max=None):
+    return [article for article in articles
+            if all(keyword in article.keywords for keyword in keywords)
+            and (surname is None or any(author.surname == surname for author in article.authors))
+            and (year_min is None or article.year >= year_min)
+            and (year_max is None or article.year <= year_max)]
+
+
+def timed(func, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(sizes):
+    queries = {
+        'keyword': {'keywords': ['keyword1']},
+        'keyword + surname': {'keywords': ['keyword1'], 'surname': 'Surname1'},
+        'surname + year range': {'surname': 'Surname2', 'year_min': 1990, 'year_max': 2000},
+        'narrow year range': {'year_min': 2000, 'year_max': 2000},
+    }
+    for size in sizes:
+        articles = make_articles(size)
+        build, store = timed(lambda: ArticleStore(articles), repeat=1)
+        print(f'{size} articles, index build {build:.2f} s')
+        for label, query in queries.items():
+            scan, expected = timed(lambda: linear(articles, **query), repeat=3)
+            indexed, result = timed(lambda: store.query(**query))
+            assert {article.id for article in result} == {article.id for article in expected}
+            print(f'  {label:<22} scan {scan * 1e3:10.3f} ms  index {indexed * 1e3:8.3f} ms  '
+                  f'({len(result)} results)')
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [10_000, 100_000])
@@ -0,0 +1,52 @@
+"""Compare per-row model construction with validate_many on ArticleMetadataDBSchema rows."""
+import timeit
+
+from pydantic import ValidationError
+
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.bulk_validation import validate_many
+
+
+def make_rows(count: int, invalid_every: int = 10):
+    rows = []
+    for i in range(count):
+        row = {
+            'id': f'10.1000/{i}',
+            'title': f'Article {i}',
+            'authors': 'John Doe, Jane Smith',
+            'journal': 'Test Journal',
+            'year': 2000 + i % 25,
+            'volume': i % 50,
+            'pages': f'{i}-{i + 10}',
+            'keywords': 'science, research'
+        }
+        if invalid_every and i % invalid_every == 0:
+            row['pages'] = 'invalid'
+        rows.append(row)
+    return rows
+
+
+def per_row(rows):
+    valid, errors = [], {}
+    for index, row in enumerate(rows):
+        try:
+            valid.append(ArticleMetadataDBSchema(**row))
+        except ValidationError as e:
+            errors[index] = e.errors()
+    return valid, errors
+
+
+def main():
+    for count, invalid_every in ((1_000, 0), (10_000, 0), (100_000, 0), (10_000, 10), (100_000, 10)):
+        rows = make_rows(count, invalid_every)
+        repeat = max(1, 100_000 // count)
+        loop = min(timeit.repeat(lambda: per_row(rows), number=repeat, repeat=3)) / repeat
+        bulk = min(timeit.repeat(lambda: validate_many(ArticleMetadataDBSchema, rows),
+                                 number=repeat, repeat=3)) / repeat
+        print(f'{count:>7} rows ({"1 in " + str(invalid_every) if invalid_every else "no"} invalid): '
+              f'per-row {loop * 1e3:9.2f} ms  validate_many {bulk * 1e3:9.2f} ms  '
+              f'speedup x{loop / bulk:.2f}')
+
+
+if __name__ == '__main__':
+    main()
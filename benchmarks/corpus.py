@@ -0,0 +1,149 @@
+"""Deterministic synthetic articles for the benchmarks: valid payloads, invalid ones and multi-MB PDFs.
+
+Every generator takes a seed, so two runs (or two machines) benchmark exactly the same data.
+"""
+import json
+import random
+from typing import Any, Callable, Dict, List
+
+WORDS = ('model', 'protein', 'network', 'learning', 'data', 'analysis', 'structure', 'result', 'method', 'sample',
+         'measurement', 'theory', 'signal', 'energy', 'cell', 'graph', 'error', 'function', 'system', 'field')
+NAMES = ('John', 'Jane', 'Maria', 'Piotr', 'Anna', 'Wei', 'Aisha', 'Carlos', 'Yuki', 'Olga')
+SURNAMES = ('Doe', 'Smith', 'Nowak', 'Kowalski', 'Zhang', 'Garcia', 'Tanaka', 'Ivanova', 'Khan', 'Müller')
+KEYWORDS = ('machine learning', 'biology', 'physics', 'chemistry', 'statistics', 'genomics', 'optics', 'robotics')
+
+Payload = Dict[str, Any]
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def markdown_text(rng: random.Random, size: int) -> str:
+    """Markdown of roughly size characters with headings, paragraphs, figure and table references and a code block."""
+    parts: List[str] = []
+    length = section = 0
+    while length < size:
+        section += 1
+        block = [f'## Section {section}\n']
+        for _ in range(rng.randint(2, 6)):
+            block.append(' '.join(sentence(rng) for _ in range(rng.randint(3, 8))) + f' See fig.{section}.1.\n\n')
+        if section % 5 == 0:
+            block.append('```python\nresult = model.fit(data)\n```\n\n')
+        if section % 3 == 0:
+            block.append(f'| a | b |\n|---|---|\n| 1 | 2 |\n\nTable tab.{section}.1 summarises the results.\n\n')
+        chunk = ''.join(block)
+        parts.append(chunk)
+        length += len(chunk)
+    return ''.join(parts)[:size]
+
+
+def authors(rng: random.Random, count: int) -> List[Dict[str, str]]:
+    return [{'name': rng.choice(NAMES), 'surname': rng.choice(SURNAMES)} for _ in range(count)]
+
+
+def metadata_payload(rng: random.Random, index: int) -> Payload:
+    first_page = rng.randint(1, 500)
+    return {
+        'id': f'10.{rng.randint(1000, 99999)}/article.{index}',
+        'title': sentence(rng, rng.randint(6, 16)),
+        'authors': authors(rng, rng.randint(1, 8)),
+        'keywords': set(rng.sample(KEYWORDS, rng.randint(1, 5))),
+        'journal': f'Journal of {rng.choice(WORDS).capitalize()}',
+        'year': rng.randint(1950, 2025),
+        'volume': rng.randint(1, 120),
+        'issue': rng.choice([None, rng.randint(1, 12)]),
+        'pages': f'{first_page}-{first_page + rng.randint(1, 40)}',
+    }
+
+
+def metadata_db_payload(rng: random.Random, index: int) -> Payload:
+    payload = metadata_payload(rng, index)
+    payload['authors'] = ', '.join(f'{author["name"]} {author["surname"]}' for author in payload['authors'])
+    payload['keywords'] = ', '.join(sorted(payload['keywords']))
+    return payload
+
+
+def article_text_payload(rng: random.Random, index: int, text_size: int = 64 * 1024) -> Payload:
+    metadata = metadata_payload(rng, index)
+    figures = rng.randint(0, 12)
+    tables = rng.randint(0, 6)
+    return {
+        'id': metadata['id'],
+        'title': metadata['title'],
+        'authors': metadata['authors'],
+        'abstract': ' '.join(sentence(rng) for _ in range(rng.randint(5, 12))),
+        'keywords': metadata['keywords'],
+        'markdown_full_text': markdown_text(rng, text_size),
+        'images': [{'image_number': f'fig.{number}.1', 'file_path': f'/images/{index}/fig{number}.png'}
+                   for number in range(1, figures + 1)],
+        'tables': [{'table_number': f'tab.{number}.1', 'file_path': f'/tables/{index}/tab{number}.csv'}
+                   for number in range(1, tables + 1)],
+    }
+
+
+def pdf_db_payload(rng: random.Random, index: int) -> Payload:
+    return {'id': f'10.{rng.randint(1000, 99999)}/article.{index}',
+            'file_path': rng.choice([None, f'/pdfs/{index}.pdf'])}
+
+
+def pdf_bytes(size: int, seed: int = 0) -> bytes:
+    """A PDF-looking payload of exactly size bytes; the body is random, like compressed PDF streams."""
+    header = b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n'
+    trailer = b'\n%%EOF\n'
+    return header + random.Random(seed).randbytes(max(size - len(header) - len(trailer), 0)) + trailer
+
+
+# One way to break each kind of payload, applied in turn to the invalid rows.
+INVALIDATIONS: Dict[str, List[Callable[[Payload], None]]] = {
+    'metadata': [
+        lambda payload: payload.update(id='not-a-doi'),
+        lambda payload: payload.update(pages='12 to 20'),
+        lambda payload: payload.update(year=-1),
+        lambda payload: payload.update(authors=[]),
+        lambda payload: payload.update(title=''),
+    ],
+    'text': [
+        lambda payload: payload.update(id='not-a-doi'),
+        lambda payload: payload.update(authors=[{'name': 'John'}]),
+        lambda payload: payload.update(markdown_full_text=''),
+        lambda payload: payload['images'].append({'image_number': '', 'file_path': '/images/x.png'}),
+    ],
+    'metadata_db': [
+        lambda payload: payload.update(id='not-a-doi'),
+        lambda payload: payload.update(pages='12 to 20'),
+        lambda payload: payload.update(volume=-3),
+        lambda payload: payload.update(keywords=''),
+    ],
+    'pdf_db': [
+        lambda payload: payload.update(id='not-a-doi'),
+        lambda payload: payload.update(file_path='/pdfs/<bad>.pdf'),
+    ],
+}
+
+GENERATORS = {
+    'metadata': metadata_payload,
+    'metadata_db': metadata_db_payload,
+    'text': article_text_payload,
+    'pdf_db': pdf_db_payload,
+}
+
+
+def payloads(kind: str, count: int, invalid_ratio: float = 0.0, seed: int = 0, **options) -> List[Payload]:
+    """count payloads of one kind; every 1/invalid_ratio-th one is broken by one of INVALIDATIONS[kind]."""
+    rng = random.Random(seed)
+    generate = GENERATORS[kind]
+    invalidations = INVALIDATIONS[kind]
+    every = round(1 / invalid_ratio) if invalid_ratio else 0
+    rows = []
+    for index in range(count):
+        payload = generate(rng, index, **options)
+        if every and index % every == every - 1:
+            invalidations[(index // every) % len(invalidations)](payload)
+        rows.append(payload)
+    return rows
+
+
+def to_json(payload: Payload) -> bytes:
+    """JSON encoding of a payload as another service would send it: sets become sorted lists."""
+    return json.dumps(payload, default=sorted, ensure_ascii=False).encode()
@@ -0,0 +1,209 @@
+"""Benchmark suite for the validation, serialization and conversion hot paths of every model.
+
+    python -m benchmarks.suite --save baseline.json          # record a baseline
+    python -m benchmarks.suite --compare baseline.json       # exit 1 if a case got slower than --threshold
+    python -m benchmarks.suite --quick -k ArticleMetadata    # smaller corpus, only matching cases
+
+Timings are the best of --repeat runs, per item, so baselines taken with and without --quick are comparable.
+Compare baselines recorded on the same machine only.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Sequence
+
+import pydantic
+from pydantic import ValidationError
+
+from article_models.article_nosql_models import ArticleTextDBSchema, Author, Image, LazyArticleTextDBSchema, Table
+from article_models.article_sql_models import ArticleMetadataDBSchema, ArticlePDFDBSchema
+from article_models.converters import metadata_api_to_db_many, metadata_db_to_api_many
+from article_models.schemas import ArticleMetadata, ArticlePDFFile, ResponseSchema, StatusEnum
+from benchmarks import corpus
+
+DEFAULT_THRESHOLD = 0.15
+
+
+class Case(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+    items: int  # items processed per call, timings are reported per item
+
+
+def _validate_all(model: type, rows: Sequence[Dict[str, Any]]) -> int:
+    failures = 0
+    for row in rows:
+        try:
+            model(**row)
+        except ValidationError:
+            failures += 1
+    return failures
+
+
+def model_cases(label: str, model: type, rows: List[Dict[str, Any]],
+                invalid_rows: List[Dict[str, Any]]) -> Iterator[Case]:
+    """Construction, JSON validation, dumps and the error path for one model."""
+    instances = [model(**row) for row in rows]
+    documents = [corpus.to_json(row) for row in rows]
+    if _validate_all(model, invalid_rows) == 0:
+        raise AssertionError(f'The invalid {label} corpus has no invalid rows')
+    yield Case(f'{label}.construct', lambda: [model(**row) for row in rows], len(rows))
+    yield Case(f'{label}.model_validate_json', lambda: [model.model_validate_json(document) for document in documents],
+               len(rows))
+    yield Case(f'{label}.model_dump', lambda: [instance.model_dump() for instance in instances], len(rows))
+    yield Case(f'{label}.model_dump_json', lambda: [instance.model_dump_json() for instance in instances], len(rows))
+    yield Case(f'{label}.construct_with_invalid', lambda: _validate_all(model, invalid_rows), len(invalid_rows))
+
+
+def pdf_cases(size: int, directory: str) -> Iterator[Case]:
+    label = f'ArticlePDFFile[{size // 2 ** 20}MiB]'
+    payload = corpus.pdf_bytes(size)
+    path = Path(directory, f'{size}.pdf')
+    path.write_bytes(payload)
+    in_memory = ArticlePDFFile(id='10.1000/pdf', pdf_file=payload)
+    on_disk = ArticlePDFFile(id='10.1000/pdf', pdf_file=path)
+    yield Case(f'{label}.construct_bytes', lambda: ArticlePDFFile(id='10.1000/pdf', pdf_file=payload), 1)
+    yield Case(f'{label}.construct_bytesio', lambda: ArticlePDFFile(id='10.1000/pdf', pdf_file=BytesIO(payload)), 1)
+    yield Case(f'{label}.construct_path', lambda: ArticlePDFFile(id='10.1000/pdf', pdf_file=path), 1)
+    yield Case(f'{label}.model_dump', lambda: in_memory.model_dump(), 1)
+    yield Case(f'{label}.read_bytes_memory', lambda: in_memory.read_bytes(), 1)
+    yield Case(f'{label}.read_bytes_path', lambda: on_disk.read_bytes(), 1)
+    yield Case(f'{label}.iter_chunks_path', lambda: sum(len(chunk) for chunk in on_disk.iter_chunks()), 1)
+
+
+def build_cases(quick: bool, directory: str) -> Iterator[Case]:
+    count = 200 if quick else 2_000
+    text_count = 20 if quick else 200
+    metadata = corpus.payloads('metadata', count)
+    metadata_db = corpus.payloads('metadata_db', count)
+    texts = corpus.payloads('text', text_count)
+    large_texts = corpus.payloads('text', max(text_count // 20, 2), text_size=2 ** 20)
+    pdf_db = corpus.payloads('pdf_db', count)
+
+    yield from model_cases('ArticleMetadata', ArticleMetadata, metadata,
+                           corpus.payloads('metadata', count, invalid_ratio=0.1, seed=1))
+    yield from model_cases('ArticleMetadataDBSchema', ArticleMetadataDBSchema, metadata_db,
+                           corpus.payloads('metadata_db', count, invalid_ratio=0.1, seed=1))
+    yield from model_cases('ArticleTextDBSchema', ArticleTextDBSchema, texts,
+                           corpus.payloads('text', text_count, invalid_ratio=0.1, seed=1))
+    yield from model_cases('ArticleTextDBSchema[1MiB]', ArticleTextDBSchema, large_texts,
+                           corpus.payloads('text', len(large_texts), invalid_ratio=0.5, seed=1, text_size=2 ** 20))
+    yield from model_cases('ArticlePDFDBSchema', ArticlePDFDBSchema, pdf_db,
+                           corpus.payloads('pdf_db', count, invalid_ratio=0.1, seed=1))
+    authors = [author for row in metadata for author in row['authors']]
+    yield from model_cases('Author', Author, authors, authors[:-1] + [{'name': 'John', 'surname': ''}])
+    images = [image for row in texts for image in row['images']]
+    yield from model_cases('Image', Image, images, images[:-1] + [{'image_number': '', 'file_path': '/x.png'}])
+    tables = [table for row in texts for table in row['tables']]
+    yield from model_cases('Table', Table, tables, tables[:-1] + [{'table_number': 'tab.1', 'file_path': ''}])
+
+    documents = [corpus.to_json(row) for row in texts]
+    yield Case('LazyArticleTextDBSchema.model_validate_json',
+               lambda: [LazyArticleTextDBSchema.model_validate_json(document) for document in documents], len(texts))
+
+    articles = [ArticleMetadata(**row) for row in metadata]
+    response = ResponseSchema[List[ArticleMetadata]](status=StatusEnum.SUCCESS, message='OK', data=articles,
+                                                     http_status=200)
+    envelope = response.model_dump_json()
+    response_model = ResponseSchema[List[ArticleMetadata]]
+    yield Case('ResponseSchema.model_dump_json', response.model_dump_json, len(articles))
+    yield Case('ResponseSchema.dump_json', response.dump_json, len(articles))
+    yield Case('ResponseSchema.model_validate_json', lambda: response_model.model_validate_json(envelope),
+               len(articles))
+
+    records = [ArticleMetadataDBSchema(**row) for row in metadata_db]
+    yield Case('converters.metadata_db_to_api_many', lambda: metadata_db_to_api_many(records), len(records))
+    yield Case('converters.metadata_api_to_db_many', lambda: metadata_api_to_db_many(articles), len(articles))
+
+    for size in (2 ** 20, 8 * 2 ** 20):
+        yield from pdf_cases(size, directory)
+
+
+def measure(case: Case, repeat: int) -> float:
+    """Best time per item, in seconds, over repeat runs of at least 0.2 s each."""
+    timer = timeit.Timer(case.func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number / case.items
+
+
+def run(quick: bool = False, repeat: int = 5, filters: Sequence[str] = ()) -> Dict[str, Any]:
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for case in build_cases(quick, directory):
+            if filters and not any(pattern in case.name for pattern in filters):
+                continue
+            seconds = measure(case, repeat)
+            results[case.name] = {'seconds_per_item': seconds, 'items_per_call': case.items}
+            print(f'{case.name:<56} {seconds * 1e6:12.2f} us/item', flush=True)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pydantic': pydantic.VERSION,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Print current against baseline per case and return the names of cases slower by more than threshold."""
+    regressions = []
+    baseline_results = baseline['results']
+    for name, result in current['results'].items():
+        previous = baseline_results.get(name)
+        if previous is None:
+            print(f'{name:<56} new case')
+            continue
+        ratio = result['seconds_per_item'] / previous['seconds_per_item']
+        status = ''
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = 'faster'
+        print(f'{name:<56} {previous["seconds_per_item"] * 1e6:12.2f} -> {result["seconds_per_item"] * 1e6:12.2f} '
+              f'us/item  x{ratio:5.2f} {status}')
+    for name in sorted(baseline_results.keys() - current['results'].keys()):
+        print(f'{name:<56} missing from this run')
+    meta = baseline.get('meta', {})
+    if (meta.get('python'), meta.get('pydantic')) != (current['meta']['python'], current['meta']['pydantic']):
+        print(f'Baseline was recorded with Python {meta.get("python")} and pydantic {meta.get("pydantic")}')
+    return regressions
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--save', type=Path, help='write the results to this JSON baseline')
+    parser.add_argument('--compare', type=Path, help='compare the results with this JSON baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown reported as a regression (default %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--quick', action='store_true', help='smaller corpus for a fast run')
+    parser.add_argument('-k', dest='filters', action='append', default=[], help='only cases containing this text')
+    arguments = parser.parse_args(argv)
+
+    current = run(quick=arguments.quick, repeat=arguments.repeat, filters=arguments.filters)
+    if arguments.save:
+        arguments.save.write_text(json.dumps(current, indent=2, sort_keys=True))
+    if arguments.compare:
+        baseline = json.loads(arguments.compare.read_text())
+        if arguments.filters:
+            baseline['results'] = {name: result for name, result in baseline['results'].items()
+                                   if any(pattern in name for pattern in arguments.filters)}
+        regressions = compare(current, baseline, arguments.threshold)
+        if regressions:
+            sys.exit(f'{len(regressions)} case(s) slower than the baseline by more than {arguments.threshold:.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 import pytest
-from article_models.article_nosql_models import ArticleTextDBSchema, Author, Image, Table
+from pydantic import BaseModel, ValidationError, model_validator
+from article_models.article_nosql_models import ArticleTextDBSchema, Author, Image, Table, LazyArticleTextDBSchema, HEAVY_FIELDS
+from article_models.projection import project_model
 
 test_cases = [
     {
@@ -147,3 +149,81 @@ def test_article_text(test_data):
     else:
         with pytest.raises(test_data['expected_exception']):
             ArticleTextDBSchema(**test_data['article'])
+
+
+valid_article = test_cases[0]['article']
+
+
+@pytest.mark.parametrize('fields', [['id', 'title'], ['id', 'title', 'authors', 'keywords']])
+def test_article_text_project(fields):
+    projection = ArticleTextDBSchema.project(fields)
+    article = projection(**valid_article)
+
+    assert list(projection.model_fields) == fields
+    assert article.model_dump() == {field: ArticleTextDBSchema(**valid_article).model_dump()[field] for field in fields}
+    assert ArticleTextDBSchema.project(reversed(fields)) is projection
+
+
+def test_article_text_project_keeps_validators():
+    with pytest.raises(ValueError):
+        ArticleTextDBSchema.project(['keywords'])(keywords=['science'])
+    with pytest.raises(ValueError):
+        ArticleTextDBSchema.project(['unknown_field'])
+
+
+def test_project_model_keeps_validator_modes():
+    class Model(BaseModel):
+        low: int
+        high: int = 10
+
+        @model_validator(mode='before')
+        @classmethod
+        def default_low(cls, values):
+            return {'low': 0, **values}
+
+        @model_validator(mode='after')
+        def check_order(self):
+            if self.low > 100:
+                raise ValueError('low is too large')
+            return self
+
+    projection = project_model(Model, ['low'])
+    assert projection().low == 0
+    with pytest.raises(ValidationError, match='low is too large'):
+        projection(low=101)
+
+
+def test_lazy_article_text_from_json():
+    full_article = ArticleTextDBSchema(**valid_article)
+    lazy_article = LazyArticleTextDBSchema.model_validate_json(full_article.model_dump_json())
+
+    assert lazy_article.title == full_article.title
+    assert lazy_article.markdown_full_text == full_article.markdown_full_text
+    assert lazy_article.images == full_article.images
+    assert lazy_article.to_full() == full_article
+
+
+def test_lazy_article_text_loaders_and_deferred_validation():
+    calls = []
+    lazy_article = LazyArticleTextDBSchema(**{**valid_article, 'markdown_full_text': lambda: calls.append(1) or 'Text',
+                                              'tables': [{'table_number': '', 'file_path': ''}]})
+
+    assert calls == []
+    assert lazy_article.markdown_full_text == 'Text'
+    assert lazy_article.markdown_full_text == 'Text'
+    assert calls == [1]
+    with pytest.raises(ValueError):
+        lazy_article.tables
+    with pytest.raises(ValueError):
+        lazy_article.tables
+    with pytest.raises(ValueError):
+        lazy_article.to_full()
+
+
+def test_lazy_article_text_missing_heavy_fields():
+    article = {key: value for key, value in valid_article.items() if key not in HEAVY_FIELDS}
+    lazy_article = LazyArticleTextDBSchema(**article)
+
+    assert lazy_article.images == []
+    with pytest.raises(ValueError):
+        lazy_article.markdown_full_text
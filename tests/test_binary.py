@@ -0,0 +1,108 @@
+import math
+from io import BytesIO
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from article_models import binary
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.article_sql_models import ArticleMetadataDBSchema, ArticlePDFDBSchema
+from article_models.frozen_models import FrozenArticleMetadata, FrozenArticleTextDBSchema
+from article_models.schemas import ArticleMetadata, ArticlePDFFile, RawJSON, ResponseSchema, StatusEnum
+
+metadata = ArticleMetadata(id='10.1000/1', title='Title', authors=[{'name': 'John', 'surname': 'Doe'}],
+                           keywords={'science', 'AI'}, journal='Journal', year=2020, volume=1, pages='1-2')
+text = ArticleTextDBSchema(id='10.1000/2', title='Title', authors=[{'name': 'John', 'surname': 'Doe'}],
+                           abstract='Abstract', keywords={'science'}, markdown_full_text='# Title\n' + 'ż' * 70_000,
+                           images=[{'image_number': 'fig.1', 'file_path': '/images/fig1.png'}])
+db_metadata = ArticleMetadataDBSchema(id='10.1000/3', title='Title', authors='John Doe', journal='Journal',
+                                      year=2020, volume=1, issue=-7, pages='1-2', keywords='AI, science')
+pdf_record = ArticlePDFDBSchema(id='10.1000/4', file_path='/pdfs/4.pdf', is_pdf_available=True)
+response = ResponseSchema[List[ArticleMetadata]](status=StatusEnum.SUCCESS, message='OK', data=[metadata],
+                                                 http_status=200)
+
+roundtrip_cases = [
+    {'test_description': 'ArticleMetadata', 'instance': metadata},
+    {'test_description': 'ArticleTextDBSchema with long text', 'instance': text},
+    {'test_description': 'ArticleMetadataDBSchema', 'instance': db_metadata},
+    {'test_description': 'ArticlePDFDBSchema', 'instance': pdf_record},
+    {'test_description': 'ResponseSchema with model data', 'instance': response},
+    {'test_description': 'Frozen model', 'instance': FrozenArticleTextDBSchema.from_model(text)},
+]
+
+
+@pytest.mark.parametrize('compression', binary.available_compressions())
+@pytest.mark.parametrize('trusted', [False, True])
+@pytest.mark.parametrize('test_data', roundtrip_cases, ids=[case['test_description'] for case in roundtrip_cases])
+def test_binary_roundtrip(test_data, trusted, compression):
+    instance = test_data['instance']
+    decoded = binary.loads(type(instance), binary.dumps(instance, compression=compression), trusted=trusted)
+    assert decoded == instance
+    assert type(decoded) is type(instance)
+
+
+def test_binary_is_smaller_than_json():
+    assert len(binary.dumps(metadata)) < len(metadata.model_dump_json()) / 2
+
+
+def test_binary_pdf_file():
+    source = ArticlePDFFile(id='10.1000/5', pdf_file=BytesIO(b'%PDF-1.7' * 1000))
+    for trusted in (False, True):
+        decoded = binary.loads(ArticlePDFFile, binary.dumps(source, compression='zlib'), trusted=trusted)
+        assert decoded.is_available and decoded.read_bytes() == source.read_bytes()
+    empty = binary.loads(ArticlePDFFile, binary.dumps(ArticlePDFFile(id='10.1000/5')))
+    assert empty.pdf_file is None and not empty.is_available
+
+
+def test_binary_many_and_frozen_variants():
+    encoded = binary.dumps_many([metadata, metadata.model_copy(update={'id': '10.1000/9'})])
+    assert [article.id for article in binary.loads_many(ArticleMetadata, encoded)] == ['10.1000/1', '10.1000/9']
+    frozen = binary.loads_many(FrozenArticleMetadata, encoded, trusted=True)
+    assert frozen[0].authors[0].surname == 'Doe' and frozen[0].keywords == frozenset({'science', 'AI'})
+    assert binary.loads_many(ArticleMetadata, binary.dumps_many([], model=ArticleMetadata)) == []
+    with pytest.raises(ValueError):
+        binary.loads(ArticleMetadata, encoded)
+
+
+@pytest.mark.parametrize('value', [0, 127, 128, 255, 65_536, 2 ** 40, 2 ** 64 - 1, -1, -32, -33, -129, -2 ** 63,
+                                   1.5, math.inf, True, False, None, '', 'x' * 40, 'y' * 70_000, b'\x00\x01',
+                                   [1, [2, 'three']], {'key': [1, 2]}, {1, 2}])
+def test_binary_generic_values(value):
+    out = bytearray()
+    binary._write_any(value, out)
+    decoded, end = binary._read(bytes(out), 0)
+    assert end == len(out)
+    assert (bytes(decoded) if isinstance(decoded, memoryview) else decoded) == value
+
+
+def test_binary_raw_json_data():
+    raw = ResponseSchema(status=StatusEnum.SUCCESS, message='OK', data=RawJSON(b'{"a": [1, 2]}'), http_status=200)
+    assert binary.loads(ResponseSchema, binary.dumps(raw)).data == {'a': [1, 2]}
+
+
+def test_binary_rejects_bad_payloads():
+    encoded = binary.dumps(metadata)
+    with pytest.raises(ValueError, match='not in the article models binary format'):
+        binary.loads(ArticleMetadata, b'XYZ' + encoded[3:])
+    with pytest.raises(ValueError, match='different schema'):
+        binary.loads(ArticleMetadataDBSchema, encoded)
+    with pytest.raises(ValueError, match='Truncated'):
+        binary.loads(ArticleMetadata, encoded[:-3])
+    with pytest.raises(ValueError, match='Unsupported compression'):
+        binary.dumps(metadata, compression='brotli')
+    with pytest.raises(ValueError, match='64 bits'):
+        binary._write_any(2 ** 64, bytearray())
+
+
+def test_binary_validates_untrusted_payloads():
+    invalid = metadata.model_copy(update={'pages': 'not pages'})
+    with pytest.raises(ValidationError):
+        binary.loads(ArticleMetadata, binary.dumps(invalid))
+    assert binary.loads(ArticleMetadata, binary.dumps(invalid), trusted=True).pages == 'not pages'
+
+
+def test_binary_trusted_converts_union_fields():
+    decoded = binary.loads(type(response), binary.dumps(response), trusted=True)
+    assert isinstance(decoded.data[0], ArticleMetadata)
+    assert decoded.data[0].keywords == {'science', 'AI'}
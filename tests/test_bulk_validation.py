@@ -0,0 +1,86 @@
+import pytest
+from article_models.bulk_validation import validate_many
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.article_nosql_models import ArticleTextDBSchema
+
+valid_metadata = {
+    'id': '10.1000/123456',
+    'title': 'Test Article',
+    'authors': 'John Doe, Jane Smith',
+    'journal': 'Test Journal',
+    'year': 2024,
+    'volume': 1,
+    'pages': '10-20',
+    'keywords': 'science, research'
+}
+
+valid_text = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Title',
+    'authors': [{'name': 'John', 'surname': 'Doe'}],
+    'abstract': 'This is an abstract.',
+    'keywords': {'science', 'AI'},
+    'markdown_full_text': '## Introduction\nThis is a sample markdown text.'
+}
+
+test_cases = [
+    {
+        'test_description': 'All metadata rows valid',
+        'model': ArticleMetadataDBSchema,
+        'rows': [valid_metadata, {**valid_metadata, 'id': '10.1000/654321'}],
+        'chunk_size': None,
+        'expected_ids': ['10.1000/123456', '10.1000/654321'],
+        'expected_errors': {}
+    },
+    {
+        'test_description': 'Invalid metadata rows reported by index',
+        'model': ArticleMetadataDBSchema,
+        'rows': [{**valid_metadata, 'id': 'invalid_doi'}, valid_metadata, {**valid_metadata, 'volume': -1}],
+        'chunk_size': None,
+        'expected_ids': ['10.1000/123456'],
+        'expected_errors': {0: [('id',)], 2: [('volume',)]}
+    },
+    {
+        'test_description': 'Indexes are global across chunks',
+        'model': ArticleMetadataDBSchema,
+        'rows': [valid_metadata, valid_metadata, valid_metadata, {**valid_metadata, 'pages': '10'}],
+        'chunk_size': 2,
+        'expected_ids': ['10.1000/123456'] * 3,
+        'expected_errors': {3: [('pages',)]}
+    },
+    {
+        'test_description': 'Rows after a failing chunk are validated in place',
+        'model': ArticleMetadataDBSchema,
+        'rows': [{**valid_metadata, 'year': -1}, valid_metadata, valid_metadata, {**valid_metadata, 'title': ''},
+                 valid_metadata],
+        'chunk_size': 2,
+        'expected_ids': ['10.1000/123456'] * 3,
+        'expected_errors': {0: [('year',)], 3: [('title',)]}
+    },
+    {
+        'test_description': 'Nested errors keep their location',
+        'model': ArticleTextDBSchema,
+        'rows': [valid_text, {**valid_text, 'authors': [{'name': 'John'}]}],
+        'chunk_size': None,
+        'expected_ids': ['10.1000/10/123456'],
+        'expected_errors': {1: [('authors', 0, 'surname')]}
+    },
+    {
+        'test_description': 'Empty input',
+        'model': ArticleTextDBSchema,
+        'rows': [],
+        'chunk_size': None,
+        'expected_ids': [],
+        'expected_errors': {}
+    }
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_validate_many(test_data):
+    result = validate_many(test_data['model'], test_data['rows'], chunk_size=test_data['chunk_size'])
+
+    assert all(isinstance(model, test_data['model']) for model in result.valid)
+    assert [model.id for model in result.valid] == test_data['expected_ids']
+    assert {index: [error['loc'] for error in errors] for index, errors in result.errors.items()} == \
+           test_data['expected_errors']
@@ -0,0 +1,85 @@
+import pytest
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.columnar import ArticleMetadataBatch
+
+rows = [
+    {'id': '10.1000/1', 'title': 'First', 'authors': 'John Doe', 'journal': 'Journal B', 'year': 2020,
+     'volume': 1, 'issue': None, 'pages': '10-20', 'keywords': 'science'},
+    {'id': '10.1000/2', 'title': 'Second', 'authors': 'Jane Smith', 'journal': 'Journal A', 'year': 2010,
+     'volume': 2, 'issue': 3, 'pages': '1-9', 'keywords': 'research'},
+    {'id': '10.1000/3', 'title': 'Third', 'authors': 'Maria Nowak', 'journal': 'Journal B', 'year': 2015,
+     'volume': 3, 'issue': 1, 'pages': '100-120', 'keywords': 'AI, science'},
+]
+
+columns = {
+    'ids': [row['id'] for row in rows],
+    'titles': [row['title'] for row in rows],
+    'authors': [row['authors'] for row in rows],
+    'journals': [row['journal'] for row in rows],
+    'years': [row['year'] for row in rows],
+    'volumes': [row['volume'] for row in rows],
+    'issues': [row['issue'] for row in rows],
+    'pages': [row['pages'] for row in rows],
+    'keywords': [row['keywords'] for row in rows],
+}
+
+
+def test_batch_round_trip():
+    models = [ArticleMetadataDBSchema(**row) for row in rows]
+    batch = ArticleMetadataBatch.from_rows(models)
+
+    assert len(batch) == 3
+    assert list(batch.pages_start) == [10, 1, 100]
+    assert list(batch.pages_end) == [20, 9, 120]
+    assert batch.to_rows() == models
+    assert ArticleMetadataBatch.from_columns(**columns).to_rows() == models
+
+
+test_cases_invalid_columns = [
+    {'test_description': 'Negative year', 'column': 'years', 'values': [2020, -1, 2015], 'expected': {'years': [1]}},
+    {'test_description': 'Negative volume', 'column': 'volumes', 'values': [-1, 2, -3],
+     'expected': {'volumes': [0, 2]}},
+    {'test_description': 'Invalid pages', 'column': 'pages', 'values': ['10-20', '10', 'a-b'],
+     'expected': {'pages': [1, 2]}},
+    {'test_description': 'Pages with trailing newline', 'column': 'pages', 'values': ['10-20\n', '1-9', '100-120'],
+     'expected': {'pages': [0]}},
+    {'test_description': 'Pages out of int64 range', 'column': 'pages',
+     'values': ['10-20', '1-99999999999999999999', '100-120'], 'expected': {'pages': [1]}},
+    {'test_description': 'Year out of int64 range', 'column': 'years', 'values': [2020, 2 ** 63, 2015],
+     'expected': {'years': [1]}},
+    {'test_description': 'Invalid DOI', 'column': 'ids', 'values': ['10.1000/1', 'invalid_doi', '10.1000/3'],
+     'expected': {'ids': [1]}},
+    {'test_description': 'Empty title', 'column': 'titles', 'values': ['First', '', 'Third'],
+     'expected': {'titles': [1]}},
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_invalid_columns,
+                         ids=[case['test_description'] for case in test_cases_invalid_columns])
+def test_batch_invalid_columns(test_data):
+    with pytest.raises(ValueError) as exc_info:
+        ArticleMetadataBatch.from_columns(**{**columns, test_data['column']: test_data['values']})
+    assert str(test_data['expected']) in str(exc_info.value)
+
+
+def test_batch_column_lengths_must_match():
+    with pytest.raises(ValueError):
+        ArticleMetadataBatch.from_columns(**{**columns, 'years': [2020]})
+
+
+def test_batch_from_rows_out_of_int64_range():
+    model = ArticleMetadataDBSchema(**{**rows[0], 'pages': '1-99999999999999999999'})
+    with pytest.raises(ValueError):
+        ArticleMetadataBatch.from_rows([model])
+
+
+def test_batch_filter_and_sort():
+    batch = ArticleMetadataBatch.from_columns(**columns)
+
+    assert batch.filter(year_min=2012).ids == ['10.1000/1', '10.1000/3']
+    assert batch.filter(year_max=2015, journal='Journal B').ids == ['10.1000/3']
+    assert batch.sort_by('year').ids == ['10.1000/2', '10.1000/3', '10.1000/1']
+    assert batch.sort_by('journal', reverse=True).ids == ['10.1000/1', '10.1000/3', '10.1000/2']
+    assert batch.sort_by('year').row(0) == ArticleMetadataDBSchema(**rows[1])
+    with pytest.raises(ValueError):
+        batch.sort_by('pages')
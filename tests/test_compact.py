@@ -0,0 +1,48 @@
+from article_models.compact import CompactArticleMetadata, InternPool, compact_many, expand_many
+from article_models.schemas import ArticleMetadata
+
+article_metadata = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': [{'name': 'John', 'surname': 'Smith'}, {'name': 'Maria', 'surname': 'Nowak'}],
+    'keywords': {'keyword1', 'keyword2'},
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': None,
+    'pages': '23-34'
+}
+
+
+def make_articles(count):
+    return [ArticleMetadata(**{**article_metadata, 'id': f'10.1000/{i}', 'title': f'Title {i}'})
+            for i in range(count)]
+
+
+def test_compact_round_trip():
+    articles = make_articles(3)
+    records = compact_many(articles)
+
+    assert all(isinstance(record, CompactArticleMetadata) for record in records)
+    assert expand_many(records) == articles
+
+
+def test_compact_shares_repeated_values():
+    pool = InternPool()
+    first, second = compact_many(make_articles(2), pool)
+
+    assert first.authors is second.authors
+    assert first.keywords is second.keywords
+    assert first.journal is second.journal
+    assert first.authors[0] is pool.author('John', 'Smith')
+
+
+def test_expanded_models_are_independent():
+    record = compact_many(make_articles(1))[0]
+    first, second = record.to_model(), record.to_model()
+
+    first.authors[0].name = 'Changed'
+    first.keywords.add('changed')
+
+    assert second.authors[0].name == 'John'
+    assert record.keywords == frozenset({'keyword1', 'keyword2'})
@@ -0,0 +1,130 @@
+import pytest
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.converters import (construct_trusted, metadata_api_to_db, metadata_api_to_db_many,
+                                       metadata_db_to_api, metadata_db_to_api_many, metadata_to_text,
+                                       text_to_metadata)
+from article_models.schemas import ArticleMetadata
+
+article_metadata = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': [{'name': 'John', 'surname': 'Smith'}, {'name': 'Mary Ann', 'surname': 'Nowak'}],
+    'keywords': {'keyword1', 'keyword2'},
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': 2,
+    'pages': '23-34'
+}
+
+article_metadata_db = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': 'John Smith, Mary Ann Nowak',
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': 2,
+    'pages': '23-34',
+    'keywords': 'keyword1, keyword2'
+}
+
+article_text = {
+    'abstract': 'This is an abstract.',
+    'markdown_full_text': '## Introduction\nThis is a sample markdown text.',
+    'images': [{'image_number': 'fig.1.3', 'file_path': '/images/fig1.3.png'}],
+    'tables': []
+}
+
+
+def test_metadata_round_trip_api_to_db():
+    article = ArticleMetadata(**article_metadata)
+    record = metadata_api_to_db(article)
+
+    assert record == ArticleMetadataDBSchema(**article_metadata_db)
+    assert metadata_db_to_api(record) == article
+
+
+def test_metadata_round_trip_db_to_api():
+    record = ArticleMetadataDBSchema(**{**article_metadata_db, 'keywords': 'keyword2,keyword1 ,keyword2',
+                                        'authors': 'John Smith,Mary Ann Nowak'})
+    article = metadata_db_to_api(record)
+
+    assert article == ArticleMetadata(**article_metadata)
+    assert metadata_api_to_db(article) == ArticleMetadataDBSchema(**article_metadata_db)
+
+
+def test_metadata_batch_conversion():
+    records = [ArticleMetadataDBSchema(**{**article_metadata_db, 'id': f'10.1000/{i}'}) for i in range(3)]
+    articles = metadata_db_to_api_many(records)
+
+    assert [article.id for article in articles] == ['10.1000/0', '10.1000/1', '10.1000/2']
+    assert articles == [metadata_db_to_api(record) for record in records]
+    assert metadata_api_to_db_many(articles) == records
+
+
+def test_metadata_batch_conversion_shares_strings_not_models():
+    records = [ArticleMetadataDBSchema(**{**article_metadata_db, 'id': f'10.1000/{i}'}) for i in range(2)]
+    first, second = metadata_db_to_api_many(records)
+    first.authors[0].name = 'Changed'
+    first.keywords.add('changed')
+
+    assert second == metadata_db_to_api(records[1])
+    converted = metadata_api_to_db_many([second, metadata_db_to_api(records[0])])
+    assert converted[0].authors is converted[1].authors and converted[0].keywords is converted[1].keywords
+
+
+test_cases_not_convertible = [
+    {
+        'test_description': 'Author without surname in SQL record',
+        'convert': lambda: metadata_db_to_api(ArticleMetadataDBSchema(**{**article_metadata_db, 'authors': 'Plato'}))
+    },
+    {
+        'test_description': 'Surname with spaces is ambiguous in SQL record',
+        'convert': lambda: metadata_api_to_db(ArticleMetadata(**{
+            **article_metadata, 'authors': [{'name': 'Vincent', 'surname': 'van Gogh'}]}))
+    },
+    {
+        'test_description': 'Keyword with a comma',
+        'convert': lambda: metadata_api_to_db(ArticleMetadata(**{**article_metadata, 'keywords': {'a, b'}}))
+    },
+    {
+        'test_description': 'No keywords',
+        'convert': lambda: metadata_api_to_db(ArticleMetadata(**{**article_metadata, 'keywords': set()}))
+    },
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_not_convertible,
+                         ids=[case['test_description'] for case in test_cases_not_convertible])
+def test_not_convertible(test_data):
+    with pytest.raises(ValueError):
+        test_data['convert']()
+
+
+def test_text_metadata_conversion():
+    article = ArticleMetadata(**article_metadata)
+    text = metadata_to_text(article, **article_text)
+
+    assert text == ArticleTextDBSchema(**{key: article_metadata[key] for key in ('id', 'title', 'authors', 'keywords')},
+                                       **article_text)
+    assert text_to_metadata(text, **{key: article_metadata[key] for key in
+                                     ('journal', 'year', 'volume', 'issue', 'pages')}) == article
+    assert text.authors[0] is not article.authors[0]
+
+
+def test_text_metadata_conversion_validates_new_fields():
+    text = metadata_to_text(ArticleMetadata(**article_metadata), **article_text)
+    with pytest.raises(ValueError):
+        text_to_metadata(text, journal='Example Journal', year=-1, volume=10, pages='23-34')
+    with pytest.raises(ValueError):
+        metadata_to_text(ArticleMetadata(**article_metadata), abstract='', markdown_full_text='text')
+
+
+def test_construct_trusted_equals_validated_model():
+    article = ArticleMetadata(**article_metadata)
+    constructed = construct_trusted(ArticleMetadata, dict(article))
+
+    assert constructed == article
+    assert constructed.model_fields_set == set(ArticleMetadata.model_fields)
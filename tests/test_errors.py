@@ -0,0 +1,112 @@
+import json
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.bulk_validation import validate_many
+from article_models.errors import (ArticleAnalyserApiBaseException, ERROR_DESCRIPTORS, ModelValidationException,
+                                   ErrorDescriptor, translate_validation_errors)
+from article_models.schemas import ArticleMetadata, ResponseSchema, StatusEnum
+
+test_cases = [
+    {
+        'test_description': 'Known error code',
+        'error_code': 'AML-1',
+        'additional_info': 'Invalid DOI',
+        'expected_exception': ModelValidationException,
+        'expected_dict': {'error_code': 'AML-1', 'error_message': 'PYDANTIC_VALIDATION_ERROR',
+                          'http_status_code': 400, 'additional_info': 'Invalid DOI'}
+    },
+    {
+        'test_description': 'Unknown error code',
+        'error_code': 'AML-999',
+        'additional_info': '',
+        'expected_exception': ArticleAnalyserApiBaseException,
+        'expected_dict': {'error_code': 'AAA-0', 'error_message': 'UNDEFINED_ERROR', 'http_status_code': 500,
+                          'additional_info': 'Unknown error_code AML-999. Error code not in ERROR_CODES in '
+                                             'article_models_library'}
+    }
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_model_validation_exception(test_data):
+    with pytest.raises(test_data['expected_exception']) as exc_info:
+        raise ModelValidationException(test_data['error_code'], additional_info=test_data['additional_info'])
+
+    assert type(exc_info.value) is test_data['expected_exception']
+    assert exc_info.value.to_dict() == test_data['expected_dict']
+    expected = test_data['expected_dict']
+    assert str(exc_info.value) == (f"{expected['error_code']}: {expected['error_message']}\n"
+                                   f"{expected['additional_info']}. \nHttp status code {expected['http_status_code']}")
+
+
+def test_error_descriptors():
+    assert ERROR_DESCRIPTORS['AML-1'] == ErrorDescriptor('AML-1', 'PYDANTIC_VALIDATION_ERROR', 'AML')
+    assert ModelValidationException('AML-1').error_message is ERROR_DESCRIPTORS['AML-1'].error_message
+
+
+def make_validation_error():
+    try:
+        ArticleMetadataDBSchema(id='invalid_doi', title='', authors='John Doe', journal='Journal', year=2024,
+                                volume=1, pages='10-20', keywords='science')
+    except ValidationError as e:
+        return e
+
+
+expected_errors = [
+    {'field': 'id', 'type': 'string_pattern_mismatch',
+     'message': "String should match pattern '^10\\.\\d{4,9}(\\.\\d+)*\\/[A-Za-z0-9\\-._;()/:]+$'"},
+    {'field': 'title', 'type': 'string_too_short', 'message': 'String should have at least 1 character'},
+]
+
+test_cases_translation = [
+    {
+        'test_description': 'ValidationError',
+        'source': make_validation_error,
+        'expected': expected_errors
+    },
+    {
+        'test_description': 'List of pydantic error dicts',
+        'source': lambda: make_validation_error().errors(),
+        'expected': expected_errors
+    },
+    {
+        'test_description': 'Batch validation report',
+        'source': lambda: validate_many(ArticleMetadataDBSchema, [
+            {'id': 'invalid_doi', 'title': '', 'authors': 'John Doe', 'journal': 'Journal', 'year': 2024,
+             'volume': 1, 'pages': '10-20', 'keywords': 'science'}]).errors,
+        'expected': [{'row': 0, 'errors': expected_errors}]
+    },
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_translation,
+                         ids=[case['test_description'] for case in test_cases_translation])
+def test_translate_validation_errors(test_data):
+    assert translate_validation_errors(test_data['source']()) == test_data['expected']
+
+
+def test_model_validation_exception_from_validation_error():
+    exception = ModelValidationException.from_validation_error(make_validation_error())
+
+    assert exception.to_dict()['errors'] == expected_errors
+    ModelValidationException.from_validation_error(make_validation_error()).to_dict()['errors'][0]['message'] = 'x'
+    assert translate_validation_errors(make_validation_error()) == expected_errors
+    assert str(exception).startswith('AML-1: PYDANTIC_VALIDATION_ERROR\nid: String should match pattern')
+    assert exception.additional_info == ''
+
+    response = ResponseSchema.from_exception(exception)
+    assert response.status == StatusEnum.ERROR
+    assert response.error_code == 'AML-1'
+    assert response.http_status == 400
+    assert response.data == expected_errors
+
+
+def test_typed_response_from_exception():
+    exception = ModelValidationException.from_validation_error(make_validation_error())
+    response = ResponseSchema[List[ArticleMetadata]].from_exception(exception)
+    assert response.status == StatusEnum.ERROR
+    assert json.loads(response.dump_json())['data'] == expected_errors
+    assert json.loads(response.model_dump_json())['data'] == expected_errors
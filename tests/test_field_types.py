@@ -0,0 +1,89 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+from article_models.field_types import DOI, Pages, DOIParts, configure_doi_cache, normalize_doi, parse_doi
+
+doi_adapter = TypeAdapter(DOI)
+pages_adapter = TypeAdapter(Pages)
+
+test_cases_doi = [
+    {
+        'test_description': 'Plain DOI',
+        'doi': '10.1000/123456',
+        'is_valid': True,
+        'expected_value': '10.1000/123456',
+        'expected_parts': DOIParts(prefix='10.1000', suffix='123456')
+    },
+    {
+        'test_description': 'DOI with resolver URL and upper case',
+        'doi': 'https://doi.org/10.1000/ABC.def',
+        'is_valid': True,
+        'expected_value': '10.1000/abc.def',
+        'expected_parts': DOIParts(prefix='10.1000', suffix='abc.def')
+    },
+    {
+        'test_description': 'DOI with doi: scheme and nested suffix',
+        'doi': ' doi:10.1000.5/10/123456 ',
+        'is_valid': True,
+        'expected_value': '10.1000.5/10/123456',
+        'expected_parts': DOIParts(prefix='10.1000.5', suffix='10/123456')
+    },
+    {
+        'test_description': 'Invalid DOI prefix',
+        'doi': '11.1000/123456',
+        'is_valid': False
+    },
+    {
+        'test_description': 'Empty DOI',
+        'doi': '',
+        'is_valid': False
+    },
+    {
+        'test_description': 'Non-ASCII sharp s is not folded to ss',
+        'doi': '10.1000/stra\u00dfe',
+        'is_valid': False
+    },
+    {
+        'test_description': 'Non-ASCII ligature is not folded to fi',
+        'doi': '10.1000/\ufb01le',
+        'is_valid': False
+    },
+    {
+        'test_description': 'Kelvin sign is not folded to k',
+        'doi': '10.1000/\u212a',
+        'is_valid': False
+    },
+    {
+        'test_description': 'Non-ASCII digits',
+        'doi': '10.\u0661\u0662\u0663\u0664/123456',
+        'is_valid': False
+    }
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_doi, ids=[case['test_description'] for case in test_cases_doi])
+def test_doi(test_data):
+    if test_data['is_valid']:
+        assert doi_adapter.validate_python(test_data['doi']) == test_data['expected_value']
+        assert parse_doi(test_data['doi']) == test_data['expected_parts']
+    else:
+        with pytest.raises(ValidationError) as exc_info:
+            doi_adapter.validate_python(test_data['doi'])
+        assert exc_info.value.errors()[0]['type'] == 'string_pattern_mismatch'
+
+
+@pytest.mark.parametrize('cache_size', [0, 16, None])
+def test_configure_doi_cache(cache_size):
+    configure_doi_cache(cache_size)
+    try:
+        assert normalize_doi('10.1000/ABC') == normalize_doi('https://doi.org/10.1000/abc') == '10.1000/abc'
+    finally:
+        configure_doi_cache()
+
+
+@pytest.mark.parametrize('pages, is_valid', [('23-34', True), ('23', False), ('a-b', False)])
+def test_pages(pages, is_valid):
+    if is_valid:
+        assert pages_adapter.validate_python(pages) == pages
+    else:
+        with pytest.raises(ValidationError):
+            pages_adapter.validate_python(pages)
@@ -0,0 +1,92 @@
+import pytest
+from pydantic import ValidationError
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.frozen_models import (FrozenArticleMetadata, FrozenArticleMetadataDBSchema,
+                                          FrozenArticleTextDBSchema, FrozenAuthor, dedupe, freeze_many)
+from article_models.schemas import ArticleMetadata
+from article_models.validation_cache import ValidationCache
+
+article_text = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Title',
+    'authors': [{'name': 'John', 'surname': 'Doe'}],
+    'abstract': 'This is an abstract.',
+    'keywords': {'science', 'AI'},
+    'markdown_full_text': '## Introduction\nThis is a sample markdown text.',
+    'images': [{'image_number': 'fig.1.3', 'file_path': '/images/fig1.3.png'}]
+}
+
+article_metadata_db = {
+    'id': '10.1000/123456',
+    'title': 'Test Article',
+    'authors': 'John Doe, Jane Smith',
+    'journal': 'Test Journal',
+    'year': 2024,
+    'volume': 1,
+    'pages': '10-20',
+    'keywords': 'science, research'
+}
+
+article_metadata = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': [{'name': 'John', 'surname': 'Smith'}],
+    'keywords': {'keyword1', 'keyword2'},
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': 2,
+    'pages': '23-34'
+}
+
+test_cases = [
+    {'test_description': 'ArticleTextDBSchema', 'model': ArticleTextDBSchema,
+     'frozen_model': FrozenArticleTextDBSchema, 'data': article_text},
+    {'test_description': 'ArticleMetadataDBSchema', 'model': ArticleMetadataDBSchema,
+     'frozen_model': FrozenArticleMetadataDBSchema, 'data': article_metadata_db},
+    {'test_description': 'ArticleMetadata', 'model': ArticleMetadata,
+     'frozen_model': FrozenArticleMetadata, 'data': article_metadata},
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_frozen_variant(test_data):
+    model = test_data['model'](**test_data['data'])
+    frozen = test_data['frozen_model'](**test_data['data'])
+
+    assert test_data['frozen_model'].from_model(model) == frozen
+    assert frozen.to_model() == model
+    assert isinstance(frozen, test_data['model'])
+    assert hash(frozen) == hash(test_data['frozen_model'].from_model(model))
+    with pytest.raises(ValidationError):
+        frozen.title = 'Changed'
+
+
+def test_frozen_collections_are_immutable():
+    frozen = FrozenArticleMetadata(**article_metadata)
+
+    assert frozen.keywords == frozenset(article_metadata['keywords'])
+    assert frozen.authors == (FrozenAuthor(name='John', surname='Smith'),)
+    assert hash(frozen.authors[0]) == hash(FrozenAuthor(name='John', surname='Smith'))
+
+
+def test_frozen_article_text_keywords_must_be_a_set():
+    with pytest.raises(ValidationError):
+        FrozenArticleTextDBSchema(**{**article_text, 'keywords': ['science']})
+
+
+def test_dedupe_by_doi():
+    articles = [ArticleMetadata(**{**article_metadata, 'id': f'10.1000/{i % 3}', 'title': f'Title {i}'})
+                for i in range(7)]
+
+    unique = dedupe(freeze_many(articles))
+
+    assert [(article.id, article.title) for article in unique] == [
+        ('10.1000/0', 'Title 0'), ('10.1000/1', 'Title 1'), ('10.1000/2', 'Title 2')]
+
+
+def test_validation_cache_does_not_copy_frozen_models():
+    cache = ValidationCache()
+    raw = FrozenArticleMetadata(**article_metadata).model_dump_json()
+    assert cache.validate_json(FrozenArticleMetadata, raw) is cache.validate_json(FrozenArticleMetadata, raw)
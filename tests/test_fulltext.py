@@ -0,0 +1,98 @@
+import pytest
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.fulltext import InvertedIndex, tokenize
+
+
+def make_article(number, abstract, text):
+    return ArticleTextDBSchema(id=f'10.1000/{number}', title=f'Title {number}',
+                               authors=[{'name': 'John', 'surname': 'Doe'}], abstract=abstract,
+                               keywords={'science'}, markdown_full_text=text)
+
+
+articles = [
+    make_article(1, 'Deep learning for protein folding.', '## Methods\nWe train a neural network on protein data.'),
+    make_article(2, 'A survey of neural networks.', '# Neural networks\nNeural networks, neural networks everywhere.'),
+    make_article(3, 'Protein structure prediction.', '## Results\nStructure prediction improves with more data.'),
+]
+
+search_cases = [
+    {'test_description': 'Single term', 'query': 'protein', 'expected_ids': {'1', '3'}},
+    {'test_description': 'Case and markup are ignored', 'query': '**NEURAL**', 'expected_ids': {'1', '2'}},
+    {'test_description': 'Any term matches', 'query': 'folding survey', 'expected_ids': {'1', '2'}},
+    {'test_description': 'Unknown term', 'query': 'quantum', 'expected_ids': set()},
+]
+
+phrase_cases = [
+    {'test_description': 'Adjacent words', 'phrase': 'neural network', 'expected_ids': ['1']},
+    {'test_description': 'Plural phrase', 'phrase': 'Neural networks', 'expected_ids': ['2']},
+    {'test_description': 'Words in the wrong order', 'phrase': 'prediction structure', 'expected_ids': []},
+    {'test_description': 'Phrase across abstract and full text', 'phrase': 'prediction results', 'expected_ids': []},
+    {'test_description': 'Unknown word', 'phrase': 'protein quantum', 'expected_ids': []},
+]
+
+
+@pytest.fixture(params=['memory', 'loaded'])
+def index(request, tmp_path):
+    index = InvertedIndex()
+    index.add_articles(articles)
+    if request.param == 'loaded':
+        index.save(tmp_path / 'index.bin')
+        index = InvertedIndex.load(tmp_path / 'index.bin')
+    yield index
+    index.close()
+
+
+def test_tokenize():
+    assert tokenize('## Deep-learning, **v2**!') == ['deep', 'learning', 'v2']
+
+
+@pytest.mark.parametrize('test_data', search_cases, ids=[case['test_description'] for case in search_cases])
+def test_inverted_index_search(index, test_data):
+    assert {doc_id.split('/')[1] for doc_id, _ in index.search(test_data['query'])} == test_data['expected_ids']
+
+
+def test_inverted_index_search_ranks_by_bm25(index):
+    results = index.search('neural networks')
+    assert [doc_id for doc_id, _ in results] == ['10.1000/2', '10.1000/1']
+    assert results[0][1] > results[1][1] > 0
+    assert len(index.search('neural networks', limit=1)) == 1
+
+
+@pytest.mark.parametrize('test_data', phrase_cases, ids=[case['test_description'] for case in phrase_cases])
+def test_inverted_index_phrase(index, test_data):
+    assert [doc_id.split('/')[1] for doc_id in index.phrase(test_data['phrase'])] == test_data['expected_ids']
+
+
+def test_inverted_index_add_after_load(tmp_path):
+    index = InvertedIndex()
+    index.add_articles(articles)
+    index.save(tmp_path / 'index.bin')
+    loaded = InvertedIndex.load(tmp_path / 'index.bin')
+    loaded.add_article(make_article(4, 'Protein networks.', 'Neural network models of protein folding.'))
+    assert len(loaded) == 4 and '10.1000/4' in loaded
+    assert loaded.phrase('protein folding') == ['10.1000/1', '10.1000/4']
+    assert {doc_id for doc_id, _ in loaded.search('structure')} == {'10.1000/3'}
+    assert InvertedIndex.load(tmp_path / 'index.bin').phrase('protein folding') == ['10.1000/1']
+
+
+def test_inverted_index_close_releases_memory_map(tmp_path):
+    index = InvertedIndex()
+    index.add_articles(articles)
+    index.save(tmp_path / 'index.bin')
+    with InvertedIndex.load(tmp_path / 'index.bin') as loaded:
+        loaded.add_article(make_article(4, 'Protein networks.', 'Neural network models of protein folding.'))
+        mapped = loaded._mmap
+        assert loaded.phrase('protein folding') == ['10.1000/1', '10.1000/4']
+    assert mapped.closed
+    assert len(loaded) == 0 and loaded.search('protein') == []
+    loaded.close()
+
+
+def test_inverted_index_rejects_duplicates_and_foreign_files(tmp_path):
+    index = InvertedIndex()
+    index.add_article(articles[0])
+    with pytest.raises(ValueError):
+        index.add_article(articles[0])
+    (tmp_path / 'other.bin').write_bytes(b'not an index at all')
+    with pytest.raises(ValueError):
+        InvertedIndex.load(tmp_path / 'other.bin')
@@ -0,0 +1,181 @@
+import json
+import threading
+
+import pytest
+from pydantic import ValidationError
+from article_models.article_nosql_models import Author
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.frozen_models import FrozenArticleMetadata
+from article_models.instrumentation import (DEFAULT_BUCKETS, InMemorySink, InstrumentedValidator, MetricsSink,
+                                            PrometheusExporter, error_field, instrument, instrumented,
+                                            library_models, uninstrument)
+from article_models.schemas import ArticleMetadata
+
+metadata = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': [{'name': 'John', 'surname': 'Smith'}],
+    'keywords': ['keyword1', 'keyword2'],
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': 2,
+    'pages': '23-34'
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_validators():
+    yield
+    uninstrument()
+
+
+def test_instrumented_counts_successes_and_failures():
+    sink = InMemorySink()
+    with instrumented(sink):
+        ArticleMetadata(**metadata)
+        ArticleMetadata.model_validate(metadata)
+        with pytest.raises(ValidationError):
+            ArticleMetadata(**{**metadata, 'id': 'not-a-doi', 'authors': [{'name': 'John'}, {'name': 'Jane'}]})
+
+    assert sink.validations == {('ArticleMetadata', 'python', 'success'): 2,
+                                ('ArticleMetadata', 'python', 'failure'): 1}
+    assert sink.failures == {('ArticleMetadata', 'id', 'string_pattern_mismatch'): 1,
+                             ('ArticleMetadata', 'authors.*.surname', 'missing'): 2}
+    histogram = sink.latency['ArticleMetadata', 'python']
+    assert histogram.count == 3
+    assert histogram.sum > 0
+
+
+def test_json_and_strings_methods():
+    sink = InMemorySink()
+    with instrumented(sink, [ArticleMetadata, ArticleMetadataDBSchema, Author]):
+        article = ArticleMetadata.model_validate_json(json.dumps(metadata))
+        Author.model_validate_strings({'name': 'Jane', 'surname': 'Smith'})
+        author = Author(name='John', surname='Doe')
+        with pytest.raises(ValidationError):
+            ArticleMetadataDBSchema.model_validate_json('{"id": "10.1000/1"}')
+    assert article.year == 2022
+    assert author.surname == 'Doe'
+    assert sink.validations[('ArticleMetadata', 'json', 'success')] == 1
+    assert sink.validations[('Author', 'strings', 'success')] == 1
+    assert sink.validations[('Author', 'python', 'success')] == 1
+    assert sink.validations[('ArticleMetadataDBSchema', 'json', 'failure')] == 1
+    assert sink.failures[('ArticleMetadataDBSchema', 'title', 'missing')] == 1
+
+
+def test_nested_models_are_counted_at_the_top_level_only():
+    sink = InMemorySink()
+    with instrumented(sink):
+        ArticleMetadata(**metadata)
+    assert ('Author', 'python', 'success') not in sink.validations
+
+
+def test_uninstrument_restores_the_original_validators():
+    originals = {model: model.__pydantic_validator__ for model in (ArticleMetadata, FrozenArticleMetadata)}
+    sink = InMemorySink()
+    instrument(sink)
+    assert all(isinstance(model.__pydantic_validator__, InstrumentedValidator) for model in library_models())
+    FrozenArticleMetadata(**metadata)
+    uninstrument()
+    for model, validator in originals.items():
+        assert model.__pydantic_validator__ is validator
+    ArticleMetadata(**metadata)
+    assert sink.validations == {('FrozenArticleMetadata', 'python', 'success'): 1}
+
+
+def test_instrument_again_switches_sink():
+    first, second = InMemorySink(), InMemorySink()
+    instrument(first, [ArticleMetadata])
+    original = ArticleMetadata.__pydantic_validator__.validator
+    instrument(second, [ArticleMetadata])
+    assert ArticleMetadata.__pydantic_validator__.validator is original
+    ArticleMetadata(**metadata)
+    assert not first.validations
+    assert second.validations == {('ArticleMetadata', 'python', 'success'): 1}
+
+
+def test_instrumented_models_behave_the_same():
+    with instrumented(InMemorySink()):
+        article = ArticleMetadata(**metadata)
+        assert ArticleMetadata.model_validate_json(article.model_dump_json()) == article
+        assert ArticleMetadata.__pydantic_validator__.title == 'ArticleMetadata'
+
+
+def test_sink_without_observe_fails_on_creation():
+    class IncompleteSink(MetricsSink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
+
+
+def test_custom_sink():
+    class ListSink(MetricsSink):
+        def __init__(self):
+            self.observations = []
+
+        def observe(self, model, method, seconds, errors):
+            self.observations.append((model, method, errors))
+
+    sink = ListSink()
+    with instrumented(sink, [Author]):
+        with pytest.raises(ValidationError):
+            Author(name='John', surname='')
+    [(model, method, errors)] = sink.observations
+    assert (model, method) == ('Author', 'python')
+    assert [(error['loc'], error['type']) for error in errors] == [(('surname',), 'string_too_short')]
+    assert 'input' not in errors[0]
+
+
+def test_in_memory_sink_is_thread_safe_and_resettable():
+    sink = InMemorySink()
+
+    def validate():
+        for _ in range(200):
+            Author(name='John', surname='Doe')
+
+    with instrumented(sink, [Author]):
+        threads = [threading.Thread(target=validate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert sink.validations[('Author', 'python', 'success')] == 800
+    assert sink.latency['Author', 'python'].count == 800
+    sink.reset()
+    assert not sink.validations and not sink.latency and not sink.failures
+
+
+def test_histogram_buckets():
+    sink = InMemorySink(buckets=(0.001, 0.01, float('inf')))
+    for seconds in (0.0005, 0.001, 0.005, 1.0):
+        sink.observe('Author', 'python', seconds, None)
+    histogram = sink.latency['Author', 'python']
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == [(0.001, 2), (0.01, 3), (float('inf'), 4)]
+    assert DEFAULT_BUCKETS[-1] == float('inf')
+
+
+def test_prometheus_exporter_renders_text_format():
+    exporter = PrometheusExporter(buckets=(0.001, float('inf')))
+    exporter.observe('Author', 'python', 0.0001, None)
+    exporter.observe('Author', 'python', 0.5, [{'loc': ('surname',), 'type': 'missing'}])
+    exporter.observe('Odd"Model\\', 'json', 0.0001, None)
+    lines = exporter.render().splitlines()
+
+    assert '# TYPE article_models_validations_total counter' in lines
+    assert 'article_models_validations_total{model="Author",method="python",outcome="success"} 1' in lines
+    assert 'article_models_validations_total{model="Author",method="python",outcome="failure"} 1' in lines
+    assert '# TYPE article_models_validation_seconds histogram' in lines
+    assert 'article_models_validation_seconds_bucket{model="Author",method="python",le="0.001"} 1' in lines
+    assert 'article_models_validation_seconds_bucket{model="Author",method="python",le="+Inf"} 2' in lines
+    assert 'article_models_validation_seconds_sum{model="Author",method="python"} 0.5001' in lines
+    assert 'article_models_validation_seconds_count{model="Author",method="python"} 2' in lines
+    assert 'article_models_validation_errors_total{model="Author",field="surname",type="missing"} 1' in lines
+    assert 'article_models_validations_total{model="Odd\\"Model\\\\",method="json",outcome="success"} 1' in lines
+
+
+def test_error_field():
+    assert error_field(('authors', 0, 'surname')) == 'authors.*.surname'
+    assert error_field(()) == ''
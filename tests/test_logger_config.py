@@ -0,0 +1,208 @@
+import json
+import logging
+import queue
+from datetime import datetime
+from io import StringIO
+
+import pytest
+from pydantic import ValidationError
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.errors import ModelValidationException
+from article_models.logger_config import (BoundedQueueHandler, JSONFormatter, ValidationErrorAggregationFilter,
+                                          setup_logger, stop_logging)
+
+
+def make_record(message='Message %s', args=('text',), exc_info=None):
+    return logging.LogRecord('AML', logging.INFO, '/path/module.py', 10, message, args, exc_info, func='function')
+
+
+def test_json_formatter():
+    formatter = JSONFormatter('article_models_library')
+    record = make_record()
+
+    log_record = json.loads(formatter.format(record))
+
+    assert log_record['message'] == 'Message text'
+    assert log_record['module'] == 'AML/module'
+    assert log_record['function'] == 'function'
+    assert log_record['line'] == 10
+    assert datetime.fromisoformat(log_record['timestamp']).timestamp() == pytest.approx(record.created, abs=1e-5)
+
+
+def test_json_formatter_custom_encoder():
+    formatter = JSONFormatter('article_models_library', encoder=lambda log_record: log_record['message'])
+    assert formatter.format(make_record()) == 'Message text'
+
+
+def test_json_formatter_exception():
+    try:
+        raise ValueError('error')
+    except ValueError:
+        record = make_record(exc_info=__import__('sys').exc_info())
+    record.extra_errors = [{'loc': ['id'], 'type': 'string_pattern_mismatch'}]
+
+    log_record = json.loads(JSONFormatter('article_models_library').format(record))
+
+    assert log_record['exception'] == {'number_of_errors': 1, 'detail': record.extra_errors}
+
+
+@pytest.mark.parametrize('async_mode', [False, True])
+def test_setup_logger_is_idempotent(async_mode):
+    stream = StringIO()
+    setup_logger('article_models_library', async_mode=async_mode, stream=StringIO())
+    logger = setup_logger('article_models_library', async_mode=async_mode, stream=stream)
+
+    logger.info('Hello %s', 'world')
+    stop_logging()
+
+    assert len(logger.handlers) == 1
+    assert [json.loads(line)['message'] for line in stream.getvalue().splitlines()] == ['Hello world']
+    setup_logger('article_models_library', stream=StringIO())
+
+
+@pytest.mark.parametrize('overflow, expected_messages', [('drop', ['0']), ('drop_oldest', ['2'])])
+def test_bounded_queue_handler_overflow(overflow, expected_messages):
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow=overflow)
+
+    for number in range(3):
+        handler.handle(make_record(message=str(number), args=()))
+
+    assert handler.dropped == 2
+    assert [handler.queue.get_nowait().msg for _ in range(handler.queue.qsize())] == expected_messages
+
+
+def test_bounded_queue_handler_leaves_the_record_unchanged():
+    handler = BoundedQueueHandler(queue.Queue())
+    record = make_record()
+    handler.handle(record)
+
+    queued = handler.queue.get_nowait()
+    assert (queued.msg, queued.args) == ('Message text', None)
+    assert (record.msg, record.args) == ('Message %s', ('text',))
+
+
+def test_bounded_queue_handler_unknown_overflow():
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(), overflow='unknown')
+
+
+def make_error_record(loc='id', error_type='string_pattern_mismatch'):
+    record = make_record(message='Validation failed', args=())
+    record.exc_info = (ValueError, ValueError('error'), None)
+    record.extra_errors = [{'loc': [loc], 'type': error_type}]
+    return record
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+test_cases_error_filter = [
+    {
+        'test_description': 'Keep first occurrences in full, then sample',
+        'filter': {'keep_first': 2, 'sample_rate': 0.5},
+        'records': [make_error_record() for _ in range(6)],
+        'expected_kept': [True, True, False, True, False, True],
+    },
+    {
+        'test_description': 'Signatures are counted separately',
+        'filter': {'keep_first': 1, 'sample_rate': 0},
+        'records': [make_error_record(), make_error_record('pages'), make_error_record(),
+                    make_error_record('pages')],
+        'expected_kept': [True, True, False, False],
+    },
+    {
+        'test_description': 'Records without validation errors always pass',
+        'filter': {'keep_first': 0, 'sample_rate': 0},
+        'records': [make_record(), make_record()],
+        'expected_kept': [True, True],
+    },
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_error_filter,
+                         ids=[case['test_description'] for case in test_cases_error_filter])
+def test_validation_error_aggregation_filter(test_data):
+    error_filter = ValidationErrorAggregationFilter(**test_data['filter'])
+    assert [bool(error_filter.filter(record)) for record in test_data['records']] == test_data['expected_kept']
+
+
+valid_metadata = {'id': '10.1000/1', 'title': 'Title', 'authors': 'John Doe', 'journal': 'Journal', 'year': 2020,
+                  'volume': 1, 'pages': '1-2', 'keywords': 'science'}
+
+
+def make_library_error_record(**fields):
+    try:
+        ArticleMetadataDBSchema.model_validate({**valid_metadata, **fields})
+    except ValidationError as error:
+        exception = ModelValidationException.from_validation_error(error)
+    record = make_record(message='Validation failed', args=())
+    record.exc_info = (type(exception), exception, None)
+    return record
+
+
+def test_validation_error_aggregation_filter_reads_library_exceptions():
+    bad_id, bad_title = make_library_error_record(id='invalid'), make_library_error_record(title='')
+    signature = ValidationErrorAggregationFilter.signature
+
+    assert signature(bad_id) == ('AML-1', (('string_pattern_mismatch', 'id'),))
+    assert signature(bad_title) == ('AML-1', (('string_too_short', 'title'),))
+    bad_title.extra_errors = bad_title.exc_info[1].errors
+    assert signature(bad_title) == ('AML-1', (('string_too_short', 'title'),))
+
+    error_filter = ValidationErrorAggregationFilter(keep_first=1, sample_rate=0)
+    records = [bad_id, bad_title, make_library_error_record(id='invalid'), make_library_error_record(title='')]
+    assert [bool(error_filter.filter(record)) for record in records] == [True, True, False, False]
+
+
+def test_validation_error_aggregation_filter_compacts_sampled_records():
+    error_filter = ValidationErrorAggregationFilter(keep_first=1, sample_rate=1)
+    first, second = make_error_record(), make_error_record()
+
+    error_filter.filter(first)
+    error_filter.filter(second)
+
+    assert first.exc_info is not None and not hasattr(first, 'occurrences')
+    assert second.exc_info is None and second.occurrences == 2
+    assert json.loads(JSONFormatter('article_models_library').format(second))['occurrences'] == 2
+
+
+def test_setup_logger_with_error_filter_summary():
+    stream = StringIO()
+    clock = FakeClock()
+    error_filter = ValidationErrorAggregationFilter(keep_first=1, sample_rate=0, summary_interval=10, clock=clock)
+    logger = setup_logger('article_models_library', stream=stream, error_filter=error_filter)
+
+    for _ in range(3):
+        logger.error('Validation failed', exc_info=ValueError('error'),
+                     extra={'extra_errors': [{'loc': ['id'], 'type': 'string_pattern_mismatch'}]})
+    clock.now = 11
+    logger.error('Validation failed', exc_info=ValueError('error'),
+                 extra={'extra_errors': [{'loc': ['id'], 'type': 'string_pattern_mismatch'}]})
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line['message'] for line in lines] == ['Validation failed', 'Suppressed repeated validation errors']
+    assert lines[1]['suppressed_errors'] == [{'error_code': None, 'errors': ['string_pattern_mismatch at id'],
+                                              'suppressed': 3, 'total': 4}]
+    setup_logger('article_models_library', stream=StringIO())
+
+
+@pytest.mark.parametrize('async_mode', [False, True])
+def test_stop_logging_flushes_error_filter_summary(async_mode):
+    stream = StringIO()
+    error_filter = ValidationErrorAggregationFilter(keep_first=1, sample_rate=0, summary_interval=3600)
+    logger = setup_logger('article_models_library', async_mode=async_mode, stream=stream, error_filter=error_filter)
+
+    for _ in range(3):
+        logger.error('Validation failed', exc_info=ValueError('error'),
+                     extra={'extra_errors': [{'loc': ['id'], 'type': 'string_pattern_mismatch'}]})
+    stop_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line['message'] for line in lines] == ['Validation failed', 'Suppressed repeated validation errors']
+    assert lines[1]['suppressed_errors'][0]['suppressed'] == 2
+    setup_logger('article_models_library', stream=StringIO())
@@ -0,0 +1,135 @@
+import pickle
+import random
+import re
+
+import pytest
+from article_models.article_nosql_models import ArticleTextDBSchema, Image, LazyArticleTextDBSchema, Table
+from article_models.markdown_sections import SectionTree
+
+TEXT = '''Preamble text.
+# Introduction
+See fig.1 and Tab.1.
+## Background
+Earlier work, fig.10.
+```python
+# not a heading
+```
+## Scope
+Nothing here, not even fig.1.2.
+# Results
+Results are in tab.1 and fig.1.
+'''
+
+images = [Image(image_number='fig.1', file_path='/images/fig1.png'),
+          Image(image_number='fig.10', file_path='/images/fig10.png')]
+tables = [Table(table_number='tab.1', file_path='/tables/tab1.csv')]
+
+structure_cases = [
+    {'test_description': 'Preamble', 'index': 0, 'expected': (0, '', None, [], [])},
+    {'test_description': 'Top-level section', 'index': 1, 'expected': (1, 'Introduction', None, ['fig.1'], ['tab.1'])},
+    {'test_description': 'Subsection with fenced code', 'index': 2, 'expected': (2, 'Background', 1, ['fig.10'], [])},
+    {'test_description': 'Reference prefix is not a reference', 'index': 3, 'expected': (2, 'Scope', 1, [], [])},
+    {'test_description': 'Last section', 'index': 4, 'expected': (1, 'Results', None, ['fig.1'], ['tab.1'])},
+]
+
+
+def summary(section):
+    return (section.level, section.title, section.parent, [image.image_number for image in section.images],
+            [table.table_number for table in section.tables])
+
+
+def make_article(text=TEXT, model=ArticleTextDBSchema):
+    return model(id='10.1000/1', title='Title', authors=[{'name': 'John', 'surname': 'Doe'}], abstract='Abstract',
+                 keywords={'science'}, markdown_full_text=text, images=[image.model_dump() for image in images],
+                 tables=[table.model_dump() for table in tables])
+
+
+@pytest.mark.parametrize('test_data', structure_cases, ids=[case['test_description'] for case in structure_cases])
+def test_section_tree_structure(test_data):
+    tree = SectionTree(TEXT, images, tables)
+    assert len(tree) == 5
+    assert summary(tree[test_data['index']]) == test_data['expected']
+
+
+def test_section_tree_offsets():
+    tree = SectionTree(TEXT, images, tables)
+    introduction = tree.find('introduction')
+    assert tree.text_of(introduction).startswith('# Introduction') and tree.text_of(introduction).endswith('fig.1.2.\n')
+    assert tree.text_of(introduction, subsections=False) == '# Introduction\nSee fig.1 and Tab.1.\n'
+    assert [section.title for section in tree.children(1)] == ['Background', 'Scope']
+    assert tree.section_at(TEXT.index('not a heading')).title == 'Background'
+    assert tree.search(re.compile(r'fig\.\d+'), tree.find('Results'))[0] == 'fig.1'
+    assert tree.search(re.compile('Preamble'), introduction) is None
+
+
+edits = [
+    ('Edit inside a section', lambda text: text.replace('Earlier work', 'Much earlier work')),
+    ('Add a heading', lambda text: text.replace('Nothing here', '### Detail\nNothing here')),
+    ('Remove a heading', lambda text: text.replace('## Scope\n', '')),
+    ('Open a fence', lambda text: text.replace('Nothing here', '~~~\nNothing here')),
+    ('Close the fence early', lambda text: text.replace('# not a heading', '```\n# now a heading')),
+    ('Add a reference', lambda text: text.replace('Nothing here', 'See fig.10')),
+    ('Edit the first line', lambda text: '# Preamble' + text[8:]),
+    ('Append text', lambda text: text + '## Appendix\nfig.1\n'),
+    ('Remove everything but the end', lambda text: text[text.index('# Results'):]),
+    ('Join with the previous line', lambda text: text.replace('\n# Results', ' # Results')),
+]
+
+
+@pytest.mark.parametrize('edit', [edit for _, edit in edits], ids=[description for description, _ in edits])
+def test_section_tree_update_matches_full_parse(edit):
+    tree = SectionTree(TEXT, images, tables)
+    sections = list(tree.sections)
+    assert tree.updated(edit(TEXT)).sections == SectionTree(edit(TEXT), images, tables).sections
+    assert tree.text is TEXT and tree.sections == sections
+
+
+def test_section_tree_random_updates_match_full_parse():
+    rng = random.Random(0)
+    pieces = ['# A\n', '## B\n', '### C\n', 'text fig.1 ', 'tab.1\n', '```\n', '\n', 'x']
+    tree = SectionTree(TEXT, images, tables)
+    for _ in range(1000):
+        text = tree.text
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.randint(0, 20))
+        text = text[:start] + ''.join(rng.choices(pieces, k=rng.randint(0, 3))) + text[end:]
+        tree = tree.updated(text)
+        assert tree.sections == SectionTree(text, images, tables).sections
+
+
+def test_article_sections_are_cached_and_updated():
+    article = make_article()
+    tree = article.sections
+    assert article.sections is tree
+    assert [section.title for section in tree] == ['', 'Introduction', 'Background', 'Scope', 'Results']
+    assert tree[1].images == (article.images[0],)
+    article.markdown_full_text = TEXT.replace('## Scope', '## Outlook')
+    assert article.sections[3].title == 'Outlook' and tree[3].title == 'Scope'
+    tree = article.sections
+    assert article.sections is tree
+    article.images = []
+    assert article.sections is not tree and article.sections[1].images == ()
+
+
+def test_article_copies_do_not_share_sections():
+    article = make_article('# One\n## Two\n')
+    tree = article.sections
+    copied = article.model_copy(update={'markdown_full_text': '# Three\n'})
+    deep = article.model_copy(deep=True)
+
+    assert [section.title for section in copied.sections] == ['Three']
+    assert [section.title for section in deep.sections] == ['One', 'Two'] and deep.sections is not tree
+    assert [section.title for section in tree] == ['One', 'Two'] and article.sections is tree
+
+
+def test_article_sections_do_not_change_equality():
+    article = make_article()
+    other = make_article()
+    article.sections
+    assert article == other
+    assert pickle.loads(pickle.dumps(article)) == article
+
+
+def test_lazy_article_sections():
+    article = make_article(model=LazyArticleTextDBSchema)
+    assert [section.title for section in article.sections] == ['', 'Introduction', 'Background', 'Scope', 'Results']
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import pytest
+
+import article_models
+from article_models.validation_cache import schema_fingerprint
+
+
+def run_python(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_package_import_is_lazy():
+    loaded = run_python('import sys, article_models; print(sorted(name for name in sys.modules '
+                        'if name.startswith(("article_models.", "pydantic"))))')
+    assert loaded == '[]'
+
+
+def test_models_are_built_on_first_use():
+    output = run_python('from article_models.schemas import ArticleMetadata\n'
+                        'print(ArticleMetadata.__pydantic_complete__)\n'
+                        'ArticleMetadata(id="10.1000/1", title="T", authors=[{"name": "J", "surname": "D"}],'
+                        ' keywords={"k"}, journal="J", year=2020, volume=1, pages="1-2")\n'
+                        'print(ArticleMetadata.__pydantic_complete__)')
+    assert output.split() == ['False', 'True']
+
+
+@pytest.mark.parametrize('name, module', [('ArticleMetadata', 'schemas'), ('Author', 'article_nosql_models'),
+                                          ('ArticlePDFDBSchema', 'article_sql_models'),
+                                          ('setup_logger', 'logger_config')])
+def test_package_lazy_attributes(name, module):
+    assert getattr(article_models, name) is getattr(getattr(article_models, module), name)
+    assert name in dir(article_models)
+
+
+def test_package_unknown_attribute():
+    with pytest.raises(AttributeError):
+        article_models.NotAModel
+
+
+def test_schema_fingerprint_of_deferred_model():
+    output = run_python('from article_models.article_sql_models import ArticleMetadataDBSchema as Model\n'
+                        'from article_models.validation_cache import schema_fingerprint\n'
+                        'print(Model.__pydantic_complete__)\n'
+                        'schema_fingerprint(Model)\n'
+                        'print(Model.__pydantic_complete__)')
+    assert output.split() == ['False', 'True']
+    assert schema_fingerprint(article_models.ArticleMetadataDBSchema) != schema_fingerprint(
+        article_models.ArticlePDFDBSchema)
@@ -0,0 +1,77 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from article_models.parallel_validation import validate_parallel
+from article_models.article_nosql_models import ArticleTextDBSchema
+
+article_text = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Title',
+    'authors': [{'name': 'John', 'surname': 'Doe'}],
+    'abstract': 'This is an abstract.',
+    'keywords': ['science', 'AI'],
+    'markdown_full_text': '## Introduction\nThis is a sample markdown text.'
+}
+
+
+def make_lines(count, invalid_every=0):
+    lines = []
+    for i in range(count):
+        row = {**article_text, 'title': f'Title {i}'}
+        if invalid_every and i % invalid_every == 0:
+            row['id'] = 'invalid_doi'
+        lines.append(json.dumps(row).encode())
+    return lines
+
+
+test_cases = [
+    {
+        'test_description': 'Ordered results across processes',
+        'lines': make_lines(25, invalid_every=5),
+        'kwargs': {'workers': 2, 'chunk_size': 4, 'ordered': True},
+    },
+    {
+        'test_description': 'Unordered results across processes',
+        'lines': make_lines(25, invalid_every=5),
+        'kwargs': {'workers': 2, 'chunk_size': 4, 'ordered': False},
+    },
+    {
+        'test_description': 'Backpressure with a single pending chunk',
+        'lines': make_lines(10),
+        'kwargs': {'workers': 1, 'chunk_size': 3, 'max_pending': 1},
+    },
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_validate_parallel(test_data):
+    results = list(validate_parallel(ArticleTextDBSchema, test_data['lines'], **test_data['kwargs']))
+
+    titles = [article.title for result in results for article in result.valid]
+    errors = {index: error for result in results for index, error in result.errors.items()}
+    expected_invalid = [i for i, line in enumerate(test_data['lines']) if b'invalid_doi' in line]
+    expected_titles = [f'Title {i}' for i in range(len(test_data['lines'])) if i not in expected_invalid]
+
+    if test_data['kwargs'].get('ordered', True):
+        assert titles == expected_titles
+    else:
+        assert sorted(titles) == sorted(expected_titles)
+    assert sorted(errors) == expected_invalid
+    assert all(error[0]['loc'] == ('id',) for error in errors.values())
+
+
+def test_validate_parallel_with_caller_executor():
+    lines = make_lines(7)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(validate_parallel(ArticleTextDBSchema, lines, chunk_size=2, executor=executor))
+    assert sum(len(result.valid) for result in results) == 7
+
+
+def test_validate_parallel_skips_blank_lines():
+    lines = make_lines(2)
+    lines[1:1] = [b'', b' \r\n', '\t\n']
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = list(validate_parallel(ArticleTextDBSchema, lines, chunk_size=10, executor=executor))
+    assert [article.title for article in results[0].valid] == ['Title 0', 'Title 1']
+    assert results[0].errors == {}
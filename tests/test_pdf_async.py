@@ -0,0 +1,194 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from article_models.article_sql_models import ArticlePDFDBSchema
+from article_models.pdf_async import (PDFDigest, aiter_chunks, digest_pdf, load_pdf, load_pdfs, save_pdf,
+                                      save_pdfs)
+from article_models.schemas import ArticlePDFFile
+
+PDF_PATH = Path(os.path.dirname(os.path.abspath(__file__))) / 'pdf' / 'example.pdf'
+PAYLOAD = PDF_PATH.read_bytes()
+DIGEST = PDFDigest(len(PAYLOAD), hashlib.sha256(PAYLOAD).hexdigest())
+
+
+def mapped_pdf():
+    with open(PDF_PATH, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+sources = {
+    'bytes': lambda: PAYLOAD,
+    'BytesIO': lambda: BytesIO(PAYLOAD),
+    'mmap': mapped_pdf,
+    'path': lambda: PDF_PATH,
+    'file': lambda: open(PDF_PATH, 'rb'),
+}
+
+
+class Reader:
+    """A binary file-like object that is not a BytesIO, so it is read like an open file."""
+
+    def __init__(self, payload):
+        self.buffer = BytesIO(payload)
+
+    def read(self, size=-1):
+        return self.buffer.read(size)
+
+    def seekable(self):
+        return True
+
+    def seek(self, position):
+        return self.buffer.seek(position)
+
+
+async def collect(pdf, chunk_size):
+    return [bytes(chunk) async for chunk in aiter_chunks(pdf, chunk_size)]
+
+
+@pytest.mark.parametrize('source', sources.values(), ids=sources.keys())
+def test_aiter_chunks(source):
+    pdf = ArticlePDFFile(id='10.1000/1', pdf_file=source())
+    chunks = asyncio.run(collect(pdf, 1000))
+    assert b''.join(chunks) == PAYLOAD
+    assert all(len(chunk) == 1000 for chunk in chunks[:-1])
+    assert asyncio.run(digest_pdf(pdf, 1000)) == DIGEST
+
+
+def test_load_pdf():
+    record = ArticlePDFDBSchema(id='10.1000/1', file_path=str(PDF_PATH))
+    pdf, digest = asyncio.run(load_pdf(record, chunk_size=4096))
+    assert pdf.id == '10.1000/1'
+    assert pdf.is_available
+    assert pdf.read_bytes() == PAYLOAD
+    assert digest == DIGEST
+
+
+def test_load_pdf_without_file():
+    with pytest.raises(ValueError, match='not available'):
+        asyncio.run(load_pdf(ArticlePDFDBSchema(id='10.1000/1')))
+
+
+def test_load_pdf_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(load_pdf(ArticlePDFDBSchema(id='10.1000/1', file_path=str(tmp_path / 'missing.pdf'))))
+
+
+@pytest.mark.parametrize('source', sources.values(), ids=sources.keys())
+def test_save_pdf(tmp_path, source):
+    pdf = ArticlePDFFile(id='10.1000/1', pdf_file=source())
+    record, digest = asyncio.run(save_pdf(pdf, tmp_path / 'saved.pdf', chunk_size=1000))
+    assert record == ArticlePDFDBSchema(id='10.1000/1', file_path=str(tmp_path / 'saved.pdf'))
+    assert record.is_pdf_available
+    assert digest == DIGEST
+    assert (tmp_path / 'saved.pdf').read_bytes() == PAYLOAD
+    assert os.listdir(tmp_path) == ['saved.pdf']
+
+
+def test_save_pdf_round_trip(tmp_path):
+    record, _ = asyncio.run(save_pdf(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD), tmp_path / 'a.pdf'))
+    pdf, digest = asyncio.run(load_pdf(record))
+    assert pdf.read_bytes() == PAYLOAD
+    assert digest == DIGEST
+
+
+def test_save_pdf_failure_leaves_no_file(tmp_path):
+    class BrokenFile(Reader):
+        def read(self, size=-1):
+            raise OSError('disk error')
+
+    pdf = ArticlePDFFile(id='10.1000/1', pdf_file=BrokenFile(PAYLOAD))
+    with pytest.raises(OSError, match='disk error'):
+        asyncio.run(save_pdf(pdf, tmp_path / 'broken.pdf'))
+    assert os.listdir(tmp_path) == []
+
+
+def test_save_pdf_cancelled_after_replace_keeps_cancellation(tmp_path, monkeypatch):
+    replace = os.replace
+
+    def replace_then_cancel(source, destination):
+        # The worker thread completes the replace, the awaiting task is cancelled meanwhile.
+        replace(source, destination)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(os, 'replace', replace_then_cancel)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(save_pdf(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD), tmp_path / 'a.pdf'))
+    assert os.listdir(tmp_path) == ['a.pdf']
+
+
+def test_save_pdf_invalid_path_is_rejected_before_writing(tmp_path):
+    with pytest.raises(ValidationError):
+        asyncio.run(save_pdf(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD), tmp_path / '<bad>.pdf'))
+    assert os.listdir(tmp_path) == []
+
+
+def test_save_pdf_without_file(tmp_path):
+    with pytest.raises(ValueError, match='not available'):
+        asyncio.run(save_pdf(ArticlePDFFile(id='10.1000/1'), tmp_path / 'a.pdf'))
+
+
+def test_many_bounded_concurrency(tmp_path, monkeypatch):
+    active = maximum = 0
+    lock = threading.Lock()
+
+    class SlowPDF(Reader):
+        def read(self, size=-1):
+            nonlocal active, maximum
+            with lock:
+                active += 1
+                maximum = max(maximum, active)
+            threading.Event().wait(0.002)
+            with lock:
+                active -= 1
+            return super().read(size)
+
+    items = [(ArticlePDFFile(id=f'10.1000/{i}', pdf_file=SlowPDF(PAYLOAD)), tmp_path / f'{i}.pdf') for i in range(12)]
+    saved = asyncio.run(save_pdfs(items, concurrency=3, chunk_size=4096))
+    assert [record.id for record, _ in saved] == [f'10.1000/{i}' for i in range(12)]
+    assert all(digest == DIGEST for _, digest in saved)
+    assert 1 < maximum <= 3
+
+    loaded = asyncio.run(load_pdfs([record for record, _ in saved], concurrency=2))
+    assert [pdf.id for pdf, _ in loaded] == [f'10.1000/{i}' for i in range(12)]
+    assert all(pdf.read_bytes() == PAYLOAD and digest == DIGEST for pdf, digest in loaded)
+
+
+def test_event_loop_is_not_blocked(tmp_path):
+    path = tmp_path / 'large.pdf'
+    path.write_bytes(os.urandom(8 * 2 ** 20))
+    ticks = 0
+
+    async def ticker(done):
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        done = asyncio.Event()
+        task = asyncio.create_task(ticker(done))
+        await load_pdf(ArticlePDFDBSchema(id='10.1000/1', file_path=str(path)), chunk_size=2 ** 16)
+        done.set()
+        await task
+
+    asyncio.run(main())
+    assert ticks > 10
+
+
+def test_aiter_chunks_do_not_pin_bytesio():
+    buffer = BytesIO(PAYLOAD)
+    chunks = asyncio.run(collect_views(ArticlePDFFile(id='10.1000/1', pdf_file=buffer), 1000))
+    buffer.seek(0, 2)
+    buffer.write(b'appended')
+    assert b''.join(chunks) == PAYLOAD
+
+
+async def collect_views(pdf, chunk_size):
+    return [chunk async for chunk in aiter_chunks(pdf, chunk_size)]
@@ -0,0 +1,226 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from article_models.article_sql_models import ArticlePDFDBSchema
+from article_models.pdf_async import digest_pdf, load_pdf
+from article_models.pdf_store import PDFBlobStore, StoreStats
+from article_models.schemas import ArticlePDFFile
+
+PDF_PATH = Path(os.path.dirname(os.path.abspath(__file__))) / 'pdf' / 'example.pdf'
+PAYLOAD = PDF_PATH.read_bytes()
+SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+OTHER = b'%PDF-1.7\nanother article\n%%EOF\n'
+
+
+def blob_files(store):
+    return sorted(path.name for path in store.blobs.glob('*/*'))
+
+
+def test_put_stores_identical_pdfs_once(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    preprint = store.put(ArticlePDFFile(id='10.1000/preprint', pdf_file=PAYLOAD))
+    published = store.put(ArticlePDFFile(id='10.1000/published', pdf_file=PDF_PATH))
+
+    assert preprint.file_path == published.file_path == str(store.path_of(SHA256))
+    assert preprint.is_pdf_available and isinstance(preprint, ArticlePDFDBSchema)
+    assert blob_files(store) == [SHA256]
+    assert store.refcount(SHA256) == 2
+    assert store.digest_of('10.1000/preprint') == SHA256
+    assert store.stats() == StoreStats(dois=2, blobs=1, bytes=len(PAYLOAD))
+    assert os.listdir(store.tmp) == []
+
+
+def test_get_and_record(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    pdf = store.get('10.1000/1')
+    assert pdf.id == '10.1000/1'
+    assert pdf.pdf_file == store.path_of(SHA256)
+    assert pdf.read_bytes() == PAYLOAD
+    assert store.get('10.1000/2') is None
+    assert store.record('10.1000/2') == ArticlePDFDBSchema(id='10.1000/2')
+    assert not store.record('10.1000/2').is_pdf_available
+    assert '10.1000/1' in store and '10.1000/2' not in store
+    assert len(store) == 1
+
+
+def test_blobs_are_read_only(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    assert not os.stat(store.path_of(SHA256)).st_mode & 0o222
+
+
+def test_release_deletes_blob_with_last_reference(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    store.put(ArticlePDFFile(id='10.1000/2', pdf_file=PAYLOAD))
+
+    assert store.release('10.1000/1')
+    assert store.refcount(SHA256) == 1
+    assert store.path_of(SHA256).exists()
+    assert store.release('10.1000/2')
+    assert store.refcount(SHA256) == 0
+    assert not store.path_of(SHA256).exists()
+    assert not store.release('10.1000/2')
+    assert store.stats() == StoreStats(0, 0, 0)
+
+
+def test_put_replaces_previous_content_of_doi(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    record = store.put(ArticlePDFFile(id='10.1000/1', pdf_file=OTHER))
+    other = hashlib.sha256(OTHER).hexdigest()
+    assert record.file_path == str(store.path_of(other))
+    assert blob_files(store) == [other]
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=OTHER))
+    assert store.refcount(other) == 1
+
+
+def test_refs_persist(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put_many([ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD), ArticlePDFFile(id='10.1000/2', pdf_file=PAYLOAD),
+                    ArticlePDFFile(id='10.1000/3', pdf_file=OTHER)])
+    assert json.loads((tmp_path / 'refs.json').read_text())['10.1000/3'] == hashlib.sha256(OTHER).hexdigest()
+
+    reopened = PDFBlobStore(tmp_path)
+    assert len(reopened) == 3
+    assert reopened.refcount(SHA256) == 2
+    assert reopened.get('10.1000/2').read_bytes() == PAYLOAD
+
+
+def test_known_digest_skips_the_copy(tmp_path):
+    class Unreadable(ArticlePDFFile):
+        def iter_chunks(self, chunk_size=None):
+            raise AssertionError('duplicate PDF was read')
+
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    duplicate = Unreadable(id='10.1000/2', pdf_file=PDF_PATH)
+    sha256 = asyncio.run(digest_pdf(duplicate)).sha256
+    record = store.put(duplicate, sha256=sha256)
+    assert record.file_path == str(store.path_of(SHA256))
+    assert store.refcount(SHA256) == 2
+
+
+def test_failed_write_leaves_no_partial_file(tmp_path):
+    class Broken:
+        def __init__(self):
+            self.reads = 0
+
+        def seekable(self):
+            return False
+
+        def read(self, size=-1):
+            self.reads += 1
+            if self.reads > 1:
+                raise OSError('connection reset')
+            return b'%PDF-1.7\n'
+
+    store = PDFBlobStore(tmp_path)
+    with pytest.raises(OSError, match='connection reset'):
+        store.put(ArticlePDFFile(id='10.1000/1', pdf_file=Broken()))
+    assert os.listdir(store.tmp) == []
+    assert blob_files(store) == []
+    assert '10.1000/1' not in store
+
+
+def test_collect_garbage(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    (store.tmp / 'crashed.pdf').write_bytes(b'partial')
+    orphan = store.path_of('ab' + '0' * 62)
+    orphan.parent.mkdir(exist_ok=True)
+    orphan.write_bytes(OTHER)
+
+    assert store.collect_garbage() == 2
+    assert blob_files(store) == [SHA256]
+    assert os.listdir(store.tmp) == []
+
+
+def test_concurrent_puts(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    threads = [threading.Thread(target=store.put, args=(ArticlePDFFile(id=f'10.1000/{i}', pdf_file=PAYLOAD),))
+               for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.refcount(SHA256) == 8
+    assert blob_files(store) == [SHA256]
+
+
+def test_records_work_with_async_loading(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    record = store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+    pdf, digest = asyncio.run(load_pdf(record))
+    assert pdf.read_bytes() == PAYLOAD
+    assert digest.sha256 == SHA256
+
+
+@pytest.mark.parametrize('sha256', ['../victim.txt', SHA256.upper(), SHA256[:-1], SHA256 + '/..'])
+def test_malformed_digest_is_rejected(tmp_path, sha256):
+    victim = tmp_path / 'victim.txt'
+    victim.write_text('keep me')
+    store = PDFBlobStore(tmp_path / 'store')
+    with pytest.raises(ValueError, match='not a lowercase hex SHA-256'):
+        store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD), sha256=sha256)
+    with pytest.raises(ValueError):
+        store.path_of(sha256)
+    assert '10.1000/1' not in store
+    assert victim.read_text() == 'keep me'
+
+
+def test_wrong_digest_of_new_content_is_rejected(tmp_path):
+    store = PDFBlobStore(tmp_path)
+    with pytest.raises(ValueError, match='has SHA-256'):
+        store.put(ArticlePDFFile(id='10.1000/1', pdf_file=OTHER), sha256=SHA256)
+    assert '10.1000/1' not in store
+    assert blob_files(store) == [] and list(store.tmp.iterdir()) == []
+    assert store.collect_garbage() == 0
+
+
+@pytest.mark.parametrize('operation', ['put', 'put_many'])
+def test_failed_save_rolls_back_put(tmp_path, monkeypatch, operation):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+
+    def failing_save():
+        raise OSError('disk full')
+
+    monkeypatch.setattr(store, '_save_refs', failing_save)
+    pdf = ArticlePDFFile(id='10.1000/1', pdf_file=OTHER)
+    with pytest.raises(OSError, match='disk full'):
+        store.put(pdf) if operation == 'put' else store.put_many([pdf])
+    assert store.digest_of('10.1000/1') == SHA256
+    assert store.refcount(SHA256) == 1 and store.refcount(hashlib.sha256(OTHER).hexdigest()) == 0
+    assert store.get('10.1000/1').read_bytes() == PAYLOAD
+
+
+def test_release_saves_refs_before_deleting_the_blob(tmp_path, monkeypatch):
+    store = PDFBlobStore(tmp_path)
+    store.put(ArticlePDFFile(id='10.1000/1', pdf_file=PAYLOAD))
+
+    def failing_save():
+        raise OSError('disk full')
+
+    monkeypatch.setattr(store, '_save_refs', failing_save)
+    with pytest.raises(OSError, match='disk full'):
+        store.release('10.1000/1')
+    assert store.path_of(SHA256).exists()
+    assert store.refcount(SHA256) == 1
+    assert store.get('10.1000/1').read_bytes() == PAYLOAD
+    assert PDFBlobStore(tmp_path).refcount(SHA256) == 1
+
+    monkeypatch.undo()
+    order = []
+    original_save, original_unlink = store._save_refs, os.unlink
+    monkeypatch.setattr(store, '_save_refs', lambda: (order.append('save'), original_save()))
+    monkeypatch.setattr(os, 'unlink', lambda path: (order.append('unlink'), original_unlink(path)))
+    assert store.release('10.1000/1')
+    assert order == ['save', 'unlink']
+    assert not store.path_of(SHA256).exists()
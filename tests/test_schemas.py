@@ -1,10 +1,14 @@
 import pytest
 import os
-from io import BytesIO
+import json
+import mmap
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import List
 from pydantic import ValidationError
 
 from article_models.article_nosql_models import Author
-from article_models.schemas import ArticlePDFFile, ResponseSchema, StatusEnum, ArticleMetadata
+from article_models.schemas import ArticlePDFFile, ResponseSchema, StatusEnum, ArticleMetadata, RawJSON
 
 
 def load_pdf(file_path):
@@ -79,6 +83,45 @@ def test_article_pdf(test_data):
             ArticlePDFFile(**test_data['article_pdf'])
 
 
+def pdf_path():
+    return Path(os.path.dirname(os.path.abspath(__file__))) / 'pdf' / 'example.pdf'
+
+
+def mapped_pdf():
+    with open(pdf_path(), 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+test_cases_pdf_sources = [
+    {'test_description': 'BytesIO source', 'pdf_file': lambda: BytesIO(pdf_path().read_bytes())},
+    {'test_description': 'bytes source', 'pdf_file': lambda: pdf_path().read_bytes()},
+    {'test_description': 'memoryview source', 'pdf_file': lambda: memoryview(pdf_path().read_bytes())},
+    {'test_description': 'mmap source', 'pdf_file': mapped_pdf},
+    {'test_description': 'Path source', 'pdf_file': pdf_path},
+    {'test_description': 'File handle source', 'pdf_file': lambda: open(pdf_path(), 'rb')},
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases_pdf_sources,
+                         ids=[case['test_description'] for case in test_cases_pdf_sources])
+def test_article_pdf_sources(test_data):
+    expected = pdf_path().read_bytes()
+    article_pdf = ArticlePDFFile(id='10.1000/10/123456', pdf_file=test_data['pdf_file']())
+
+    assert article_pdf.is_available
+    assert article_pdf.size == len(expected)
+    assert b''.join(article_pdf.iter_chunks(chunk_size=1000)) == expected
+    assert article_pdf.read_bytes() == expected
+    with article_pdf.getbuffer() as view:
+        assert view[:5] == expected[:5]
+
+
+def test_article_pdf_without_file():
+    article_pdf = ArticlePDFFile(id='10.1000/10/123456', pdf_file=None)
+    with pytest.raises(ValueError):
+        article_pdf.read_bytes()
+
+
 test_cases_response_schema = [
     {
         'test_description': 'Valid ResponseSchema with SUCCESS status',
@@ -142,6 +185,29 @@ def test_response_schema(test_data):
             ResponseSchema(**test_data['response_data'])
 
 
+def test_typed_response_schema():
+    article = ArticleMetadata(**test_cases_article_metadata[0]['article_metadata'])
+    response = ResponseSchema[List[ArticleMetadata]](status=StatusEnum.SUCCESS, message='OK', http_status=200,
+                                                     data=[article.model_dump()])
+
+    assert response.data == [article]
+    assert json.loads(response.dump_json()) == json.loads(
+        ResponseSchema(status=StatusEnum.SUCCESS, message='OK', http_status=200, data=[article]).model_dump_json())
+    with pytest.raises(ValidationError):
+        ResponseSchema[List[ArticleMetadata]](status=StatusEnum.SUCCESS, message='OK', http_status=200,
+                                              data=[{'id': 'invalid_doi'}])
+
+
+@pytest.mark.parametrize('response_type', [ResponseSchema, ResponseSchema[List[ArticleMetadata]]])
+def test_response_schema_raw_json(response_type):
+    raw = b'[{"id": "10.1000/10/123456"}]'
+    response = response_type(status=StatusEnum.SUCCESS, message='OK', http_status=200, data=RawJSON(raw))
+
+    assert response.dump_json().endswith(b',"data":' + raw + b'}')
+    assert json.loads(response.dump_json()) == json.loads(response.model_dump_json())
+    assert json.loads(response.dump_json())['data'] == [{'id': '10.1000/10/123456'}]
+
+
 test_cases_article_metadata = [
     {
         'article_metadata': {
@@ -242,3 +308,20 @@ def test_article_metadata(test_data):
     else:
         with pytest.raises(test_data['expected_exception']):
             ArticleMetadata(**test_data['article_metadata'])
+
+
+def test_article_pdf_rejects_text_files():
+    with open(pdf_path(), 'r', encoding='latin-1') as text_file:
+        with pytest.raises(ValidationError, match='binary mode'):
+            ArticlePDFFile(id='10.1000/1', pdf_file=text_file)
+    with pytest.raises(ValidationError, match='binary mode'):
+        ArticlePDFFile(id='10.1000/1', pdf_file=StringIO('%PDF'))
+
+
+def test_article_pdf_bytesio_chunks_do_not_pin_the_buffer():
+    buffer = BytesIO(pdf_path().read_bytes())
+    article_pdf = ArticlePDFFile(id='10.1000/1', pdf_file=buffer)
+    chunks = list(article_pdf.iter_chunks(1000))
+    buffer.seek(0, 2)
+    buffer.write(b'appended')
+    assert b''.join(chunks) == pdf_path().read_bytes()
@@ -0,0 +1,73 @@
+import pytest
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.schemas import ArticleMetadata
+from article_models.store import ArticleStore
+
+
+def make_article(number, year, keywords, surnames):
+    return ArticleMetadata(id=f'10.1000/{number}', title=f'Title {number}',
+                           authors=[{'name': 'Name', 'surname': surname} for surname in surnames],
+                           keywords=set(keywords), journal='Journal', year=year, volume=1, pages='1-2')
+
+
+articles = [
+    make_article(1, 2020, ['ai', 'science'], ['Doe']),
+    make_article(2, 2010, ['science'], ['Smith', 'Doe']),
+    make_article(3, 2015, ['ai'], ['Nowak']),
+    make_article(4, 2020, ['ai', 'research'], ['Smith']),
+]
+
+test_cases = [
+    {'test_description': 'All articles', 'query': {}, 'expected_ids': ['2', '3', '1', '4']},
+    {'test_description': 'Keyword', 'query': {'keywords': ['ai']}, 'expected_ids': ['3', '1', '4']},
+    {'test_description': 'Several keywords', 'query': {'keywords': ['ai', 'science']}, 'expected_ids': ['1']},
+    {'test_description': 'Surname', 'query': {'surname': 'Doe'}, 'expected_ids': ['2', '1']},
+    {'test_description': 'Year range', 'query': {'year_min': 2012, 'year_max': 2019}, 'expected_ids': ['3']},
+    {'test_description': 'Open year range', 'query': {'year_min': 2015}, 'expected_ids': ['3', '1', '4']},
+    {'test_description': 'Keyword, surname and year', 'query': {'keywords': ['ai'], 'surname': 'Smith',
+                                                                'year_max': 2020}, 'expected_ids': ['4']},
+    {'test_description': 'Unknown keyword', 'query': {'keywords': ['ai', 'unknown']}, 'expected_ids': []},
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_article_store_query(test_data):
+    store = ArticleStore(articles)
+    assert [article.id.split('/')[1] for article in store.query(**test_data['query'])] == test_data['expected_ids']
+
+
+def test_article_store_update_and_remove():
+    store = ArticleStore()
+    for article in articles:
+        store.add(article)
+
+    store.add(make_article(1, 2005, ['history'], ['Nowak']))
+    assert len(store) == 4
+    assert [article.id for article in store.query(keywords=['ai'])] == ['10.1000/3', '10.1000/4']
+    assert [article.id for article in store.query(surname='Nowak')] == ['10.1000/1', '10.1000/3']
+    assert [article.id for article in store.query(year_max=2010)] == ['10.1000/1', '10.1000/2']
+
+    removed = store.remove('10.1000/2')
+    assert removed.title == 'Title 2'
+    assert '10.1000/2' not in store
+    assert store.query(keywords=['science']) == []
+    assert [article.id for article in store.query(year_max=2010)] == ['10.1000/1']
+
+
+def test_article_store_with_article_text():
+    text = ArticleTextDBSchema(id='10.1000/5', title='Text', authors=[{'name': 'Name', 'surname': 'Doe'}],
+                               abstract='Abstract', keywords={'ai'}, markdown_full_text='Text')
+    store = ArticleStore([*articles, text])
+
+    assert store.get('10.1000/5') is text
+    assert [article.id for article in store.query(surname='Doe')] == ['10.1000/2', '10.1000/1', '10.1000/5']
+    assert text not in store.query(keywords=['ai'], year_min=0)
+
+
+def test_article_store_add_many_with_repeated_id():
+    store = ArticleStore([articles[1]])
+    store.add_many([make_article(1, 2000, ['ai'], ['Doe']), make_article(2, 1990, ['ai'], ['Doe']),
+                    make_article(1, 2020, ['ai'], ['Doe'])])
+    assert store._years == [(1990, '10.1000/2'), (2020, '10.1000/1')]
+    assert store.query(year_min=1995, year_max=2010) == []
+    assert [article.id for article in store.query(year_min=2015)] == ['10.1000/1']
@@ -0,0 +1,91 @@
+import json
+from io import BytesIO, StringIO
+
+import pytest
+from article_models.streaming import iter_ndjson
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.schemas import ArticleMetadata
+
+article_text = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Title',
+    'authors': [{'name': 'John', 'surname': 'Doe'}],
+    'abstract': 'This is an abstract.',
+    'keywords': ['science', 'AI'],
+    'markdown_full_text': '## Introduction\nThis is a sample markdown text.'
+}
+
+article_metadata = {
+    'id': '10.1000/10/123456',
+    'title': 'Example Article Title',
+    'authors': [{'name': 'John', 'surname': 'Smith'}],
+    'keywords': ['keyword1', 'keyword2'],
+    'journal': 'Example Journal',
+    'year': 2022,
+    'volume': 10,
+    'issue': 2,
+    'pages': '23-34'
+}
+
+
+def to_ndjson(rows):
+    return ''.join(row if isinstance(row, str) else json.dumps(row) + '\n' for row in rows)
+
+
+test_cases = [
+    {
+        'test_description': 'ArticleText lines from a binary stream',
+        'model': ArticleTextDBSchema,
+        'source': lambda text: BytesIO(text.encode()),
+        'rows': [article_text, article_text, article_text],
+        'chunk_size': 2,
+        'expected_chunk_sizes': [2, 1],
+        'expected_error_lines': []
+    },
+    {
+        'test_description': 'ArticleMetadata lines from a text stream with blank lines',
+        'model': ArticleMetadata,
+        'source': StringIO,
+        'rows': [article_metadata, '\n', article_metadata],
+        'chunk_size': 10,
+        'expected_chunk_sizes': [2],
+        'expected_error_lines': []
+    },
+    {
+        'test_description': 'Invalid lines go to the error handler',
+        'model': ArticleMetadata,
+        'source': lambda text: BytesIO(text.encode()),
+        'rows': [{**article_metadata, 'pages': '23'}, article_metadata, 'not json\n', article_metadata],
+        'chunk_size': 1,
+        'expected_chunk_sizes': [1, 1],
+        'expected_error_lines': [1, 3]
+    }
+]
+
+
+@pytest.mark.parametrize('test_data', test_cases, ids=[case['test_description'] for case in test_cases])
+def test_iter_ndjson(test_data):
+    error_lines = []
+    source = test_data['source'](to_ndjson(test_data['rows']))
+
+    chunks = list(iter_ndjson(source, test_data['model'], chunk_size=test_data['chunk_size'],
+                              on_error=lambda line_number, line, exc: error_lines.append(line_number)))
+
+    assert [len(chunk) for chunk in chunks] == test_data['expected_chunk_sizes']
+    assert all(isinstance(model, test_data['model']) for chunk in chunks for model in chunk)
+    assert error_lines == test_data['expected_error_lines']
+
+
+def test_iter_ndjson_from_path(tmp_path):
+    path = tmp_path / 'articles.jsonl'
+    path.write_text(to_ndjson([article_text] * 5))
+
+    chunks = list(iter_ndjson(path, ArticleTextDBSchema, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0].keywords == {'science', 'AI'}
+
+
+def test_article_text_keywords_list_in_json():
+    article = ArticleTextDBSchema.model_validate_json(json.dumps(article_text))
+    assert article.keywords == {'science', 'AI'}
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+from article_models.article_nosql_models import ArticleTextDBSchema
+from article_models.article_sql_models import ArticleMetadataDBSchema
+from article_models.schemas import ArticleMetadata
+from article_models.validation_cache import CacheStats, ValidationCache
+
+payloads = {
+    ArticleTextDBSchema: {
+        'id': '10.1000/10/123456',
+        'title': 'Example Title',
+        'authors': [{'name': 'John', 'surname': 'Doe'}],
+        'abstract': 'This is an abstract.',
+        'keywords': ['science', 'AI'],
+        'markdown_full_text': '## Introduction\nThis is a sample markdown text.'
+    },
+    ArticleMetadataDBSchema: {
+        'id': '10.1000/123456',
+        'title': 'Test Article',
+        'authors': 'John Doe, Jane Smith',
+        'journal': 'Test Journal',
+        'year': 2024,
+        'volume': 1,
+        'pages': '10-20',
+        'keywords': 'science, research'
+    },
+    ArticleMetadata: {
+        'id': '10.1000/10/123456',
+        'title': 'Example Article Title',
+        'authors': [{'name': 'John', 'surname': 'Smith'}],
+        'keywords': ['keyword1', 'keyword2'],
+        'journal': 'Example Journal',
+        'year': 2022,
+        'volume': 10,
+        'issue': 2,
+        'pages': '23-34'
+    }
+}
+
+
+@pytest.mark.parametrize('model', list(payloads), ids=[model.__name__ for model in payloads])
+def test_validation_cache_hit(model):
+    cache = ValidationCache()
+    raw = json.dumps(payloads[model]).encode()
+
+    first = cache.validate_json(model, raw)
+    second = cache.validate_json(model, raw.decode())
+
+    assert first == second == model.model_validate_json(raw)
+    assert first is not second
+    assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=1, bytes=len(raw))
+
+
+def test_validation_cache_hits_do_not_share_nested_values():
+    cache = ValidationCache()
+    raw = json.dumps(payloads[ArticleMetadata])
+    first = cache.validate_json(ArticleMetadata, raw)
+    first.keywords.add('POISON')
+    first.authors[0].name = 'X'
+    first.authors.append(first.authors[0])
+
+    assert cache.validate_json(ArticleMetadata, raw) == ArticleMetadata.model_validate_json(raw)
+
+
+def test_validation_cache_without_copy_returns_cached_instance():
+    cache = ValidationCache(copy=False)
+    raw = json.dumps(payloads[ArticleMetadata])
+    assert cache.validate_json(ArticleMetadata, raw) is cache.validate_json(ArticleMetadata, raw)
+
+
+def test_validation_cache_keys_on_model_and_schema_version():
+    cache = ValidationCache()
+    raw = json.dumps(payloads[ArticleMetadata])
+
+    cache.validate_json(ArticleMetadata, raw)
+    cache.validate_json(ArticleMetadata, raw, schema_version='v2')
+    cache.validate_json(ArticleTextDBSchema.project(['id', 'title']), raw)
+
+    assert cache.stats().misses == 3
+
+
+@pytest.mark.parametrize('limits, expected_size', [({'maxsize': 2}, 2), ({'max_bytes': 250}, 1)])
+def test_validation_cache_eviction(limits, expected_size):
+    cache = ValidationCache(**limits)
+    raws = [json.dumps({**payloads[ArticleMetadataDBSchema], 'id': f'10.1000/{i}'}) for i in range(3)]
+
+    for raw in raws:
+        cache.validate_json(ArticleMetadataDBSchema, raw)
+    cache.validate_json(ArticleMetadataDBSchema, raws[-1])
+
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits) == (expected_size, 3 - expected_size, 1)
+
+
+def test_validation_cache_does_not_store_failures():
+    cache = ValidationCache()
+    with pytest.raises(ValidationError):
+        cache.validate_json(ArticleMetadata, json.dumps({**payloads[ArticleMetadata], 'pages': '1'}))
+    assert cache.stats().size == 0